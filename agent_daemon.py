@@ -12,6 +12,7 @@ Usage:
     python3 agent_daemon.py Claude Gemini       # Multiple agents
     python3 agent_daemon.py --all               # All known agents
     python3 agent_daemon.py --list              # Show available agents
+    python3 agent_daemon.py Claude --compact-interval 600   # Compact memory every 10 min
 """
 
 import argparse
@@ -29,7 +30,7 @@ KNOWN_AGENTS = ("Claude", "Copilot", "Gemini", "Codex")
 
 
 def parse_args():
-    """Parse CLI arguments, return list of agent names."""
+    """Parse CLI arguments, return (agent names, vocab dir, compact interval)."""
     parser = argparse.ArgumentParser(
         description="HelloWorld Agent Daemon — isolated SDK runtimes"
     )
@@ -49,6 +50,11 @@ def parse_args():
         "--vocab-dir", default="vocabularies",
         help="Vocabulary directory (default: vocabularies)"
     )
+    parser.add_argument(
+        "--compact-interval", type=float, default=None, metavar="SECONDS",
+        help="Seconds between memory compactions, 0 to disable "
+             "(default: $HW_MEMORY_COMPACT_INTERVAL or 3600)"
+    )
 
     args = parser.parse_args()
 
@@ -61,7 +67,7 @@ def parse_args():
         sys.exit(0)
 
     if args.all:
-        return list(KNOWN_AGENTS), args.vocab_dir
+        return list(KNOWN_AGENTS), args.vocab_dir, args.compact_interval
 
     if not args.agents:
         parser.print_help()
@@ -74,17 +80,17 @@ def parse_args():
             name = name[0].upper() + name[1:]
         agents.append(name)
 
-    return agents, args.vocab_dir
+    return agents, args.vocab_dir, args.compact_interval
 
 
 async def main():
-    agent_names, vocab_dir = parse_args()
+    agent_names, vocab_dir, compact_interval = parse_args()
 
     # Create isolated AgentProcess per agent
     processes = []
     for name in agent_names:
         try:
-            p = AgentProcess(name, vocab_dir=vocab_dir)
+            p = AgentProcess(name, vocab_dir=vocab_dir, compact_interval=compact_interval)
             processes.append(p)
         except Exception as e:
             print(f"[{name}] Failed to initialize: {e}")
@@ -37,13 +37,20 @@ def execute_file(filepath: str):
 
     dispatcher = Dispatcher()
 
-    results = dispatcher.dispatch(statements)
-    for result in results:
-        print(result)
+    for result in dispatcher.dispatch_iter(statements, _dispatch_concurrency()):
+        print(result, flush=True)
 
     return 0
 
 
+def _dispatch_concurrency() -> int:
+    """Worker threads for independent statements (HELLOWORLD_CONCURRENCY, default 1)."""
+    try:
+        return max(1, int(os.environ.get("HELLOWORLD_CONCURRENCY", "1")))
+    except ValueError:
+        return 1
+
+
 def _get_server():
     return os.environ.get("HELLOWORLD_SERVER", DEFAULT_SERVER)
 
@@ -132,17 +139,15 @@ def main():
             return 0
 
         dispatcher = Dispatcher()
-        results = dispatcher.dispatch_source(source)
-        for r in results:
-            print(r)
+        for r in dispatcher.dispatch_stream(source, _dispatch_concurrency()):
+            print(r, flush=True)
         return 0
 
     if len(sys.argv) == 1 and not sys.stdin.isatty():
         source = sys.stdin.read()
         dispatcher = Dispatcher()
-        results = dispatcher.dispatch_source(source)
-        for r in results:
-            print(r)
+        for r in dispatcher.dispatch_stream(source, _dispatch_concurrency()):
+            print(r, flush=True)
         return 0
 
     if len(sys.argv) == 1:
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark Dispatcher bootstrap over a synthetic vocabulary directory.
+
+    python3 scripts/bench_bootstrap.py            # 10k receivers
+    python3 scripts/bench_bootstrap.py 2000       # custom size
+
+Reports a cold bootstrap (every file parsed), a new-process bootstrap
+(loaded from the compiled registry image) and a warm one (cloned from the
+in-process snapshot).
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import message_bus  # noqa: E402
+import dispatcher as dispatcher_module  # noqa: E402
+from dispatcher import Dispatcher  # noqa: E402
+
+
+def build_vocab_dir(n_receivers: int, symbols_per_receiver: int = 8) -> str:
+    """Write n_receivers .hw files (plus the canonical ones) to a temp dir."""
+    vocab = Path(tempfile.mkdtemp()) / "vocab"
+    shutil.copytree(ROOT / "vocabularies", vocab)
+    for i in range(n_receivers):
+        lines = [f"# Bench{i} : Agent", f"- Synthetic receiver number {i}."]
+        for j in range(symbols_per_receiver):
+            lines.append(f"## sym{(i + j) % 500}")
+            lines.append(f"- Meaning {j} of symbol for Bench{i}.")
+        (vocab / f"Bench{i}.hw").write_text("\n".join(lines) + "\n")
+    return str(vocab)
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:10.1f} ms")
+    return result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    vocab = build_vocab_dir(n)
+    message_bus.BASE_DIR = Path(vocab).parent
+    print(f"Bootstrap over {n} synthetic receivers ({vocab})")
+    try:
+        timed("first run (settles files)", lambda: Dispatcher(vocab_dir=vocab))
+        snapshots = dispatcher_module._bootstrap_snapshots
+        snapshots.clear()
+        dispatcher_module.vocab_image_path(vocab).unlink(missing_ok=True)
+        d = timed("cold bootstrap", lambda: Dispatcher(vocab_dir=vocab))
+        snapshots.clear()
+        timed("new process (image)", lambda: Dispatcher(vocab_dir=vocab))
+        timed("warm bootstrap (clone)", lambda: Dispatcher(vocab_dir=vocab))
+        print(f"  receivers: {len(d.registry)}")
+    finally:
+        shutil.rmtree(Path(vocab).parent, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
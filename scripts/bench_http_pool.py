@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark pooled keep-alive HTTP against urllib, offline.
+
+    python3 scripts/bench_http_pool.py           # 2000 requests
+    python3 scripts/bench_http_pool.py 10000     # custom count
+
+Starts a local HTTP/1.1 stub server that answers like the ClawNet inbox,
+then times N round trips through urllib.request.urlopen (a new connection
+each) and through http_pool (one kept-alive connection). Plain HTTP, so
+the gap shown is TCP setup alone; against HTTPS APIs the TLS handshake
+it also saves is larger still.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.request import Request, urlopen
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from http_pool import HttpPool  # noqa: E402
+
+BODY = json.dumps({"messages": [{"id": "m1", "from": "claude", "content": "hello " * 40}]}).encode()
+
+
+class InboxStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True    # headers and body go out as separate writes
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+def timed(label: str, count: int, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f} s  {count / elapsed:10,.0f} req/s  {elapsed / count * 1e6:8.0f} us/req")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), InboxStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/inbox?limit=1"
+    print(f"{n:,} GET requests to a local stub server")
+
+    def with_urllib():
+        for _ in range(n):
+            with urlopen(Request(url), timeout=10) as resp:
+                resp.read()
+
+    pool = HttpPool()
+
+    def with_pool():
+        for _ in range(n):
+            with pool.urlopen(Request(url), timeout=10) as resp:
+                resp.read()
+
+    timed("urllib.request.urlopen", n, with_urllib)
+    timed("http_pool (keep-alive)", n, with_pool)
+    print(f"  connections opened by the pool: {pool.opened}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark the Lexer against the original character-at-a-time scanner.
+
+    python3 scripts/bench_lexer.py            # 200 copies of each corpus
+    python3 scripts/bench_lexer.py 50
+
+Two corpora: every shipped .hw vocabulary, and a synthetic inbox backlog of
+message-style statements. Reports MB/s and tokens/s for both lexers and the
+speedup of the compiled master-pattern scanner.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from lexer import Lexer  # noqa: E402
+from reference_lexer import ReferenceLexer  # noqa: E402
+
+
+def vocabulary_corpus(copies: int) -> str:
+    text = "\n".join(p.read_text() for p in sorted((ROOT / "vocabularies").glob("*.hw")))
+    return "\n".join([text] * copies)
+
+
+def inbox_corpus(copies: int) -> str:
+    messages = [
+        "Claude send: #parse to: Codex 'please review the dispatcher'",
+        "@gemini #collision \"queued by the daemon\" Copilot ask: #dispatch about: #sunyata",
+        "HelloWorld resolve: #fire with: [#heat, #light] → 'synthesized'",
+        "Timer wait: 7.days then: Agent super.#observe",
+        "<!-- routed --> Scribe record: #meeting at: 12.30 note: 'done'",
+    ]
+    return "\n".join(messages * (copies * 20))
+
+
+def bench(label: str, lexer_cls, source: str, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens = lexer_cls(source).tokenize()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    mb = len(source.encode()) / 1e6
+    print(f"  {label:<12} {best * 1000:9.1f} ms  {mb / best:7.2f} MB/s  {len(tokens) / best:12,.0f} tok/s")
+    return best
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for name, source in (("vocabularies", vocabulary_corpus(copies)),
+                         ("inbox", inbox_corpus(copies))):
+        assert Lexer(source).tokenize() == ReferenceLexer(source).tokenize()
+        print(f"{name}: {len(source.encode()) / 1e6:.1f} MB")
+        old = bench("reference", ReferenceLexer, source)
+        new = bench("lexer", Lexer, source)
+        print(f"  speedup      {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
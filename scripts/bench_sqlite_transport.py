@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark SQLiteTransport queue and drain throughput.
+
+    python3 scripts/bench_sqlite_transport.py            # 1M queued messages
+    python3 scripts/bench_sqlite_transport.py 200000     # custom size
+
+Queues N messages for one inbox (spread over a few others so the index
+matters), then drains them with receive_batch. Single-message receive is
+timed on a smaller queue, alongside the pre-index query for comparison.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from message_bus import SQLiteTransport  # noqa: E402
+
+CHUNK = 10_000
+BATCH = 500
+SAMPLE = 20_000
+SMALL_QUEUE = 100_000
+
+
+def queue(t: SQLiteTransport, n: int, receiver: str = "claude"):
+    others = ("gemini", "codex", "copilot")
+    for start in range(0, n, CHUNK):
+        rows = []
+        for i in range(start, min(n, start + CHUNK)):
+            rows.append(("Bench", receiver, f"message {i}"))
+            rows.append(("Bench", others[i % 3], f"noise {i}"))
+        t.send_many(rows)
+
+
+def legacy_receive(t: SQLiteTransport, receiver: str):
+    """The receive this transport shipped with: unindexed select, then update."""
+    conn = t._conn
+    conn.execute("DROP INDEX IF EXISTS idx_messages_inbox")
+    row = conn.execute(
+        "SELECT id, sender, content, ts FROM messages "
+        "WHERE receiver = ? AND read = 0 ORDER BY ts LIMIT 1",
+        (receiver,),
+    ).fetchone()
+    if row:
+        conn.execute("UPDATE messages SET read = 1 WHERE id = ?", (row[0],))
+        conn.commit()
+    return row
+
+
+def timed(label: str, count: int, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34} {elapsed:8.2f} s  {count / elapsed:12,.0f} msg/s")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tmp = Path(tempfile.mkdtemp())
+    print(f"SQLiteTransport with {n:,} queued messages for one inbox ({tmp})")
+
+    t = SQLiteTransport(db_path=str(tmp / "bench.db"))
+    timed(f"send_many ({2 * n:,} rows)", 2 * n, lambda: queue(t, n))
+
+    def drain_batches():
+        while t.receive_batch("claude", BATCH):
+            pass
+    timed(f"receive_batch({BATCH}) drain", n, drain_batches)
+
+    # Single receives are sampled from a smaller queue; the legacy query scans it every time
+    small = min(n, SMALL_QUEUE)
+    sample = min(small, SAMPLE)
+    print(f"Single-message receive, {small:,} queued")
+    single = SQLiteTransport(db_path=str(tmp / "single.db"))
+    queue(single, small)
+    timed(f"receive() x {sample:,}", sample, lambda: [single.receive("claude") for _ in range(sample)])
+
+    legacy_sample = max(1, sample // 100)
+    legacy = SQLiteTransport(db_path=str(tmp / "legacy.db"), compact_every=0)
+    queue(legacy, small)
+    timed(f"legacy receive() x {legacy_sample:,}", legacy_sample,
+          lambda: [legacy_receive(legacy, "claude") for _ in range(legacy_sample)])
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,10 @@ Multiple AgentProcess instances can run concurrently via asyncio.gather().
 
 Human-in-the-loop: messages containing #propose, #review, or #question
 are routed to a human escalation channel (Web UI + native CLI pickup).
+
+Memory compaction: every compact_interval seconds (HW_MEMORY_COMPACT_INTERVAL,
+an hour by default, 0 to turn off) old per-interaction memories are rolled
+into digests and deleted; HW_MEMORY_SUMMARIZE=1 has the LLM write the digests.
 """
 
 import asyncio
@@ -13,7 +17,7 @@ import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 
 # Ensure src is on the path
 _src = str(Path(__file__).resolve().parent)
@@ -22,6 +26,7 @@ if _src not in sys.path:
 
 from dispatcher import Dispatcher
 from memory_bus import MemoryBus
+from memory_compaction import CompactionReport, MemoryCompactor
 from hw_tools import HwTools
 from hw_reader import read_hw_file
 import message_bus
@@ -39,6 +44,12 @@ SDK_AGENT_MAP = {
 # Human protocol symbols that trigger escalation
 HUMAN_SYMBOLS = frozenset({"#propose", "#review", "#question"})
 
+# Longest a blocking receive waits before the loop re-checks `running`
+RECEIVE_TIMEOUT = 1.0
+
+# Seconds between memory compactions, unless HW_MEMORY_COMPACT_INTERVAL says otherwise
+COMPACT_INTERVAL = 3600.0
+
 
 class AgentProcess:
     """Isolated runtime for a single HelloWorld agent.
@@ -51,7 +62,8 @@ class AgentProcess:
     - Human escalation via message bus
     """
 
-    def __init__(self, agent_name: str, vocab_dir: str = "vocabularies"):
+    def __init__(self, agent_name: str, vocab_dir: str = "vocabularies",
+                 compact_interval: Optional[float] = None):
         self.name = agent_name
         self.vocab_dir = vocab_dir
         self.runtime_dir = Path(f"runtimes/{agent_name.lower()}")
@@ -71,6 +83,10 @@ class AgentProcess:
         self.started_at: Optional[datetime] = None
         self.pending_human: List[dict] = []
         self.running = False
+        if compact_interval is None:
+            compact_interval = float(os.environ.get("HW_MEMORY_COMPACT_INTERVAL", COMPACT_INTERVAL))
+        self.compact_interval = compact_interval
+        self.last_compaction: Optional[CompactionReport] = None
 
     def _detect_adapter(self) -> Any:
         """Auto-detect SDK adapter from the SDK_AGENT_MAP registry."""
@@ -90,13 +106,7 @@ class AgentProcess:
         """Load this agent's vocabulary from dispatcher (inheritance-aware)."""
         if self.name not in self.dispatcher.registry:
             return []
-        receiver = self.dispatcher.registry[self.name]
-        all_symbols: Set[str] = set(receiver.local_vocabulary)
-        ancestor = receiver.parent
-        while ancestor:
-            all_symbols.update(ancestor.local_vocabulary)
-            ancestor = ancestor.parent
-        return sorted(all_symbols)
+        return list(self.dispatcher.registry[self.name].effective_vocabulary())
 
     def _init_sdk_agent(self):
         """Create the SDK agent with HelloWorld tools + system prompt."""
@@ -251,7 +261,7 @@ class AgentProcess:
                 prompt = f"Context from memory:\n{context}\n\nMessage: {msg.content}"
 
             model = ClaudeModel()
-            return model.call(prompt, system=system)
+            return await model.acall(prompt, system=system)
         except ImportError:
             return f"[{self.name}] Received: {msg.content[:120]}"
 
@@ -287,17 +297,12 @@ class AgentProcess:
         pid_file.parent.mkdir(parents=True, exist_ok=True)
         pid_file.write_text(str(os.getpid()))
 
+        human = asyncio.create_task(self._watch_human_inbox())
+        compaction = asyncio.create_task(self._compact_memory()) if self.compact_interval > 0 else None
         try:
             while self.running:
-                # Check for human responses
-                human_msg = message_bus.receive(f"{self.name}-human")
-                if human_msg:
-                    print(f"[{self.name}] Human response from {human_msg.sender}",
-                          flush=True)
-                    await self._handle_human_response(human_msg)
-
-                # Check agent inbox
-                msg = message_bus.receive(self.name)
+                # Wake as soon as a message lands in the agent inbox
+                msg = await message_bus.areceive(self.name, timeout=RECEIVE_TIMEOUT)
                 if msg and msg.sender != self.name:
                     print(f"[{self.name}] Received from {msg.sender}: {msg.content[:120]}",
                           flush=True)
@@ -306,15 +311,58 @@ class AgentProcess:
                         print(f"[{self.name}] Replying to {msg.sender}: {response[:120]}",
                               flush=True)
                         message_bus.send(self.name, msg.sender, response)
-
-                await asyncio.sleep(0.5)
         except asyncio.CancelledError:
             pass
         finally:
+            human.cancel()
+            if compaction is not None:
+                compaction.cancel()
             pid_file.unlink(missing_ok=True)
             self.running = False
             print(f"[{self.name}] Stopped.", flush=True)
 
+    async def _watch_human_inbox(self):
+        """Handle human responses alongside the agent inbox, for as long as run() does."""
+        while self.running:
+            human_msg = await message_bus.areceive(f"{self.name}-human", timeout=RECEIVE_TIMEOUT)
+            if human_msg:
+                print(f"[{self.name}] Human response from {human_msg.sender}",
+                      flush=True)
+                await self._handle_human_response(human_msg)
+
+    def _compactor(self) -> MemoryCompactor:
+        """A compactor for this agent's memory, with LLM digests if HW_MEMORY_SUMMARIZE=1."""
+        llm = None
+        if os.environ.get("HW_MEMORY_SUMMARIZE") == "1":
+            try:
+                from claude_llm import ClaudeModel, has_anthropic_key
+                from llm_cache import cached
+                if has_anthropic_key():
+                    llm = cached(ClaudeModel())
+            except ImportError:
+                pass
+        return MemoryCompactor(self.memory, llm=llm)
+
+    async def compact_memory(self) -> CompactionReport:
+        """Compact memory once, off the event loop."""
+        report = await asyncio.to_thread(self._compactor().run)
+        self.last_compaction = report
+        return report
+
+    async def _compact_memory(self):
+        """Compact memory every compact_interval seconds, for as long as run() does."""
+        while self.running:
+            await asyncio.sleep(self.compact_interval)
+            if not self.running:
+                break
+            try:
+                report = await self.compact_memory()
+            except Exception as e:
+                print(f"[{self.name}] Memory compaction failed: {e}", flush=True)
+                continue
+            if report.entries_removed:
+                print(f"[{self.name}] Memory compacted: {report.summary()}", flush=True)
+
     def stop(self):
         """Signal the run loop to stop."""
         self.running = False
@@ -332,6 +380,7 @@ class AgentProcess:
             "sdk_ready": self.sdk_agent is not None,
             "pending_human": len(self.pending_human),
             "pending_human_items": list(self.pending_human),
+            "last_compaction": self.last_compaction.to_dict() if self.last_compaction else None,
             "running": self.running,
             "uptime": str(datetime.now(timezone.utc) - self.started_at)
                      if self.started_at else None,
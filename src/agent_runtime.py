@@ -90,14 +90,7 @@ class AgentRuntime:
             receiver = dispatcher.registry[name]
 
             # Full vocabulary: local + inherited via parent chain
-            all_symbols = sorted(receiver.local_vocabulary)
-            ancestor = receiver.parent
-            while ancestor:
-                for sym in ancestor.local_vocabulary:
-                    if sym not in all_symbols:
-                        all_symbols.append(sym)
-                ancestor = ancestor.parent
-            all_symbols.sort()
+            all_symbols = list(receiver.effective_vocabulary())
 
             # Identity and descriptions from hw_reader (richer text)
             hw_receiver = self._receivers.get(name)
@@ -351,7 +344,7 @@ class AgentRuntime:
             return f"[{receiver_name}] (no API key — mock mode) {prompt[:80]}"
 
         model = ClaudeModel()
-        return model.call(prompt, system=agent.system_prompt)
+        return await model.acall(prompt, system=agent.system_prompt)
 
     async def query(self, source: str) -> str:
         """Send HelloWorld source to the SDK orchestrator for parsing and dispatch.
@@ -387,7 +380,7 @@ class AgentRuntime:
 
         dispatcher = Dispatcher(vocab_dir=self.vocab_dir)
         nodes = Parser.from_source(source).parse()
-        structural_results = dispatcher.dispatch(nodes)
+        structural_results = await dispatcher.adispatch(nodes)
 
         results = []
         for result in structural_results:
@@ -47,13 +47,10 @@ class ClaudeModel(BaseLlm):
             self.api_key = api_key
         self.system_prompt = system_prompt
         self.arguments = kwargs
+        self._async_client = None
 
-    def _call_api(self, prompt: str, system: Optional[str] = None) -> str:
-        """Make a real API call to Claude via the anthropic SDK."""
-        import anthropic
-
-        client = anthropic.Anthropic(api_key=self.api_key)
-
+    def _request(self, prompt: str, system: Optional[str] = None) -> dict:
+        """Build the Messages API request shared by the sync and async paths."""
         kwargs = {
             "model": self.model_name,
             "max_tokens": self.max_tokens,
@@ -65,14 +62,36 @@ class ClaudeModel(BaseLlm):
         sys_prompt = system or self.system_prompt
         if sys_prompt:
             kwargs["system"] = sys_prompt
+        return kwargs
 
-        response = client.messages.create(**kwargs)
-
+    @staticmethod
+    def _response_text(response) -> str:
         # Extract text from the response
         if response.content:
             return response.content[0].text.strip()
         return "[Claude] Empty response"
 
+    def _call_api(self, prompt: str, system: Optional[str] = None) -> str:
+        """Make a real API call to Claude via the anthropic SDK."""
+        import anthropic
+
+        client = anthropic.Anthropic(api_key=self.api_key)
+        response = client.messages.create(**self._request(prompt, system))
+        return self._response_text(response)
+
+    async def _acall_api(self, prompt: str, system: Optional[str] = None) -> str:
+        """Make a real API call through the SDK's async client.
+
+        The client is created once per model so concurrent calls share
+        its connection pool instead of opening one each.
+        """
+        if self._async_client is None:
+            import anthropic
+            self._async_client = anthropic.AsyncAnthropic(api_key=self.api_key)
+
+        response = await self._async_client.messages.create(**self._request(prompt, system))
+        return self._response_text(response)
+
     def call(self, prompt: str, parser_func: Optional[Callable] = None, system: Optional[str] = None) -> str:
         """Call Claude. Uses real API if key is set, mock otherwise."""
         if self.api_key:
@@ -84,6 +103,17 @@ class ClaudeModel(BaseLlm):
             return parser_func(response)
         return response
 
+    async def acall(self, prompt: str, parser_func: Optional[Callable] = None, system: Optional[str] = None) -> str:
+        """Awaitable call. Many can be in flight on one event loop."""
+        if self.api_key:
+            response = await self._acall_api(prompt, system=system)
+        else:
+            response = self._mock_call(prompt)
+
+        if parser_func:
+            return parser_func(response)
+        return response
+
     def _mock_call(self, prompt: str) -> str:
         """Mock response for testing without API key."""
         if "handle collision" in prompt or "collide on" in prompt:
@@ -10,14 +10,16 @@ import os
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
-from urllib.request import Request, urlopen
+from urllib.request import Request
 from urllib.error import URLError
 
+from http_pool import urlopen
 from message_bus import Message
 from social_transport import SocialTransport
 
 API_BASE = "https://api.clwnt.com"
 USER_AGENT = "curl/8.7.1"
+REQUEST_TIMEOUT = 30.0
 
 
 class ClawNetTransport(SocialTransport):
@@ -45,7 +47,11 @@ class ClawNetTransport(SocialTransport):
         path: str,
         body: Optional[dict] = None,
     ) -> dict:
-        """Issue an authenticated request and return parsed JSON."""
+        """Issue an authenticated request and return parsed JSON.
+
+        Goes through the shared keep-alive pool (http_pool), so the inbox
+        read and its ack in receive() share one connection.
+        """
         url = f"{API_BASE}{path}"
         data = json.dumps(body).encode() if body else None
         req = Request(url, data=data, method=method)
@@ -53,7 +59,7 @@ class ClawNetTransport(SocialTransport):
         req.add_header("User-Agent", USER_AGENT)
         if body is not None:
             req.add_header("Content-Type", "application/json")
-        resp = urlopen(req)
+        resp = urlopen(req, timeout=REQUEST_TIMEOUT)
         return json.loads(resp.read().decode())
 
     # ------------------------------------------------------------------
@@ -77,7 +83,9 @@ class ClawNetTransport(SocialTransport):
         })
         return msg_id
 
-    def receive(self, receiver: str) -> Optional[Message]:
+    def receive(self, receiver: str, timeout: Optional[float] = None) -> Optional[Message]:
+        if timeout:
+            return self._wait(receiver, timeout)
         data = self._request("GET", "/inbox?limit=1")
 
         messages = data.get("messages", [])
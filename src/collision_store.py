@@ -0,0 +1,511 @@
+"""HelloWorld collision events — an indexed SQLite store beside collisions.log.
+
+Every collision, unknown-symbol and resolution event is one row, indexed
+by receiver, symbol, status and time, so the REPL, the web dashboard and
+the tools read only the events they ask for instead of the whole history.
+
+collisions.log still gets the same event as a line of text: agents and
+humans read it as part of the protocol (docs/EXECUTION_PROTOCOL.md). The
+store keeps its own copy in collisions.db next to it, and backfills from
+the log the first time it is created.
+
+    store = collision_store.for_log("collisions.log")
+    store.record("collision", "Gemini", "#fire", other="Claude", line=...)
+    store.query(symbol="#fire", status="unresolved")
+    store.follow(after_id=last_seen, timeout=30)     # tail -f
+
+Collisions deferred to HelloWorld (no LLM to synthesize them yet) wait
+as message files in its inbox. PendingCollisions indexes those files by
+symbol so resolving one is a lookup, not a read of every inbox message.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+TimeBound = Union[str, datetime, None]
+
+
+@dataclass
+class CollisionEvent:
+    """One logged event. `line` is the text written to collisions.log."""
+    id: int
+    ts: str
+    kind: str                       # collision, unknown, or a tool-supplied type
+    receiver: str
+    symbol: str
+    status: Optional[str] = None    # resolved / unresolved, for collision outcomes
+    other: Optional[str] = None     # the second receiver of a collision
+    collision_id: Optional[str] = None
+    context: Optional[str] = None
+    line: str = ""
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Lines the runtime has written to collisions.log, for backfilling a new store.
+# A pattern without a fixed kind takes it from the line (tool-supplied types).
+_LEGACY_LINES: List[Tuple[re.Pattern, Optional[str]]] = [
+    (re.compile(r"\[(?P<ts>[^\]]+)\] (?P<status>RESOLVED|UNRESOLVED) COLLISION \[(?P<collision_id>[^\]]+)\]: "
+                r"(?P<other>\S+) x (?P<receiver>\S+) on (?P<symbol>\S+)$"), "collision"),
+    (re.compile(r"\[(?P<ts>[^\]]+)\] COLLISION: (?P<receiver>\S+) reached for (?P<symbol>\S+)"
+                r"(?: in context of (?P<context>.*))?$"), "collision"),
+    (re.compile(r"\[(?P<ts>[^\]]+)\] UNKNOWN: (?P<receiver>\S+) encountered (?P<symbol>\S+)$"), "unknown"),
+    (re.compile(r"\[(?P<ts>[^\]]+)\] (?P<kind>[A-Z_]+): (?P<receiver>\S+) (?P<symbol>\S+)"
+                r"(?: — (?P<context>.*))?$"), None),
+]
+
+
+def _parse_legacy_line(line: str) -> Optional[dict]:
+    for pattern, kind in _LEGACY_LINES:
+        m = pattern.match(line)
+        if m:
+            fields = {k: v for k, v in m.groupdict().items() if v is not None}
+            fields["kind"] = kind or fields.pop("kind").lower()
+            if "status" in fields:
+                fields["status"] = fields["status"].lower()
+            return fields
+    return None
+
+
+def _bound(value: TimeBound) -> Optional[str]:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class CollisionStore:
+    """Collision events in SQLite (WAL), mirrored as lines in a text log.
+
+    Rows are only ever deleted oldest-first (see rotate()), so ids stay
+    contiguous and the unfiltered count is read from the id range.
+    """
+
+    _COLUMNS = "id, ts, kind, receiver, symbol, status, other, collision_id, context, line"
+    FOLLOW_POLL = 0.25   # seconds between checks for events from other processes
+
+    def __init__(self, log_file: str = "collisions.log", db_path: Optional[str] = None,
+                 max_events: int = 100_000, max_log_bytes: int = 10 * 1024 * 1024):
+        self.log_file = log_file
+        self.db_path = db_path or str(Path(log_file).with_suffix(".db"))
+        self.max_events = max_events
+        self.max_log_bytes = max_log_bytes
+        self._lock = threading.Lock()
+        self._recorded = threading.Condition(self._lock)
+        self._since_rotate = 0
+        parent = os.path.dirname(os.path.abspath(self.db_path))
+        os.makedirs(parent, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        new = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events'"
+        ).fetchone() is None
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS events (
+                id           INTEGER PRIMARY KEY,
+                ts           TEXT NOT NULL,
+                kind         TEXT NOT NULL,
+                receiver     TEXT NOT NULL,
+                symbol       TEXT NOT NULL,
+                status       TEXT,
+                other        TEXT,
+                collision_id TEXT,
+                context      TEXT,
+                line         TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_events_receiver ON events (receiver, id);
+            CREATE INDEX IF NOT EXISTS idx_events_other ON events (other, id);
+            CREATE INDEX IF NOT EXISTS idx_events_symbol ON events (symbol, id);
+            CREATE INDEX IF NOT EXISTS idx_events_status ON events (status, id);
+            CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+        """)
+        self._conn.commit()
+        if new:
+            self._backfill()
+
+    # --- Writing ---
+
+    def record(self, kind: str, receiver: str, symbol: str, *, line: str,
+               status: Optional[str] = None, other: Optional[str] = None,
+               collision_id: Optional[str] = None, context: Optional[str] = None,
+               ts: Optional[str] = None) -> int:
+        """Store one event and append its line to the text log. Returns the event id."""
+        ts = ts or datetime.now().isoformat()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO events (ts, kind, receiver, symbol, status, other, collision_id, context, line) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (ts, kind, receiver, symbol, status, other, collision_id, context, line),
+            )
+            self._conn.commit()
+            self._append_line(line)
+            self._since_rotate += 1
+            if self.max_events and self._since_rotate >= max(1, self.max_events // 10):
+                self._since_rotate = 0
+                self._prune(self.max_events)
+            self._recorded.notify_all()
+            return cursor.lastrowid
+
+    def _append_line(self, line: str):
+        # Caller holds self._lock
+        try:
+            if self.max_log_bytes and os.path.getsize(self.log_file) >= self.max_log_bytes:
+                os.replace(self.log_file, f"{self.log_file}.1")
+        except OSError:
+            pass
+        with open(self.log_file, "a") as f:
+            f.write(line + "\n")
+
+    def rotate(self, keep: Optional[int] = None) -> int:
+        """Delete all but the newest `keep` events (default max_events). Returns rows removed."""
+        with self._lock:
+            return self._prune(self.max_events if keep is None else keep)
+
+    def _prune(self, keep: int) -> int:
+        newest = self._conn.execute("SELECT max(id) FROM events").fetchone()[0]
+        if newest is None:
+            return 0
+        cursor = self._conn.execute("DELETE FROM events WHERE id <= ?", (newest - keep,))
+        self._conn.commit()
+        return cursor.rowcount
+
+    def _backfill(self):
+        """Import the events already written to the text log."""
+        try:
+            with open(self.log_file) as f:
+                lines = [line.rstrip("\n") for line in f if line.strip()]
+        except OSError:
+            return
+        rows = []
+        for line in lines:
+            fields = _parse_legacy_line(line)
+            if fields is None:
+                continue
+            rows.append((
+                fields["ts"], fields["kind"], fields["receiver"], fields["symbol"],
+                fields.get("status"), fields.get("other"), fields.get("collision_id"),
+                fields.get("context"), line,
+            ))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO events (ts, kind, receiver, symbol, status, other, collision_id, context, line) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    # --- Reading ---
+
+    def _where(self, receiver: Optional[str], symbol: Optional[str], status: Optional[str],
+               kind: Optional[str], since: TimeBound, until: TimeBound,
+               after_id: Optional[int]) -> Tuple[str, list]:
+        clauses, params = [], []
+        if receiver is not None:
+            # Either party of a collision
+            clauses.append("id IN (SELECT id FROM events WHERE receiver = ? "
+                           "UNION SELECT id FROM events WHERE other = ?)")
+            params += [receiver, receiver]
+        for column, value in (("symbol", symbol), ("status", status), ("kind", kind)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(_bound(since))
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(_bound(until))
+        if after_id is not None:
+            clauses.append("id > ?")
+            params.append(after_id)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, receiver: Optional[str] = None, symbol: Optional[str] = None,
+              status: Optional[str] = None, kind: Optional[str] = None,
+              since: TimeBound = None, until: TimeBound = None,
+              after_id: Optional[int] = None, limit: int = 50) -> List[CollisionEvent]:
+        """The newest `limit` matching events, oldest first.
+
+        receiver matches either party of a collision; since/until bound
+        the timestamp (inclusive/exclusive); after_id pages forward.
+        """
+        where, params = self._where(receiver, symbol, status, kind, since, until, after_id)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM events{where} ORDER BY id DESC LIMIT ?",
+                params + [limit],
+            ).fetchall()
+        return [CollisionEvent(*row) for row in reversed(rows)]
+
+    def count(self, receiver: Optional[str] = None, symbol: Optional[str] = None,
+              status: Optional[str] = None, kind: Optional[str] = None,
+              since: TimeBound = None, until: TimeBound = None) -> int:
+        """Number of matching events."""
+        with self._lock:
+            if (receiver, symbol, status, kind, since, until) == (None,) * 6:
+                low, high = self._conn.execute("SELECT min(id), max(id) FROM events").fetchone()
+                return 0 if high is None else high - low + 1
+            where, params = self._where(receiver, symbol, status, kind, since, until, None)
+            return self._conn.execute(f"SELECT count(*) FROM events{where}", params).fetchone()[0]
+
+    def tail(self, n: int = 10) -> List[CollisionEvent]:
+        """The last n events, oldest first."""
+        return self.query(limit=n)
+
+    def last_id(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT coalesce(max(id), 0) FROM events").fetchone()[0]
+
+    def follow(self, after_id: int = 0, timeout: Optional[float] = None,
+               limit: int = 500) -> List[CollisionEvent]:
+        """Events newer than after_id, waiting up to timeout seconds for the first one.
+
+        Events recorded through this store wake the wait at once; those
+        from other processes are noticed within FOLLOW_POLL.
+        """
+        deadline = time.monotonic() + (timeout or 0)
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {self._COLUMNS} FROM events WHERE id > ? ORDER BY id LIMIT ?",
+                    (after_id, limit),
+                ).fetchall()
+                remaining = deadline - time.monotonic()
+                if rows or remaining <= 0:
+                    return [CollisionEvent(*row) for row in rows]
+                self._recorded.wait(min(remaining, self.FOLLOW_POLL))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class PendingCollision:
+    """A deferred collision and the HelloWorld inbox file that carries it."""
+    collision_id: str
+    symbol: str
+    sender: str
+    target: str
+    file: str                       # message file name within the inbox
+    created: str
+
+
+_PENDING_PARTIES = re.compile(r"@(\w+) send: (#\w+) to: @(\w+)")
+_PENDING_HEADER = re.compile(r"^# Collision: (\w+)", re.MULTILINE)
+_PENDING_SYMBOL = re.compile(r"COLLISION:[^#\n]*(#\w+)")
+
+
+def _parse_pending(text: str) -> Optional[Tuple[str, str, str, str]]:
+    """(collision_id, symbol, sender, target) of a collision message, else None."""
+    header = _PENDING_HEADER.search(text)
+    if header is None:
+        return None
+    parties = _PENDING_PARTIES.search(text)
+    if parties:
+        sender, symbol, target = parties.groups()
+    else:
+        symbol_match = _PENDING_SYMBOL.search(text)
+        if symbol_match is None:
+            return None
+        sender, symbol, target = "", symbol_match.group(1), ""
+    return header.group(1), symbol, sender, target
+
+
+class PendingCollisions:
+    """Registry of the collision messages waiting in one HelloWorld inbox.
+
+    The table lists every message file of the inbox it has seen; collision
+    files also carry their symbol, id and parties. add() and remove() write
+    the row and the file in one transaction. Files other writers drop into
+    the inbox are picked up by sync(), which reads only names it has not
+    seen before.
+    """
+
+    _COLUMNS = "collision_id, symbol, sender, target, file, created"
+
+    def __init__(self, inbox: Union[str, Path], db_path: Optional[str] = None):
+        self.inbox = Path(inbox)
+        self.db_path = db_path or str(self.inbox.parent / "pending_collisions.db")
+        self._lock = threading.Lock()
+        os.makedirs(self.inbox, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS inbox_files (
+                file         TEXT PRIMARY KEY,
+                collision_id TEXT,
+                symbol       TEXT,
+                sender       TEXT,
+                target       TEXT,
+                created      TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_pending_symbol
+                ON inbox_files (symbol, created) WHERE symbol IS NOT NULL;
+            CREATE INDEX IF NOT EXISTS idx_pending_collision
+                ON inbox_files (collision_id) WHERE collision_id IS NOT NULL;
+        """)
+        self._conn.commit()
+
+    def add(self, collision_id: str, symbol: str, sender: str, target: str,
+            file: str, text: str) -> Path:
+        """Register a collision and write its message file to the inbox.
+
+        The file is renamed into place inside the transaction, so a failed
+        write leaves no row behind; a file whose row failed to commit is
+        registered by the next sync().
+        """
+        path = self.inbox / file
+        tmp = self.inbox / f".{file}.tmp"
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO inbox_files (file, collision_id, symbol, sender, target, created) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (file, collision_id, symbol, sender, target, datetime.now().isoformat()),
+            )
+            tmp.write_text(text)
+            os.replace(tmp, path)
+        return path
+
+    def lookup(self, symbol: str) -> Optional[PendingCollision]:
+        """The oldest pending collision on symbol whose file is still in the inbox."""
+        with self._lock:
+            while True:
+                row = self._conn.execute(
+                    f"SELECT {self._COLUMNS} FROM inbox_files WHERE symbol = ? "
+                    f"ORDER BY created LIMIT 1",
+                    (symbol,),
+                ).fetchone()
+                if row is None:
+                    return None
+                pending = PendingCollision(*row)
+                if (self.inbox / pending.file).exists():
+                    return pending
+                # Consumed by another reader of the inbox
+                with self._conn:
+                    self._conn.execute("DELETE FROM inbox_files WHERE file = ?", (pending.file,))
+
+    def remove(self, collision_id: str) -> Optional[PendingCollision]:
+        """Unregister a collision and unlink its message file, in one transaction."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM inbox_files WHERE collision_id = ?",
+                (collision_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            pending = PendingCollision(*row)
+            self._conn.execute("DELETE FROM inbox_files WHERE file = ?", (pending.file,))
+            try:
+                (self.inbox / pending.file).unlink()
+            except FileNotFoundError:
+                pass
+        return pending
+
+    def remove_many(self, collision_ids: List[str]) -> int:
+        """remove() for several collisions in one transaction. Returns how many were registered."""
+        with self._lock, self._conn:
+            files = []
+            for collision_id in collision_ids:
+                files += [row[0] for row in self._conn.execute(
+                    "SELECT file FROM inbox_files WHERE collision_id = ?", (collision_id,))]
+            self._conn.executemany("DELETE FROM inbox_files WHERE file = ?", [(f,) for f in files])
+            for file in files:
+                try:
+                    (self.inbox / file).unlink()
+                except FileNotFoundError:
+                    pass
+        return len(files)
+
+    def pending(self) -> List[PendingCollision]:
+        """Every registered collision, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM inbox_files WHERE symbol IS NOT NULL ORDER BY created"
+            ).fetchall()
+        return [PendingCollision(*row) for row in rows]
+
+    def symbols(self) -> Set[str]:
+        """Symbols with at least one registered collision."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT symbol FROM inbox_files WHERE symbol IS NOT NULL"
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def sync(self) -> Set[str]:
+        """Reconcile the table with the inbox listing; returns the pending symbols.
+
+        Rows whose files are gone are dropped; files not yet registered are
+        read once and recorded, collision or not.
+        """
+        try:
+            names = {entry.name for entry in os.scandir(self.inbox) if _is_inbox_message(entry.name)}
+        except FileNotFoundError:
+            names = set()
+        with self._lock, self._conn:
+            known = {row[0] for row in self._conn.execute("SELECT file FROM inbox_files")}
+            gone = known - names
+            if gone:
+                self._conn.executemany("DELETE FROM inbox_files WHERE file = ?", [(n,) for n in gone])
+            rows = []
+            for name in sorted(names - known):
+                try:
+                    text = (self.inbox / name).read_text()
+                except OSError:
+                    continue
+                fields = _parse_pending(text) or (None, None, None, None)
+                rows.append((name, *fields, datetime.now().isoformat()))
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO inbox_files (file, collision_id, symbol, sender, target, created) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        return self.symbols()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _is_inbox_message(name: str) -> bool:
+    return name.startswith("msg-") and name.endswith(".hw")
+
+
+_stores: Dict[str, CollisionStore] = {}
+_stores_lock = threading.Lock()
+
+
+def for_log(log_file: str) -> CollisionStore:
+    """The shared store for a collisions log path, opened on first use."""
+    key = os.path.abspath(log_file)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = _stores[key] = CollisionStore(log_file)
+    return store
+
+
+_registries: Dict[str, PendingCollisions] = {}
+
+
+def pending_for(inbox: Union[str, Path]) -> PendingCollisions:
+    """The shared pending-collision registry for a HelloWorld inbox directory."""
+    key = os.path.abspath(inbox)
+    registry = _registries.get(key)
+    if registry is None:
+        with _stores_lock:
+            registry = _registries.get(key)
+            if registry is None:
+                registry = _registries[key] = PendingCollisions(inbox)
+    return registry
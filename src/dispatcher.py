@@ -3,10 +3,24 @@ Enables Hybrid Dispatch: Structural facts via Python, Interpretive voice via LLM
 Enables Prototypal Inheritance: HelloWorld is the parent of all receivers.
 """
 
+import asyncio
+import hashlib
+import heapq
+import inspect
+import itertools
+import os
+import pickle
+import threading
+import time
 import uuid
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
 
@@ -25,7 +39,8 @@ from ast_nodes import (
     VocabularyQueryNode,
 )
 from parser import Parser
-from vocabulary import VocabularyManager
+from vocabulary import HwDocument, VocabularyManager
+import collision_store
 import message_bus
 from memory_bus import MemoryBus, QMDNotFoundError
 from message_handlers import MessageHandlerRegistry
@@ -43,6 +58,37 @@ class LookupOutcome(Enum):
     UNKNOWN = "unknown"
 
 
+class _LazyContext(Mapping):
+    """Read-only mapping whose payload is built on first access.
+
+    Lookups run far more often than their context is read, so the
+    sorted vocabulary snapshot is deferred until someone asks for it.
+    """
+    __slots__ = ("_build", "_data")
+
+    def __init__(self, build: Callable[[], Dict[str, Any]]):
+        self._build = build
+        self._data: Optional[Dict[str, Any]] = None
+
+    def _resolve(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = self._build()
+            self._build = None
+        return self._data
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __repr__(self):
+        return repr(self._resolve())
+
+
 @dataclass
 class LookupResult:
     """Structured result of symbol lookup.
@@ -57,7 +103,7 @@ class LookupResult:
     outcome: LookupOutcome
     symbol: str
     receiver_name: str
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[Mapping[str, Any]] = None
 
     def is_native(self) -> bool:
         return self.outcome == LookupOutcome.NATIVE
@@ -69,26 +115,165 @@ class LookupResult:
         return self.outcome == LookupOutcome.UNKNOWN
 
 
+class ResolutionCache:
+    """Memoized symbol resolution for the receivers of one Dispatcher.
+
+    Maps (receiver, symbol) to the lookup outcome and the nearest ancestor
+    in the parent chain that holds the symbol (None when no ancestor does).
+    For a native symbol that ancestor is the super definition.
+
+    Every cached walk records the receivers it visited. Invalidation is
+    precise: adding a symbol to a receiver drops only the entries for that
+    symbol whose walk passed through it; re-parenting a receiver drops
+    every entry whose walk passed through it.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], Tuple[LookupOutcome, Optional['Receiver']]] = {}
+        # visited receiver name → symbol → names of receivers whose walk visited it
+        self._through: Dict[str, Dict[str, Set[str]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, receiver: 'Receiver', symbol: str) -> Tuple[LookupOutcome, Optional['Receiver']]:
+        key = (receiver.name, symbol)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+
+        visited = [receiver.name]
+        found = None
+        ancestor = receiver.parent
+        while ancestor:
+            visited.append(ancestor.name)
+            if symbol in ancestor.local_vocabulary:
+                found = ancestor
+                break
+            ancestor = ancestor.parent
+
+        if symbol in receiver.local_vocabulary:
+            outcome = LookupOutcome.NATIVE
+        elif found is not None:
+            outcome = LookupOutcome.INHERITED
+        else:
+            outcome = LookupOutcome.UNKNOWN
+
+        entry = (outcome, found)
+        self._entries[key] = entry
+        for name in visited:
+            self._through.setdefault(name, {}).setdefault(symbol, set()).add(receiver.name)
+        return entry
+
+    def invalidate_symbol(self, receiver_name: str, symbol: str):
+        """Drop resolutions of symbol that depend on receiver_name's vocabulary."""
+        dependents = self._through.get(receiver_name, {}).pop(symbol, None)
+        if dependents:
+            for name in dependents:
+                self._entries.pop((name, symbol), None)
+
+    def invalidate_receiver(self, receiver_name: str):
+        """Drop every resolution whose chain walk passed through receiver_name."""
+        by_symbol = self._through.pop(receiver_name, None)
+        if by_symbol:
+            for symbol, dependents in by_symbol.items():
+                for name in dependents:
+                    self._entries.pop((name, symbol), None)
+
+    def clear(self):
+        self._entries.clear()
+        self._through.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_vocabulary_generations = itertools.count(1)
+
+
+class EffectiveVocabulary(tuple):
+    """A receiver's local + inherited symbols as a frozen, sorted tuple.
+
+    Each build is tagged with a process-wide generation number, so holders
+    can tell whether a vocabulary changed by comparing generations instead
+    of contents. Renders like a list so prompts read exactly as before.
+    """
+
+    def __new__(cls, symbols):
+        self = super().__new__(cls, symbols)
+        self.generation = next(_vocabulary_generations)
+        self._members = frozenset(self)
+        return self
+
+    def __contains__(self, symbol) -> bool:
+        return symbol in self._members
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+EMPTY_VOCABULARY = EffectiveVocabulary(())
+
+
 class Receiver:
     def __init__(self, name: str, vocabulary: Set[str] = None, parent: 'Receiver' = None):
         self.name = name
         self.local_vocabulary = vocabulary if vocabulary is not None else set()
-        self.parent: Optional['Receiver'] = parent
+        self._parent: Optional['Receiver'] = parent
         self._parent_name: Optional[str] = None
+        self._cache: Optional[ResolutionCache] = None   # attached by the owning Dispatcher
+        self._generation = 0                            # bumped on every local mutation
+        self._effective: Optional[EffectiveVocabulary] = None
+        self._effective_basis: Optional[EffectiveVocabulary] = None
+        self._effective_generation = -1
         self.descriptions: Dict[str, str] = {}   # "#symbol" → description text
         self.identity: Optional[str] = None       # receiver identity from H1 description
 
+    @property
+    def parent(self) -> Optional['Receiver']:
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Optional['Receiver']):
+        if value is self._parent:
+            return
+        self._parent = value
+        self._generation += 1
+        if self._cache is not None:
+            self._cache.invalidate_receiver(self.name)
+
     @property
     def vocabulary(self) -> Set[str]:
         """Returns local vocabulary ONLY (not inherited from parent chain)."""
         return self.local_vocabulary.copy()
 
+    def effective_vocabulary(self) -> EffectiveVocabulary:
+        """Return local + inherited symbols as a sorted, immutable tuple.
+
+        The result is reused until this receiver or an ancestor changes.
+        A stale entry is rebuilt by merging the parent's (already sorted)
+        effective vocabulary with the local symbols it lacks.
+        """
+        basis = self.parent.effective_vocabulary() if self.parent else EMPTY_VOCABULARY
+        if (self._effective is not None
+                and self._effective_generation == self._generation
+                and self._effective_basis is basis):
+            return self._effective
+        extra = sorted(s for s in self.local_vocabulary if s not in basis)
+        self._effective = EffectiveVocabulary(heapq.merge(basis, extra))
+        self._effective_basis = basis
+        self._effective_generation = self._generation
+        return self._effective
+
     def is_native(self, symbol: str) -> bool:
         """Check if symbol is in receiver's local vocabulary."""
         return symbol in self.local_vocabulary
 
     def _find_in_chain(self, symbol: str) -> Optional['Receiver']:
         """Walk parent chain to find which ancestor holds this symbol."""
+        if self._cache is not None:
+            return self._cache.resolve(self, symbol)[1]
         ancestor = self.parent
         while ancestor:
             if symbol in ancestor.local_vocabulary:
@@ -106,7 +291,11 @@ class Receiver:
 
     def add_symbol(self, symbol: str, description: str = None):
         """Add symbol to local vocabulary, optionally with a description."""
-        self.local_vocabulary.add(symbol)
+        if symbol not in self.local_vocabulary:
+            self.local_vocabulary.add(symbol)
+            self._generation += 1
+            if self._cache is not None:
+                self._cache.invalidate_symbol(self.name, symbol)
         if description:
             self.descriptions[symbol] = description
 
@@ -121,37 +310,39 @@ class Receiver:
         1. NATIVE — symbol in local vocabulary
         2. INHERITED — symbol found in parent chain
         3. UNKNOWN — symbol not found anywhere
+
+        Resolution is served from the Dispatcher's ResolutionCache when
+        attached; the context payload is built lazily on first access.
         """
         if self.is_native(symbol):
             return LookupResult(
                 outcome=LookupOutcome.NATIVE,
                 symbol=symbol,
                 receiver_name=self.name,
-                context={
+                context=_LazyContext(lambda: {
                     "local_vocabulary": sorted(self.local_vocabulary),
                     "description": self.descriptions.get(symbol),
-                }
+                }),
             )
 
         ancestor = self._find_in_chain(symbol)
         if ancestor:
-            ancestor_desc = ancestor.descriptions.get(symbol)
             return LookupResult(
                 outcome=LookupOutcome.INHERITED,
                 symbol=symbol,
                 receiver_name=self.name,
-                context={
+                context=_LazyContext(lambda: {
                     "defined_in": ancestor.name,
                     "local_vocabulary": sorted(self.local_vocabulary),
-                    "description": ancestor_desc,
-                }
+                    "description": ancestor.descriptions.get(symbol),
+                }),
             )
 
         return LookupResult(
             outcome=LookupOutcome.UNKNOWN,
             symbol=symbol,
             receiver_name=self.name,
-            context={"local_vocabulary": sorted(self.local_vocabulary)}
+            context=_LazyContext(lambda: {"local_vocabulary": sorted(self.local_vocabulary)}),
         )
 
     def chain(self) -> List[str]:
@@ -172,6 +363,413 @@ class Receiver:
         return f"{self.name} : {parent_name} # → {local}"
 
 
+# Parse vocabulary files in a process pool once there are at least this many.
+BOOTSTRAP_PARALLEL_THRESHOLD = 256
+
+_FileStamp = Tuple[int, int]   # (mtime_ns, size)
+
+
+def _parse_hw_path(path: str) -> Tuple[_FileStamp, Optional[List[Node]]]:
+    """Read and parse one .hw file. Runs in worker processes for large bootstraps.
+
+    Returns the file's stamp (taken before reading) and its top-level
+    nodes, or None for the nodes when the file has a syntax error.
+    """
+    st = os.stat(path)
+    with open(path, "r") as f:
+        text = f.read()
+    try:
+        nodes = Parser.from_source(text).parse()
+    except SyntaxError:
+        nodes = None
+    return (st.st_mtime_ns, st.st_size), nodes
+
+
+def _parse_vocabulary_files(paths: List[str]) -> List[Tuple[_FileStamp, Optional[List[Node]]]]:
+    """Parse every path exactly once, concurrently when there are many."""
+    if len(paths) >= BOOTSTRAP_PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor() as pool:
+                return list(pool.map(_parse_hw_path, paths, chunksize=64))
+        except (OSError, BrokenProcessPool, NotImplementedError):
+            pass  # No usable process pool here; parse serially
+    return [_parse_hw_path(p) for p in paths]
+
+
+@dataclass(frozen=True)
+class ReceiverSpec:
+    """Frozen bootstrap state of one receiver."""
+    name: str
+    parent: Optional[str]
+    symbols: FrozenSet[str]
+    descriptions: Tuple[Tuple[str, str], ...]
+    identity: Optional[str]
+
+
+@dataclass(frozen=True)
+class BootstrapSnapshot:
+    """Immutable result of bootstrapping a vocabulary directory.
+
+    Captured after the first full bootstrap of a directory; later
+    Dispatchers over the same, unchanged files clone it instead of
+    re-reading and re-parsing every .hw file.
+    """
+    receivers: Tuple[ReceiverSpec, ...]
+    documents: Tuple[Tuple[str, _FileStamp, HwDocument], ...]
+
+    @classmethod
+    def capture(cls, registry: Dict[str, 'Receiver'], documents) -> 'BootstrapSnapshot':
+        specs = tuple(
+            ReceiverSpec(
+                name=r.name,
+                parent=r.parent.name if r.parent else r._parent_name,
+                symbols=frozenset(r.local_vocabulary),
+                descriptions=tuple(r.descriptions.items()),
+                identity=r.identity,
+            )
+            for r in registry.values()
+        )
+        return cls(receivers=specs, documents=tuple(documents))
+
+    def materialize(self, cache: 'ResolutionCache') -> Dict[str, 'Receiver']:
+        """Build a fresh, mutable registry with parents resolved."""
+        registry: Dict[str, Receiver] = {}
+        for spec in self.receivers:
+            receiver = Receiver(spec.name, set(spec.symbols))
+            receiver._parent_name = spec.parent
+            receiver.descriptions = dict(spec.descriptions)
+            receiver.identity = spec.identity
+            receiver._cache = cache
+            registry[spec.name] = receiver
+        for receiver in registry.values():
+            if receiver._parent_name in registry:
+                receiver.parent = registry[receiver._parent_name]
+        return registry
+
+
+# (storage dir, file stamps) → snapshot, shared by every Dispatcher in the process
+_bootstrap_snapshots: Dict[Tuple[str, Tuple[Tuple[str, int, int], ...]], BootstrapSnapshot] = {}
+
+
+def _stamp_files(hw_files: Dict[str, Path]) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+    stamps = []
+    for name in sorted(hw_files):
+        try:
+            st = hw_files[name].stat()
+        except OSError:
+            return None
+        stamps.append((name, st.st_mtime_ns, st.st_size))
+    return tuple(stamps)
+
+
+# Bump whenever ReceiverSpec, HwDocument or the parser change what an image holds.
+VOCAB_IMAGE_VERSION = 1
+
+
+class _PlainUnpickler(pickle.Unpickler):
+    """Unpickler for vocabulary images: builtin containers only, never globals."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"vocabulary image references {module}.{name}")
+
+
+def vocab_image_path(storage_dir: str) -> Path:
+    """Where the compiled registry image for storage_dir lives (a hidden sibling)."""
+    d = Path(os.path.abspath(storage_dir))
+    return d.with_name(f".{d.name}.hwimage")
+
+
+def _vocab_image_enabled() -> bool:
+    return os.environ.get("HW_VOCAB_IMAGE", "1") != "0"
+
+
+def _file_digest(path: Path) -> Optional[str]:
+    try:
+        return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _collision_inbox_key() -> Tuple[str, FrozenSet[str]]:
+    """Identify the HelloWorld inbox contents by path and message file names."""
+    inbox = message_bus._inbox("HelloWorld")
+    return str(inbox), frozenset(p.name for p in inbox.glob("msg-*.hw"))
+
+
+def write_vocab_image(image_path: Path, hw_files: Dict[str, Path], snapshot: BootstrapSnapshot,
+                      collisions: Optional[Tuple[Tuple[str, FrozenSet[str]], FrozenSet[str]]] = None) -> bool:
+    """Persist snapshot as a compiled registry image keyed by file content hashes.
+
+    The image holds only builtin containers, so loading it never imports
+    or runs code. Written atomically; returns False if it could not be.
+    """
+    docs = {Path(path).stem: doc for path, _, doc in snapshot.documents}
+    files = {}
+    for name, path in hw_files.items():
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        digest = _file_digest(path)
+        if digest is None:
+            return False
+        files[name] = (st.st_mtime_ns, st.st_size, digest)
+    image = {
+        "version": VOCAB_IMAGE_VERSION,
+        "files": files,
+        "receivers": [
+            (s.name, s.parent, s.symbols, s.descriptions, s.identity) for s in snapshot.receivers
+        ],
+        "documents": {
+            name: (d.parent, d.identity, frozenset(d.symbols), tuple(d.descriptions.items()))
+            for name, d in docs.items()
+        },
+        "collisions": collisions,
+    }
+    tmp = image_path.with_name(f"{image_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(image, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, image_path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def load_vocab_image(image_path: Path, hw_files: Dict[str, Path], vocab_manager: VocabularyManager):
+    """Load a compiled registry image if it still matches hw_files.
+
+    A file whose (mtime, size) changed is re-hashed, so a touch or a
+    checkout of identical content keeps the image valid. Returns
+    (snapshot, collisions) or None when the image is missing, corrupt,
+    from another version, or stale — callers then do a full parse.
+    """
+    try:
+        with open(image_path, "rb") as f:
+            image = _PlainUnpickler(f).load()
+    except FileNotFoundError:
+        return None
+    except Exception:
+        return None  # Corrupt or foreign image: fall back to a full parse
+    if not isinstance(image, dict) or image.get("version") != VOCAB_IMAGE_VERSION:
+        return None
+    try:
+        files = image["files"]
+        if set(files) != set(hw_files):
+            return None
+        documents = []
+        for name in sorted(hw_files):
+            path = hw_files[name]
+            mtime_ns, size, digest = files[name]
+            try:
+                st = path.stat()
+            except OSError:
+                return None
+            if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+                if st.st_size != size or _file_digest(path) != digest:
+                    return None
+            if name in image["documents"]:
+                parent, identity, symbols, descriptions = image["documents"][name]
+                doc = HwDocument(parent, identity, set(symbols), dict(descriptions))
+                documents.append((vocab_manager._get_path(name), (st.st_mtime_ns, st.st_size), doc))
+        receivers = tuple(ReceiverSpec(*fields) for fields in image["receivers"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    snapshot = BootstrapSnapshot(receivers=receivers, documents=tuple(documents))
+    return snapshot, image.get("collisions")
+
+
+class _Interpretation:
+    """An LLM call a handler coroutine is suspended on.
+
+    Handlers that consult the LLM are written once, as coroutines that
+    await these. Dispatcher._drive answers them with llm.call for the
+    synchronous API; Dispatcher._adrive awaits llm.acall, so many
+    interpretations can be in flight on one event loop.
+    """
+    __slots__ = ("llm", "prompt")
+
+    def __init__(self, llm, prompt: str):
+        self.llm = llm
+        self.prompt = prompt
+
+    def __await__(self):
+        return (yield self)
+
+
+class _Fanout:
+    """Handler coroutines another handler is suspended on until all finish.
+
+    Awaiting one returns their results in order. Under Dispatcher._drive
+    they run on a pool of `limit` threads; under _adrive they are tasks on
+    the loop, at most `limit` at a time. Either way they start in list
+    order, and the first error is raised at the await once all have ended.
+    A nonzero `interval` also spaces the starts at least that many seconds
+    apart, to keep a burst of LLM calls under a provider's rate limit.
+    """
+    __slots__ = ("coros", "limit", "interval")
+
+    def __init__(self, coros: List[Any], limit: int, interval: float = 0.0):
+        self.coros = coros
+        self.limit = max(1, limit)
+        self.interval = max(0.0, interval)
+
+    def __await__(self):
+        return (yield self)
+
+    def _slots(self) -> List[float]:
+        """Earliest monotonic start time of each coroutine."""
+        start = time.monotonic()
+        return [start + i * self.interval for i in range(len(self.coros))]
+
+    def run(self, drive: Callable[[Any], Any]) -> List[Any]:
+        def paced(coro, slot):
+            delay = slot - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            return drive(coro)
+
+        slots = self._slots()
+        if self.limit == 1 or len(self.coros) <= 1:
+            return [paced(coro, slot) for coro, slot in zip(self.coros, slots)]
+        workers = min(self.limit, len(self.coros))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hw-run") as pool:
+            futures = [pool.submit(paced, coro, slot) for coro, slot in zip(self.coros, slots)]
+            futures_wait(futures)
+        return [future.result() for future in futures]
+
+    async def arun(self, adrive: Callable[[Any], Any]) -> List[Any]:
+        gate = asyncio.Semaphore(self.limit)
+
+        async def bounded(coro, slot):
+            delay = slot - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with gate:
+                return await adrive(coro)
+
+        slots = self._slots()
+        results = await asyncio.gather(*(bounded(coro, slot) for coro, slot in zip(self.coros, slots)),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return list(results)
+
+
+@dataclass
+class _Drain:
+    """What one turn at a receiver's inbox handled."""
+    processed: int = 0
+    skipped: int = 0              # self-messages, dropped unanswered
+    lines: List[str] = field(default_factory=list)
+    done: bool = False            # inbox empty, or the run's cutoff reached
+
+
+@dataclass
+class RunReport:
+    """Structured result of `HelloWorld run`: messages handled per receiver."""
+    processed: Dict[str, int] = field(default_factory=dict)
+    skipped: Dict[str, int] = field(default_factory=dict)
+    lines: Dict[str, List[str]] = field(default_factory=dict)
+    ticks: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.processed.values())
+
+    def add(self, name: str, drain: _Drain):
+        self.processed[name] = self.processed.get(name, 0) + drain.processed
+        self.skipped[name] = self.skipped.get(name, 0) + drain.skipped
+        self.lines.setdefault(name, []).extend(drain.lines)
+
+    def render(self) -> str:
+        """The text `HelloWorld run` has always printed."""
+        if self.total == 0:
+            return "[HelloWorld] All inboxes empty. Nothing to receive."
+        out = []
+        for name, count in self.processed.items():
+            if count:
+                out.extend(self.lines[name])
+                out.append(f"[{name}] Processed {count} message(s).")
+        out.append(f"[HelloWorld] Processed {self.total} message(s) across all agents.")
+        return "\n".join(out)
+
+
+class RunScheduler:
+    """Drains several receivers' inboxes concurrently, one tick at a time.
+
+    Each tick gives every receiver that may still have mail a turn of at
+    most `quantum` messages, so a busy inbox cannot starve the rest.
+    Receivers run grouped by priority (lower first; unlisted names get
+    DEFAULT_PRIORITY): a group's turns all finish before the next group's
+    start, up to `workers` turns run at once, and a receiver never has two
+    turns in flight, so its messages are handled in inbox order.
+
+    A receiver retires once its inbox is empty or it handles a message
+    sent after the run began. Agents answer each other, so without that
+    cutoff two busy agents could keep a run going forever; replies made
+    during a run are picked up by the next one.
+    """
+
+    DEFAULT_PRIORITY = 100
+
+    def __init__(self, workers: int = 4, quantum: int = 8,
+                 priorities: Optional[Dict[str, int]] = None):
+        self.workers = workers
+        self.quantum = quantum
+        self.priorities = {"HelloWorld": 0} if priorities is None else dict(priorities)
+
+    def priority(self, name: str) -> int:
+        return self.priorities.get(name, self.DEFAULT_PRIORITY)
+
+    async def arun(self, receivers: Iterable[str],
+                   turn: Callable[[str, int, datetime], Any]) -> RunReport:
+        """Run turn(name, quantum, started) coroutines until every receiver retires.
+
+        Call from a handler coroutine: turns fan out through the driver.
+        """
+        started = datetime.now(timezone.utc)
+        report = RunReport()
+        active = sorted(set(receivers), key=lambda name: (self.priority(name), name))
+        for name in active:
+            report.processed[name] = 0
+        while active:
+            report.ticks += 1
+            remaining = []
+            for _, group in itertools.groupby(active, key=self.priority):
+                group = list(group)
+                drains = await _Fanout([turn(name, self.quantum, started) for name in group], self.workers)
+                for name, drain in zip(group, drains):
+                    report.add(name, drain)
+                    if not drain.done:
+                        remaining.append(name)
+            active = remaining
+        return report
+
+
+def _sent_after(msg: 'message_bus.Message', moment: datetime) -> bool:
+    """True if msg's timestamp is later than moment. Unreadable timestamps count as earlier."""
+    try:
+        sent = datetime.fromisoformat(msg.timestamp)
+    except (TypeError, ValueError):
+        return False
+    if sent.tzinfo is None:
+        sent = sent.replace(tzinfo=timezone.utc)
+    return sent > moment
+
+
+async def _acall(llm, prompt: str) -> str:
+    """Await llm.acall when the client has one; otherwise run call() on a worker thread."""
+    if inspect.iscoroutinefunction(getattr(llm, "acall", None)):
+        return await llm.acall(prompt)
+    return await asyncio.to_thread(llm.call, prompt)
+
+
 class Dispatcher:
     def __init__(self, vocab_dir: str = "vocabularies", **kwargs):
         if "use_llm" in kwargs:
@@ -180,16 +778,19 @@ class Dispatcher:
                 "Set/unset GEMINI_API_KEY to control LLM availability."
             )
         self.registry: Dict[str, Receiver] = {}
+        self.resolution_cache = ResolutionCache()
         self.vocab_manager = VocabularyManager(vocab_dir)
         self.message_handler_registry = MessageHandlerRegistry()
-        # TODO: evaluate whether collisions.log should exist as a file or be
-        #       replaced with in-memory logging / structured output. It's in
-        #       .gitignore but still causes merge friction.
+        # Collision events are queried from collision_store; the log stays as readable text
         self.log_file = "collisions.log"
         self.trace = False
         # HelloWorld is the root parent
         self.agents = {"Claude", "Copilot", "Gemini", "Codex", "Scribe"}
         self.pending_collision_symbols: Set[str] = set()
+        self.run_scheduler = RunScheduler()
+        self.resolve_workers = 4          # `HelloWorld resolve`: syntheses in flight at once
+        self.resolve_interval = 0.0       # ...and minimum seconds between their starts
+        self._synthesis_lock = threading.Lock()   # concurrent runs may resolve collisions at once
         # Phase 4: LLM interpretation — lazy-loaded on first use
         self._llm = None
         self._llm_checked = False
@@ -198,18 +799,19 @@ class Dispatcher:
     def _get_llm(self):
         """Lazy-load the LLM on first use.
 
-        Prefers ClaudeModel (ANTHROPIC_API_KEY), falls back to GeminiModel (GEMINI_API_KEY).
-        Returns None when no API key is available.
+        Prefers ClaudeModel (ANTHROPIC_API_KEY), falls back to GeminiModel (GEMINI_API_KEY),
+        behind the shared response cache (llm_cache). Returns None when no API key is available.
         """
         if not self._llm_checked:
             self._llm_checked = True
             from llm import has_anthropic_key, has_api_key
+            from llm_cache import cached
             if has_anthropic_key():
                 from claude_llm import ClaudeModel
-                self._llm = ClaudeModel()
+                self._llm = cached(ClaudeModel())
             elif has_api_key():
                 from llm import GeminiModel
-                self._llm = GeminiModel()
+                self._llm = cached(GeminiModel())
         return self._llm
 
     @property
@@ -222,12 +824,13 @@ class Dispatcher:
         """Allow tests to set use_llm for backward compatibility."""
         if value:
             from llm import has_anthropic_key
+            from llm_cache import cached
             if has_anthropic_key():
                 from claude_llm import ClaudeModel
-                self._llm = ClaudeModel()
+                self._llm = cached(ClaudeModel())
             else:
                 from llm import GeminiModel
-                self._llm = GeminiModel()
+                self._llm = cached(GeminiModel())
             self._llm_checked = True
         else:
             self._llm = None
@@ -243,14 +846,22 @@ class Dispatcher:
         self._llm = value
         self._llm_checked = True
 
+    @property
+    def collisions(self) -> collision_store.CollisionStore:
+        """The indexed event store behind log_file."""
+        return collision_store.for_log(self.log_file)
+
+    @property
+    def pending_collisions(self) -> collision_store.PendingCollisions:
+        """Registry of the deferred collisions in HelloWorld's inbox."""
+        return collision_store.pending_for(message_bus._inbox("HelloWorld"))
+
     def _log_collision(self, receiver: str, symbol: str, context: Optional[str] = None):
         timestamp = datetime.now().isoformat()
         log_entry = f"[{timestamp}] COLLISION: {receiver} reached for {symbol}"
         if context:
             log_entry += f" in context of {context}"
-        log_entry += "\n"
-        with open(self.log_file, "a") as f:
-            f.write(log_entry)
+        self.collisions.record("collision", receiver, symbol, context=context, line=log_entry, ts=timestamp)
 
     def _bootstrap(self):
         """Initialize default receivers from .hw vocabulary files.
@@ -262,6 +873,13 @@ class Dispatcher:
         2. If vocab_dir differs from vocabularies/, bootstrap from vocabularies/*.hw
         3. Fallback: HelloWorld receiver must always exist (even if empty)
         4. Resolve parent references to build the inheritance chain
+
+        Each file is parsed exactly once (in a process pool when there are
+        many). A directory whose files are unchanged since an earlier
+        bootstrap in this process is cloned from its BootstrapSnapshot;
+        across processes the snapshot is loaded from a compiled registry
+        image next to the directory (see vocab_image_path). Set
+        HW_VOCAB_IMAGE=0 to neither read nor write the image.
         """
         # 1. Initialize known agents and HelloWorld from persisted state or .hw
         core_receivers = {"HelloWorld"} | self.agents
@@ -272,6 +890,7 @@ class Dispatcher:
         if vocab_dir.exists():
             for hw_file in vocab_dir.glob("*.hw"):
                 hw_files[hw_file.stem] = hw_file
+        from_storage = bool(hw_files)
 
         # If storage dir has no .hw files, fall back to canonical vocabularies/
         if not hw_files:
@@ -280,8 +899,48 @@ class Dispatcher:
                 for hw_file in canonical.glob("*.hw"):
                     hw_files[hw_file.stem] = hw_file
 
+        # Only storage-dir bootstraps are snapshotted: a canonical fallback
+        # also copies files into storage, which a clone would skip.
+        snapshot_key = None
+        if from_storage:
+            stamps = _stamp_files(hw_files)
+            if stamps is not None:
+                snapshot_key = (os.path.abspath(self.vocab_manager.storage_dir), stamps)
+        snapshot = _bootstrap_snapshots.get(snapshot_key) if snapshot_key else None
+        collisions = None
+        image_path = None
+        if snapshot_key and _vocab_image_enabled():
+            image_path = vocab_image_path(self.vocab_manager.storage_dir)
+            if snapshot is None:
+                loaded = load_vocab_image(image_path, hw_files, self.vocab_manager)
+                if loaded is not None:
+                    snapshot, collisions = loaded
+                    _bootstrap_snapshots[snapshot_key] = snapshot
+        if snapshot is not None:
+            for path, stamp, doc in snapshot.documents:
+                self.vocab_manager.prime(path, stamp, doc)
+            self.registry = snapshot.materialize(self.resolution_cache)
+            inbox_key = _collision_inbox_key() if collisions is not None else None
+            if inbox_key is not None and collisions[0] == inbox_key:
+                self.pending_collision_symbols |= collisions[1]
+            else:
+                self._load_pending_collision_symbols()
+            return
+
+        # Parse every file once, up front
+        names = sorted(hw_files)
+        parsed = dict(zip(names, _parse_vocabulary_files([str(hw_files[n]) for n in names])))
+        documents = []
+        if from_storage:
+            for name, (stamp, nodes) in parsed.items():
+                doc = HwDocument.from_nodes(nodes) if nodes is not None else HwDocument()
+                path = self.vocab_manager._get_path(name)
+                self.vocab_manager.prime(path, stamp, doc)
+                documents.append((path, stamp, doc))
+
         # 2. Load all core and discovered receivers
         all_potential = set(core_receivers) | set(hw_files.keys())
+        declarative = True
 
         for name in sorted(all_potential):
             # _get_or_create_receiver handles loading from .hw
@@ -289,22 +948,36 @@ class Dispatcher:
 
             # Always dispatch .hw file to populate descriptions and identity.
             # Symbols are idempotent (set.add is a no-op for existing symbols).
-            if name in hw_files:
-                try:
-                    self.dispatch_source(hw_files[name].read_text())
-                except SyntaxError:
-                    pass  # Skip files with unparseable content
+            nodes = parsed[name][1] if name in parsed else None
+            if nodes is not None:
+                declarative = declarative and all(
+                    isinstance(n, (HeadingNode, DescriptionNode)) for n in nodes
+                )
+                self.dispatch(nodes)
 
         # 3. Final Fallback: Ensure HelloWorld exists
         if "HelloWorld" not in self.registry:
-            self.registry["HelloWorld"] = Receiver("HelloWorld", set())
+            root = Receiver("HelloWorld", set())
+            root._cache = self.resolution_cache
+            self.registry["HelloWorld"] = root
 
         # 4. Resolve parent name strings to actual Receiver objects
         self._resolve_parents()
 
+        # Snapshot only pure declarations that left the files untouched
+        snapshot = None
+        if snapshot_key and declarative and _stamp_files(hw_files) == snapshot_key[1]:
+            snapshot = BootstrapSnapshot.capture(self.registry, documents)
+            _bootstrap_snapshots[snapshot_key] = snapshot
+
         # 5. Load pending collision symbols from HelloWorld inbox
         self._load_pending_collision_symbols()
 
+        # 6. Compile the snapshot to disk so the next process can skip parsing
+        if snapshot is not None and image_path is not None:
+            collisions = (_collision_inbox_key(), frozenset(self.pending_collision_symbols))
+            write_vocab_image(image_path, hw_files, snapshot, collisions)
+
     def dispatch(self, nodes: List[Node]) -> List[str]:
         results = []
         for node in nodes:
@@ -322,6 +995,150 @@ class Dispatcher:
             nodes = Parser(Lexer(source).tokenize()).parse()
         return self.dispatch(nodes)
 
+    def dispatch_iter(self, nodes: Iterable[Node], concurrency: int = 1) -> Iterator[str]:
+        """Yield each statement's result as soon as it is ready, in statement order.
+
+        With concurrency > 1, statements that only read one existing
+        receiver (see _concurrency_key) run on a thread pool: statements on
+        different receivers overlap, statements on the same receiver keep
+        their order, and every other statement waits for all earlier ones
+        and then runs alone. If a statement raises, the error surfaces at
+        its position; read-only statements after it may already have run.
+        """
+        if concurrency <= 1:
+            for node in nodes:
+                result = self._execute(node)
+                if result:
+                    yield result
+            return
+        yield from self._dispatch_concurrent(nodes, concurrency)
+
+    def dispatch_stream(self, source: str, concurrency: int = 1) -> Iterator[str]:
+        """Parse source, then stream its results as dispatch_iter does.
+
+        Parsing happens up front, so a syntax error is raised before any
+        statement runs — the same guarantee as dispatch_source.
+        """
+        return self.dispatch_iter(Parser.from_source(source).parse(), concurrency)
+
+    def _concurrency_key(self, node: Node) -> Optional[str]:
+        """The one receiver a statement only reads, or None if it must run alone.
+
+        Lookups, queries and plain unary messages on a receiver that is
+        already registered leave the registry untouched. Definitions,
+        headings, sends, run/receive, HelloWorld's protocol symbols, new
+        or namespaced receivers and pending-collision resolution all
+        mutate shared state.
+        """
+        if not isinstance(node, (ScopedLookupNode, SuperLookupNode,
+                                 VocabularyQueryNode, UnaryMessageNode)):
+            return None
+        name = node.receiver.name
+        if name == "HelloWorld" or name not in self.registry:
+            return None
+        if isinstance(node, UnaryMessageNode) and node.message in ("receive", "run"):
+            return None
+        symbol = getattr(node, "symbol", None)
+        if symbol is not None and symbol.name in self.pending_collision_symbols:
+            return None
+        return name
+
+    def _dispatch_concurrent(self, nodes: Iterable[Node], workers: int) -> Iterator[str]:
+        in_flight: deque = deque()           # futures, in statement order
+        latest: Dict[str, Future] = {}       # receiver → its most recent statement
+        window = workers * 4                 # bound on statements run ahead of the consumer
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hw-dispatch")
+        try:
+            for node in nodes:
+                key = self._concurrency_key(node)
+                if key is None:
+                    while in_flight:
+                        result = in_flight.popleft().result()
+                        if result:
+                            yield result
+                    latest.clear()
+                    result = self._execute(node)
+                    if result:
+                        yield result
+                    continue
+                future = pool.submit(self._execute_after, latest.get(key), node)
+                latest[key] = future
+                in_flight.append(future)
+                while in_flight and (in_flight[0].done() or len(in_flight) >= window):
+                    result = in_flight.popleft().result()
+                    if result:
+                        yield result
+            while in_flight:
+                result = in_flight.popleft().result()
+                if result:
+                    yield result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _execute_after(self, previous: Optional[Future], node: Node) -> Optional[str]:
+        # The pool is FIFO, so previous is already running or done here
+        if previous is not None:
+            futures_wait([previous])
+        return self._execute(node)
+
+    async def adispatch(self, nodes: List[Node]) -> List[str]:
+        """Awaitable dispatch: LLM-backed statements await the model instead of blocking the loop."""
+        return [result async for result in self.adispatch_iter(nodes)]
+
+    async def adispatch_source(self, source: str) -> List[str]:
+        return await self.adispatch(Parser.from_source(source).parse())
+
+    async def adispatch_iter(self, nodes: Iterable[Node], concurrency: int = 1) -> AsyncIterator[str]:
+        """Async counterpart of dispatch_iter, for callers already on an event loop.
+
+        With concurrency > 1, the statements dispatch_iter would hand to
+        its thread pool become tasks on the running loop instead, so up to
+        `concurrency` interpretations can wait on the network at once.
+        Ordering and exclusivity follow the same _concurrency_key rules.
+        """
+        if concurrency <= 1:
+            for node in nodes:
+                result = await self._adrive(self._aexecute(node))
+                if result:
+                    yield result
+            return
+        in_flight: deque = deque()               # tasks, in statement order
+        latest: Dict[str, asyncio.Task] = {}     # receiver → its most recent statement
+        try:
+            for node in nodes:
+                key = self._concurrency_key(node)
+                if key is None:
+                    while in_flight:
+                        result = await in_flight.popleft()
+                        if result:
+                            yield result
+                    latest.clear()
+                    result = await self._adrive(self._aexecute(node))
+                    if result:
+                        yield result
+                    continue
+                task = asyncio.ensure_future(self._aexecute_after(latest.get(key), node))
+                latest[key] = task
+                in_flight.append(task)
+                while in_flight and (in_flight[0].done() or len(in_flight) >= concurrency):
+                    result = await in_flight.popleft()
+                    if result:
+                        yield result
+            while in_flight:
+                result = await in_flight.popleft()
+                if result:
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _aexecute_after(self, previous: Optional[asyncio.Task], node: Node) -> Optional[str]:
+        if previous is not None:
+            await asyncio.wait([previous])
+        return await self._adrive(self._aexecute(node))
+
     def list_receivers(self) -> List[str]:
         return sorted(self.registry.keys())
 
@@ -339,12 +1156,7 @@ class Dispatcher:
 
     def _full_vocabulary(self, receiver: Receiver) -> Set[str]:
         """Return a receiver's full vocabulary: local + inherited from parent chain."""
-        vocab = receiver.local_vocabulary.copy()
-        ancestor = receiver.parent
-        while ancestor:
-            vocab |= ancestor.local_vocabulary
-            ancestor = ancestor.parent
-        return vocab
+        return set(receiver.effective_vocabulary())
 
     def _trace(self, msg: str):
         """Emit trace output if tracing is enabled."""
@@ -352,6 +1164,9 @@ class Dispatcher:
             print(f"  [TRACE] {msg}")
 
     def _execute(self, node: Node) -> Optional[str]:
+        return self._drive(self._aexecute(node))
+
+    async def _aexecute(self, node: Node) -> Optional[str]:
         if isinstance(node, VocabularyQueryNode):
             self._trace(f"VocabularyQueryNode({node.receiver.name})")
             return self._handle_query(node)
@@ -360,17 +1175,17 @@ class Dispatcher:
             return self._handle_super_lookup(node)
         if isinstance(node, ScopedLookupNode):
             self._trace(f"ScopedLookupNode({node.receiver.name}, {node.symbol.name})")
-            result = self._handle_scoped_lookup(node)
+            result = await self._ahandle_scoped_lookup(node)
             return result
         if isinstance(node, UnaryMessageNode):
             self._trace(f"UnaryMessageNode({node.receiver.name}, {node.message}, super={node.is_super})")
-            return self._handle_unary_message(node)
+            return await self._ahandle_unary_message(node)
         if isinstance(node, VocabularyDefinitionNode):
             self._trace(f"VocabularyDefinitionNode({node.receiver.name})")
-            return self._handle_definition(node)
+            return await self._ahandle_definition(node)
         if isinstance(node, MessageNode):
             self._trace(f"MessageNode({node.receiver.name}, {list(node.arguments.keys())})")
-            return self._handle_message(node)
+            return await self._ahandle_message(node)
         if isinstance(node, HeadingNode):
             self._trace(f"HeadingNode(level={node.level}, name={node.name})")
             return self._handle_heading(node)
@@ -380,6 +1195,48 @@ class Dispatcher:
             return None  # standalone descriptions are no-ops
         return None
 
+    def _interpret(self, prompt: str, llm=None) -> '_Interpretation':
+        """Await this inside a handler coroutine to get the LLM's answer to prompt."""
+        return _Interpretation(self.llm if llm is None else llm, prompt)
+
+    @staticmethod
+    def _drive(coro) -> Any:
+        """Run a handler coroutine to completion, answering each interpretation with llm.call.
+
+        LLM errors are thrown back in at the await, so the handler's own
+        try/except sees exactly what a direct call would have raised.
+        """
+        value, error = None, None
+        while True:
+            try:
+                step = coro.send(value) if error is None else coro.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                if isinstance(step, _Fanout):
+                    value, error = step.run(Dispatcher._drive), None
+                else:
+                    value, error = step.llm.call(step.prompt), None
+            except Exception as e:
+                value, error = None, e
+
+    @staticmethod
+    async def _adrive(coro) -> Any:
+        """Run a handler coroutine on the event loop, awaiting each interpretation."""
+        value, error = None, None
+        while True:
+            try:
+                step = coro.send(value) if error is None else coro.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                if isinstance(step, _Fanout):
+                    value, error = await step.arun(Dispatcher._adrive), None
+                else:
+                    value, error = await _acall(step.llm, step.prompt), None
+            except Exception as e:
+                value, error = None, e
+
     def _handle_bare_symbol(self, node: SymbolNode) -> Optional[str]:
         """Handle a bare #Symbol at the top level.
 
@@ -459,6 +1316,9 @@ class Dispatcher:
         return "\n".join(lines)
 
     def _handle_scoped_lookup(self, node: ScopedLookupNode) -> str:
+        return self._drive(self._ahandle_scoped_lookup(node))
+
+    async def _ahandle_scoped_lookup(self, node: ScopedLookupNode) -> str:
         receiver_name = node.receiver.name
         symbol_name = node.symbol.name
         
@@ -488,13 +1348,13 @@ class Dispatcher:
 
         # Deferred collision resolution: if symbol has a pending collision and LLM is now available
         if self._check_pending_collision(symbol_name) and self.llm:
-            synthesis = self._resolve_pending_collision(symbol_name)
+            synthesis = await self._aresolve_pending_collision(symbol_name)
             if synthesis:
                 self._trace(f"Deferred collision on {symbol_name} resolved")
 
         # Phase 4: LLM interpretation layer for agent receivers
         if receiver_name in self.agents and self.llm:
-            local_vocab = sorted(self._full_vocabulary(receiver))
+            local_vocab = receiver.effective_vocabulary()
             bare_sym = symbol_name.lstrip("#") if symbol_name != "#" else "#"
             desc = self.vocab_manager.load_description(receiver_name, bare_sym)
             identity = self.vocab_manager.load_identity(receiver_name)
@@ -515,13 +1375,13 @@ class Dispatcher:
                     desc, identity, self._helloworld_definition(symbol_name),
                 )
             try:
-                llm_response = self.llm.call(prompt)
+                llm_response = await self._interpret(prompt)
                 return f"{receiver_name} {symbol_name} → {llm_response}"
             except Exception as e:
                 print(f"⚠️  LLM interpretation failed: {e}")
 
             print(f"📡 Querying {receiver_name} for {symbol_name}...")
-            local_vocab = sorted(self._full_vocabulary(receiver))
+            local_vocab = receiver.effective_vocabulary()
             context = f"Local Vocabulary: {local_vocab}"
             prompt = f"{receiver_name} {symbol_name}?"
             self.message_bus_send_and_wait("HelloWorld", receiver_name, prompt, context=context)
@@ -549,6 +1409,9 @@ class Dispatcher:
             return self._handle_unknown_symbol(receiver_name, receiver, symbol_name, lookup)
 
     def _handle_unary_message(self, node: UnaryMessageNode) -> str:
+        return self._drive(self._ahandle_unary_message(node))
+
+    async def _ahandle_unary_message(self, node: UnaryMessageNode) -> str:
         """Handle a unary message: Receiver act [super]
 
         Maps the bare message name to #message for vocabulary lookup,
@@ -560,12 +1423,15 @@ class Dispatcher:
         lookup = receiver.lookup(symbol_name)
 
         if node.message == "receive":
-            return self._handle_receive(receiver_name, receiver)
+            return await self._ahandle_receive(receiver_name, receiver)
 
         if node.message == "run":
             if receiver_name == "HelloWorld":
-                return self._handle_run()
-            return self._handle_run_one(receiver_name)
+                return await self._ahandle_run()
+            return await self._ahandle_run_one(receiver_name)
+
+        if node.message == "resolve" and receiver_name == "HelloWorld":
+            return await self._ahandle_resolve()
 
         if node.message == "chain":
             chain = receiver.chain()
@@ -576,7 +1442,7 @@ class Dispatcher:
             ancestor = receiver._find_in_chain(symbol_name)
             if ancestor:
                 if self.llm:
-                    local_vocab = sorted(self._full_vocabulary(receiver))
+                    local_vocab = receiver.effective_vocabulary()
                     local_desc = self.vocab_manager.load_description(receiver_name, node.message)
                     ancestor_desc = self.vocab_manager.load_description(ancestor.name, node.message)
                     from prompts import super_lookup_prompt
@@ -585,7 +1451,7 @@ class Dispatcher:
                         local_desc, ancestor.name, ancestor_desc,
                     )
                     try:
-                        llm_response = self.llm.call(prompt)
+                        llm_response = await self._interpret(prompt)
                         return f"[{receiver_name}] {node.message} (via {ancestor.name}) — {llm_response}"
                     except Exception:
                         pass
@@ -607,7 +1473,7 @@ class Dispatcher:
         # Non-super unary message
         if lookup.is_native() or lookup.is_inherited():
             if self.use_llm and self.llm and receiver_name in self.agents:
-                local_vocab = sorted(self._full_vocabulary(receiver))
+                local_vocab = receiver.effective_vocabulary()
                 desc = self.vocab_manager.load_description(receiver_name, node.message)
                 from prompts import scoped_lookup_prompt_with_descriptions
                 identity = self.vocab_manager.load_identity(receiver_name)
@@ -627,7 +1493,7 @@ class Dispatcher:
                     inherited_description=inherited_description,
                 )
                 try:
-                    llm_response = self.llm.call(prompt)
+                    llm_response = await self._interpret(prompt)
                     return f"[{receiver_name}] {node.message} — {llm_response}"
                 except Exception:
                     pass
@@ -643,15 +1509,14 @@ class Dispatcher:
             )
 
     def _handle_receive(self, receiver_name: str, receiver) -> str:
+        return self._drive(self._ahandle_receive(receiver_name, receiver))
+
+    async def _ahandle_receive(self, receiver_name: str, receiver) -> str:
         """Handle `Agent receive` — pull one message, interpret through identity, respond.
 
         Full OODA-R cycle: observe, orient, decide, act, reflect.
         Each cycle is stored as a memory file for future recall.
         """
-        identity = self.vocab_manager.load_identity(receiver_name)
-        local_vocab = sorted(self._full_vocabulary(receiver))
-        memory = MemoryBus(receiver_name)
-
         msg = message_bus.receive(receiver_name)
         if msg is None:
             return f"[{receiver_name}] Inbox empty."
@@ -659,6 +1524,13 @@ class Dispatcher:
         # Skip self-messages
         if msg.sender == receiver_name:
             return f"[{receiver_name}] Skipped self-message."
+        return await self._ahandle_received(receiver_name, receiver, msg)
+
+    async def _ahandle_received(self, receiver_name: str, receiver, msg: 'message_bus.Message') -> str:
+        """The OODA-R cycle for one message already taken from receiver's inbox."""
+        identity = self.vocab_manager.load_identity(receiver_name)
+        local_vocab = receiver.effective_vocabulary()
+        memory = MemoryBus(receiver_name)
 
         # Collision message handling: when HelloWorld receives a collision message
         if "# Collision:" in msg.content or "COLLISION:" in msg.content:
@@ -679,11 +1551,13 @@ class Dispatcher:
                     c_symbol, sender_desc=sender_desc, target_desc=target_desc,
                 )
                 try:
-                    synthesis = self.llm.call(prompt)
+                    synthesis = await self._interpret(prompt)
                     self._persist_synthesis(c_sender_name, c_target_name, c_symbol, synthesis)
-                    self.pending_collision_symbols.discard(c_symbol)
                     cid_match = re.search(r"# Collision: (\w+)", msg.content)
                     collision_id = cid_match.group(1) if cid_match else "unknown"
+                    self.pending_collisions.remove(collision_id)
+                    if self.pending_collisions.lookup(c_symbol) is None:
+                        self.pending_collision_symbols.discard(c_symbol)
                     self._log_collision_status("RESOLVED", collision_id, c_sender_name, c_target_name, c_symbol)
                     return (
                         f"[{receiver_name}] Collision resolved: "
@@ -742,7 +1616,7 @@ class Dispatcher:
                 memories=recalled_snippets if recalled_snippets else None,
             )
             try:
-                response_text = self.llm.call(prompt)
+                response_text = await self._interpret(prompt)
             except Exception:
                 pass
 
@@ -790,6 +1664,9 @@ class Dispatcher:
         return "\n".join(lines)
 
     def _handle_run(self, agent_name: str = None) -> str:
+        return self._drive(self._ahandle_run(agent_name))
+
+    async def _ahandle_run(self, agent_name: str = None) -> str:
         """Handle `HelloWorld run: Agent` or `HelloWorld run` (all agents).
 
         HelloWorld run: Claude      — run one agent until inbox empty.
@@ -798,53 +1675,102 @@ class Dispatcher:
         """
         # Run all agents when no specific agent is provided
         if agent_name is None:
-            return self._handle_run_all()
+            return await self._ahandle_run_all()
 
-        return self._handle_run_one(agent_name.lstrip("#"))
+        return await self._ahandle_run_one(agent_name.lstrip("#"))
 
     def _handle_run_one(self, agent_name: str) -> str:
+        return self._drive(self._ahandle_run_one(agent_name))
+
+    async def _ahandle_run_one(self, agent_name: str) -> str:
         """Run one agent until inbox is empty."""
-        receiver = self._get_or_create_receiver(agent_name)
-        processed = 0
-        all_lines = []
+        drain = await self._adrain(agent_name)
+        if drain.processed == 0:
+            return f"[{agent_name}] Inbox empty. Nothing to receive."
+        return "\n".join(drain.lines + [f"[{agent_name}] Processed {drain.processed} message(s)."])
 
-        while True:
-            result = self._handle_receive(agent_name, receiver)
-            if "Inbox empty" in result:
+    async def _adrain(self, agent_name: str, limit: Optional[int] = None,
+                      cutoff: Optional[datetime] = None) -> _Drain:
+        """Handle up to limit messages from agent_name's inbox, oldest first.
+
+        Stops early (done) when the inbox is empty, or right after handling
+        a message sent later than cutoff.
+        """
+        receiver = self._get_or_create_receiver(agent_name)
+        drain = _Drain()
+        while limit is None or drain.processed + drain.skipped < limit:
+            msg = message_bus.receive(agent_name)
+            if msg is None:
+                drain.done = True
                 break
-            if "Skipped self-message" in result:
+            if msg.sender == agent_name:
+                drain.skipped += 1
                 continue
-            processed += 1
-            all_lines.append(result)
-
-        if processed == 0:
-            return f"[{agent_name}] Inbox empty. Nothing to receive."
-
-        all_lines.append(f"[{agent_name}] Processed {processed} message(s).")
-        return "\n".join(all_lines)
+            drain.lines.append(await self._ahandle_received(agent_name, receiver, msg))
+            drain.processed += 1
+            if cutoff is not None and _sent_after(msg, cutoff):
+                drain.done = True
+                break
+        return drain
 
     def _handle_run_all(self) -> str:
+        return self._drive(self._ahandle_run_all())
+
+    async def _ahandle_run_all(self) -> str:
         """Run all agents. The protocol running the whole system."""
-        all_lines = []
-        total = 0
-
-        for agent_name in sorted(self.agents):
-            result = self._handle_run_one(agent_name)
-            if "Nothing to receive" not in result:
-                all_lines.append(result)
-                # Count messages from the result
-                for line in result.split("\n"):
-                    if "Processed" in line and "message(s)" in line:
-                        import re
-                        m = re.search(r"Processed (\d+)", line)
-                        if m:
-                            total += int(m.group(1))
-
-        if total == 0:
-            return "[HelloWorld] All inboxes empty. Nothing to receive."
+        return (await self._arun_inboxes()).render()
+
+    def run_inboxes(self) -> RunReport:
+        """Drain every agent inbox through run_scheduler, as `HelloWorld run` does."""
+        return self._drive(self._arun_inboxes())
+
+    async def arun_inboxes(self) -> RunReport:
+        return await self._adrive(self._arun_inboxes())
+
+    async def _arun_inboxes(self) -> RunReport:
+        receivers = set(self.agents)
+        tried: Set[str] = set()     # collision files HelloWorld's turns have handled this run
+        if self.pending_collision_symbols and self.llm:
+            # Collisions wait in HelloWorld's inbox; resolve them before agents read on
+            receivers.add("HelloWorld")
 
-        all_lines.append(f"[HelloWorld] Processed {total} message(s) across all agents.")
-        return "\n".join(all_lines)
+        def turn(name: str, quantum: int, started: datetime):
+            if name == "HelloWorld":
+                return self._adrain_collisions(quantum, tried)
+            return self._arun_turn(name, quantum, started)
+
+        return await self.run_scheduler.arun(receivers, turn)
+
+    def _arun_turn(self, agent_name: str, quantum: int, started: datetime):
+        return self._adrain(agent_name, limit=quantum, cutoff=started)
+
+    async def _adrain_collisions(self, limit: int, tried: Set[str]) -> _Drain:
+        """HelloWorld's turn in a run: up to limit pending collision messages, oldest first.
+
+        Only registered collisions are taken from the inbox. Everything
+        else there (#hello announcements, messages the MCP daemon answers)
+        stays queued for HelloWorld's own reader. Each collision is tried
+        once per run; one that fails to resolve stays pending.
+        """
+        drain = _Drain()
+        registry = self.pending_collisions
+        self.pending_collision_symbols |= registry.sync()
+        queue = [p for p in registry.pending() if p.sender and p.file not in tried]
+        receiver = self._get_or_create_receiver("HelloWorld")
+        for pending in queue[:limit]:
+            tried.add(pending.file)
+            try:
+                text = (registry.inbox / pending.file).read_text()
+            except FileNotFoundError:
+                continue            # resolved by another reader of the inbox
+            parsed = message_bus._parse_message_file(text)
+            # Headers are parsed away; the handler finds the registry entry by the collision id
+            msg = message_bus.Message(sender=parsed.sender, timestamp=parsed.timestamp,
+                                      content=f"# Collision: {pending.collision_id}\n\n{parsed.content}")
+            drain.lines.append(await self._ahandle_received("HelloWorld", receiver, msg))
+            drain.processed += 1
+        drain.done = len(queue) <= limit
+        return drain
 
     def _structural_interpret(
         self,
@@ -927,6 +1853,9 @@ class Dispatcher:
         return "\n".join(lines)
 
     def _handle_cross_receiver_send(self, sender_name: str, sender, node: MessageNode) -> str:
+        return self._drive(self._ahandle_cross_receiver_send(sender_name, sender, node))
+
+    async def _ahandle_cross_receiver_send(self, sender_name: str, sender, node: MessageNode) -> str:
         """Handle send:to: — deliver a symbol from one receiver to another.
 
         This is where 'dialogue is learning' becomes real.
@@ -958,7 +1887,7 @@ class Dispatcher:
 
         # Deferred resolution: if this symbol already has a pending collision, try to resolve now
         if sender_native and target_native and self._check_pending_collision(symbol_name) and self.llm:
-            synthesis = self._resolve_pending_collision(symbol_name)
+            synthesis = await self._aresolve_pending_collision(symbol_name)
             if synthesis:
                 lines.append(f"  COLLISION (deferred, now resolved): {sender_name} × {target_name} on {symbol_name}")
                 lines.append(f"  [COLLISION SYNTHESIS: {sender_name} × {target_name} on {symbol_name}]")
@@ -976,7 +1905,7 @@ class Dispatcher:
             lines.append(f"  {target_name} vocabulary: {sorted(target.local_vocabulary)}")
 
             # Attempt LLM synthesis if available
-            synthesis = self._synthesize_collision(sender_name, sender, target_name, target, symbol_name)
+            synthesis = await self._asynthesize_collision(sender_name, sender, target_name, target, symbol_name)
             if synthesis:
                 lines.append(f"  [COLLISION SYNTHESIS: {sender_name} × {target_name} on {symbol_name}]")
                 lines.append(f"  {synthesis}")
@@ -995,7 +1924,7 @@ class Dispatcher:
         else:
             # Foreign — the symbol is foreign to the target
             self._log_collision(target_name, symbol_name)
-            desc = self._generate_symbol_description(target_name, target, symbol_name)
+            desc = await self._agenerate_symbol_description(target_name, target, symbol_name)
             target.add_symbol(symbol_name, desc)
             self.vocab_manager.save(target_name, target.local_vocabulary, descriptions=target.descriptions)
             lines.append(f"  {symbol_name} is foreign to {target_name} — boundary collision")
@@ -1008,45 +1937,37 @@ class Dispatcher:
         return "\n".join(lines)
 
     def _load_pending_collision_symbols(self):
-        """Scan HelloWorld inbox for files with # Collision: header.
+        """Load pending collision symbols from the HelloWorld inbox registry.
 
-        Extracts symbol names into self.pending_collision_symbols.
-        Called from _bootstrap() after _resolve_parents().
+        Only message files the registry has not seen are read; the rest
+        is a directory listing. Called from _bootstrap() after _resolve_parents().
         """
-        hw_inbox = message_bus._inbox("HelloWorld")
-        for hw_file in hw_inbox.glob("msg-*.hw"):
-            try:
-                text = hw_file.read_text()
-            except Exception:
-                continue
-            for line in text.split("\n"):
-                if line.startswith("# Collision:"):
-                    # Extract symbol from the collision message body
-                    # Look for the symbol in subsequent lines
-                    for body_line in text.split("\n"):
-                        if "COLLISION:" in body_line and "#" in body_line:
-                            import re
-                            m = re.search(r"(#\w+)", body_line.split("COLLISION:")[-1])
-                            if m:
-                                self.pending_collision_symbols.add(m.group(1))
-                    break
+        self.pending_collision_symbols |= self.pending_collisions.sync()
 
     def _persist_synthesis(self, sender_name: str, target_name: str, symbol_name: str, synthesis: str):
         """Update both receivers' descriptions in-memory and on disk.
 
         Writes a collision synthesis description to both receivers' .hw files.
         """
-        desc = f"(collision synthesis with {'×'.join(sorted([sender_name, target_name]))}): {synthesis}"
+        self._persist_syntheses([(sender_name, target_name, symbol_name, synthesis)])
 
-        # Update sender
-        sender = self._get_or_create_receiver(sender_name)
-        sender.descriptions[symbol_name] = desc
-        self.vocab_manager.update_description(sender_name, symbol_name, desc)
+    def _persist_syntheses(self, results: List[Tuple[str, str, str, str]]):
+        """_persist_synthesis for many (sender, target, symbol, synthesis) results.
 
-        # Update target
-        target = self._get_or_create_receiver(target_name)
-        target.descriptions[symbol_name] = desc
-        self.vocab_manager.update_description(target_name, symbol_name, desc)
+        Each receiver's .hw file is rewritten once, however many of its
+        symbols changed.
+        """
+        updates: Dict[str, Dict[str, str]] = {}
+        for sender_name, target_name, symbol_name, synthesis in results:
+            desc = f"(collision synthesis with {'×'.join(sorted([sender_name, target_name]))}): {synthesis}"
+            updates.setdefault(sender_name, {})[symbol_name] = desc
+            updates.setdefault(target_name, {})[symbol_name] = desc
+
+        with self._synthesis_lock:
+            for name, descriptions in updates.items():
+                receiver = self._get_or_create_receiver(name)
+                receiver.descriptions.update(descriptions)
+                self.vocab_manager.update_descriptions(name, descriptions)
 
     def _send_collision_to_helloworld(self, collision_id: str, sender_name: str, target_name: str, symbol_name: str):
         """Format collision as .hw message and send to HelloWorld inbox.
@@ -1067,17 +1988,16 @@ class Dispatcher:
             f"{target_name} {symbol_name} -> \"{target_desc}\""
         )
 
-        # Send to HelloWorld inbox with collision header
+        # Send to HelloWorld inbox with collision header, registered under its symbol
         timestamp = datetime.now(timezone.utc).isoformat()
-        msg_id = f"msg-{uuid.uuid4().hex[:8]}"
-        hw_inbox = message_bus._inbox("HelloWorld")
-        msg_file = hw_inbox / f"{msg_id}.hw"
-        msg_file.write_text(
+        msg_id = message_bus._message_id()
+        self.pending_collisions.add(
+            collision_id, symbol_name, sender_name, target_name, f"{msg_id}.hw",
             f"# From: dispatcher\n"
             f"# Timestamp: {timestamp}\n"
             f"# Collision: {collision_id}\n"
             f"\n"
-            f"{body}\n"
+            f"{body}\n",
         )
 
         # Also send to invoking agent's inbox if sender is an agent
@@ -1089,85 +2009,123 @@ class Dispatcher:
         return symbol_name in self.pending_collision_symbols
 
     def _resolve_pending_collision(self, symbol_name: str) -> Optional[str]:
+        return self._drive(self._aresolve_pending_collision(symbol_name))
+
+    async def _aresolve_pending_collision(self, symbol_name: str) -> Optional[str]:
         """Attempt to resolve a pending collision if LLM is now available.
 
-        Scans HelloWorld inbox for the collision message, extracts parties,
-        synthesizes, persists, and removes the message.
+        Looks the collision up in the pending registry by symbol, then
+        synthesizes, persists, and removes the message with its entry.
         Returns synthesis text or None.
         """
         if not self.llm:
             return None
 
-        hw_inbox = message_bus._inbox("HelloWorld")
-        for hw_file in hw_inbox.glob("msg-*.hw"):
-            try:
-                text = hw_file.read_text()
-            except Exception:
-                continue
-            if "# Collision:" not in text:
-                continue
+        pending = self.pending_collisions.lookup(symbol_name)
+        if pending is None or not pending.sender:
+            if pending is None:
+                self.pending_collision_symbols.discard(symbol_name)
+            return None
+        sender_name, target_name = pending.sender, pending.target
 
-            # Check if this collision involves our symbol
-            import re
-            if symbol_name not in text:
-                continue
+        # Synthesize
+        try:
+            synthesis = await self._asynthesize_pair(sender_name, target_name, symbol_name)
+        except Exception:
+            return None
 
-            # Extract sender and target from the body
-            m = re.search(r"@(\w+) send: (#\w+) to: @(\w+)", text)
-            if not m or m.group(2) != symbol_name:
-                continue
+        # Persist
+        self._persist_synthesis(sender_name, target_name, symbol_name, synthesis)
 
-            sender_name = m.group(1)
-            target_name = m.group(3)
+        # Log as resolved
+        self._log_collision_status("RESOLVED", pending.collision_id, sender_name, target_name, symbol_name)
 
-            # Extract collision_id
-            cid_match = re.search(r"# Collision: (\w+)", text)
-            collision_id = cid_match.group(1) if cid_match else "unknown"
+        # Remove from HelloWorld inbox and the registry together
+        self.pending_collisions.remove(pending.collision_id)
+        if self.pending_collisions.lookup(symbol_name) is None:
+            self.pending_collision_symbols.discard(symbol_name)
 
-            # Synthesize
-            sender = self._get_or_create_receiver(sender_name)
-            target = self._get_or_create_receiver(target_name)
-            sender_vocab = sorted(sender.local_vocabulary)
-            target_vocab = sorted(target.local_vocabulary)
-            sender_desc = sender.description_of(symbol_name)
-            target_desc = target.description_of(symbol_name)
+        return synthesis
 
-            prompt = collision_prompt(
-                sender_name, sender_vocab, target_name, target_vocab,
-                symbol_name, sender_desc=sender_desc, target_desc=target_desc,
-            )
-            try:
-                synthesis = self.llm.call(prompt)
-            except Exception:
-                return None
+    async def _asynthesize_pair(self, sender_name: str, target_name: str, symbol_name: str) -> str:
+        """Ask the LLM for the synthesis of symbol_name between two receivers."""
+        sender = self._get_or_create_receiver(sender_name)
+        target = self._get_or_create_receiver(target_name)
+        prompt = collision_prompt(
+            sender_name, sorted(sender.local_vocabulary), target_name, sorted(target.local_vocabulary),
+            symbol_name, sender_desc=sender.description_of(symbol_name),
+            target_desc=target.description_of(symbol_name),
+        )
+        return await self._interpret(prompt)
 
-            # Persist
-            self._persist_synthesis(sender_name, target_name, symbol_name, synthesis)
+    async def _atry_synthesize_pair(self, sender_name: str, target_name: str, symbol_name: str) -> Optional[str]:
+        try:
+            return await self._asynthesize_pair(sender_name, target_name, symbol_name)
+        except Exception:
+            return None
 
-            # Log as resolved
-            self._log_collision_status("RESOLVED", collision_id, sender_name, target_name, symbol_name)
+    def _handle_resolve(self) -> str:
+        return self._drive(self._ahandle_resolve())
 
-            # Remove from HelloWorld inbox
-            try:
-                hw_file.unlink()
-            except FileNotFoundError:
-                pass
+    async def _ahandle_resolve(self) -> str:
+        """Handle `HelloWorld resolve` — synthesize every deferred collision at once.
 
-            # Remove from pending set
-            self.pending_collision_symbols.discard(symbol_name)
+        Pending collisions are grouped by (sender, target, symbol), so
+        repeats of one collision cost a single LLM call. The calls run
+        concurrently, at most resolve_workers at a time and started at
+        least resolve_interval apart. Syntheses are written with one .hw
+        update per receiver; failed ones stay pending.
+        """
+        registry = self.pending_collisions
+        self.pending_collision_symbols |= registry.sync()
+        groups: Dict[Tuple[str, str, str], List[collision_store.PendingCollision]] = {}
+        for pending in registry.pending():
+            if pending.sender:
+                groups.setdefault((pending.sender, pending.target, pending.symbol), []).append(pending)
+        if not groups:
+            return "[HelloWorld] No pending collisions."
+        if not self.llm:
+            count = sum(len(group) for group in groups.values())
+            return f"[HelloWorld] {count} pending collision(s). No LLM available to synthesize them."
 
-            return synthesis
+        keys = list(groups)
+        syntheses = await _Fanout(
+            [self._atry_synthesize_pair(*key) for key in keys],
+            self.resolve_workers, self.resolve_interval,
+        )
+        resolved = [(key, synthesis) for key, synthesis in zip(keys, syntheses) if synthesis is not None]
+        self._persist_syntheses([(*key, synthesis) for key, synthesis in resolved])
 
-        return None
+        lines = []
+        for (sender_name, target_name, symbol_name), synthesis in resolved:
+            for pending in groups[(sender_name, target_name, symbol_name)]:
+                self._log_collision_status("RESOLVED", pending.collision_id, sender_name, target_name, symbol_name)
+            lines.append(f"[HelloWorld] Collision resolved: {sender_name} × {target_name} on {symbol_name}\n"
+                         f"  {synthesis}")
+        registry.remove_many([p.collision_id for key, _ in resolved for p in groups[key]])
+        for symbol_name in {key[2] for key, _ in resolved}:
+            if registry.lookup(symbol_name) is None:
+                self.pending_collision_symbols.discard(symbol_name)
+
+        collisions = sum(len(groups[key]) for key, _ in resolved)
+        summary = f"[HelloWorld] Resolved {collisions} collision(s) with {len(resolved)} synthesis(es)."
+        if len(resolved) < len(keys):
+            summary += f" {len(keys) - len(resolved)} still pending."
+        return "\n".join(lines + [summary])
 
     def _log_collision_status(self, status: str, collision_id: str, sender_name: str, target_name: str, symbol_name: str):
         """Log a collision event with status (RESOLVED/UNRESOLVED)."""
         timestamp = datetime.now().isoformat()
-        log_entry = f"[{timestamp}] {status} COLLISION [{collision_id}]: {sender_name} x {target_name} on {symbol_name}\n"
-        with open(self.log_file, "a") as f:
-            f.write(log_entry)
+        log_entry = f"[{timestamp}] {status} COLLISION [{collision_id}]: {sender_name} x {target_name} on {symbol_name}"
+        self.collisions.record(
+            "collision", target_name, symbol_name, status=status.lower(), other=sender_name,
+            collision_id=collision_id, line=log_entry, ts=timestamp,
+        )
 
     def _synthesize_collision(self, sender_name: str, sender, target_name: str, target, symbol_name: str) -> Optional[str]:
+        return self._drive(self._asynthesize_collision(sender_name, sender, target_name, target, symbol_name))
+
+    async def _asynthesize_collision(self, sender_name: str, sender, target_name: str, target, symbol_name: str) -> Optional[str]:
         """Three-tier collision resolution cascade.
 
         Tier 1: LLM available → synthesize immediately, persist to both .hw files
@@ -1189,7 +2147,7 @@ class Dispatcher:
                 symbol_name, sender_desc=sender_desc, target_desc=target_desc,
             )
             try:
-                synthesis = self.llm.call(prompt)
+                synthesis = await self._interpret(prompt)
                 self._persist_synthesis(sender_name, target_name, symbol_name, synthesis)
                 self._log_collision_status("RESOLVED", collision_id, sender_name, target_name, symbol_name)
                 return synthesis
@@ -1204,6 +2162,9 @@ class Dispatcher:
         return None
 
     def _generate_symbol_description(self, receiver_name: str, receiver, symbol_name: str) -> Optional[str]:
+        return self._drive(self._agenerate_symbol_description(receiver_name, receiver, symbol_name))
+
+    async def _agenerate_symbol_description(self, receiver_name: str, receiver, symbol_name: str) -> Optional[str]:
         """Generate a description for a newly learned symbol via LLM.
 
         Returns a one-sentence description, or None if no LLM is available.
@@ -1212,7 +2173,7 @@ class Dispatcher:
         if not llm:
             return None
 
-        local_vocab = sorted(self._full_vocabulary(receiver))
+        local_vocab = receiver.effective_vocabulary()
         identity = self.vocab_manager.load_identity(receiver_name)
         identity_str = f" ({identity})" if identity else ""
 
@@ -1225,14 +2186,17 @@ class Dispatcher:
             f"Be concise. No quotes. No prefix. Just the description."
         )
         try:
-            return llm.call(prompt).strip()
+            return (await self._interpret(prompt, llm)).strip()
         except Exception:
             return None
 
     def _handle_definition(self, node: VocabularyDefinitionNode) -> str:
+        return self._drive(self._ahandle_definition(node))
+
+    async def _ahandle_definition(self, node: VocabularyDefinitionNode) -> str:
         receiver = self._get_or_create_receiver(node.receiver.name)
         for sym in node.symbols:
-            desc = self._generate_symbol_description(node.receiver.name, receiver, sym.name)
+            desc = await self._agenerate_symbol_description(node.receiver.name, receiver, sym.name)
             already_exists = sym.name in receiver.local_vocabulary
             receiver.add_symbol(sym.name, desc)
             if already_exists and desc:
@@ -1241,6 +2205,9 @@ class Dispatcher:
         return f"Updated {receiver.name} vocabulary."
 
     def _learn_symbols_from_message(self, receiver_name: str, receiver, node: MessageNode):
+        return self._drive(self._alearn_symbols_from_message(receiver_name, receiver, node))
+
+    async def _alearn_symbols_from_message(self, receiver_name: str, receiver, node: MessageNode):
         """Learn unknown symbols from message arguments (vocabulary drift).
 
         Called before handler dispatch so vocabulary grows through dialogue
@@ -1261,7 +2228,7 @@ class Dispatcher:
                 # Only learn truly unknown symbols (not native, not inherited)
                 if not receiver.has_symbol(symbol_name):
                     # Generate LLM description if available
-                    desc = self._generate_symbol_description(receiver_name, receiver, symbol_name)
+                    desc = await self._agenerate_symbol_description(receiver_name, receiver, symbol_name)
                     receiver.add_symbol(symbol_name, desc)
                     self._log_collision(receiver_name, symbol_name, context="message_args")
                     learned = True
@@ -1270,6 +2237,9 @@ class Dispatcher:
             self.vocab_manager.save(receiver_name, receiver.local_vocabulary, descriptions=receiver.descriptions)
 
     def _handle_message(self, node: MessageNode) -> str:
+        return self._drive(self._ahandle_message(node))
+
+    async def _ahandle_message(self, node: MessageNode) -> str:
         receiver_name = node.receiver.name
         receiver = self._get_or_create_receiver(receiver_name)
         parent = self._get_or_create_receiver("HelloWorld")
@@ -1278,7 +2248,7 @@ class Dispatcher:
         args_str = ", ".join([f"{k}: {self._node_val(v)}" for k, v in node.arguments.items()])
 
         # Always learn symbols first — vocabularies grow through dialogue
-        self._learn_symbols_from_message(receiver_name, receiver, node)
+        await self._alearn_symbols_from_message(receiver_name, receiver, node)
 
         # Cross-receiver delivery: send:to: triggers collision on target
         keywords = list(node.arguments.keys())
@@ -1287,13 +2257,13 @@ class Dispatcher:
             root_response = self.message_handler_registry.handle("HelloWorld", node, parent)
             if root_response:
                 print(root_response)
-            return self._handle_cross_receiver_send(receiver_name, receiver, node)
+            return await self._ahandle_cross_receiver_send(receiver_name, receiver, node)
 
         # HelloWorld run: Agent — the protocol running the agent
         if receiver_name == "HelloWorld" and keywords == ["run"]:
             agent_val = node.arguments.get("run")
             agent_name = agent_val.name if hasattr(agent_val, 'name') else str(agent_val)
-            return self._handle_run(agent_name)
+            return await self._ahandle_run(agent_name)
 
         # SEMANTIC LAYER: Try registered message handlers first for ALL receivers
         handler_response = self.message_handler_registry.handle(receiver_name, node, receiver)
@@ -1308,18 +2278,18 @@ class Dispatcher:
             
             # Try LLM first if enabled
             if self.llm:
-                local_vocab = sorted(self._full_vocabulary(receiver))
+                local_vocab = receiver.effective_vocabulary()
                 prompt = message_prompt(receiver_name, local_vocab, message_content)
                 print(f"🤖 LLM interpreting message for {receiver_name}...")
                 try:
-                    llm_response = self.llm.call(prompt)
+                    llm_response = await self._interpret(prompt)
                     return f"[{receiver_name}] {llm_response}"
                 except Exception as e:
                     print(f"⚠️  LLM interpretation failed: {e}")
             
             # Fallback to message bus (fire-and-forget)
             print(f"📡 Dispatching to {receiver_name} for interpretive response...")
-            local_vocab = sorted(self._full_vocabulary(receiver))
+            local_vocab = receiver.effective_vocabulary()
             context = f"Local Vocabulary: {local_vocab}"
             self.message_bus_send_and_wait("HelloWorld", receiver_name, message_content, context=context)
 
@@ -1347,14 +2317,13 @@ class Dispatcher:
         """
         # Log unknown event for evolution tracking
         timestamp = datetime.now().isoformat()
-        log_entry = f"[{timestamp}] UNKNOWN: {receiver_name} encountered {symbol_name}\n"
-        with open(self.log_file, "a") as f:
-            f.write(log_entry)
+        log_entry = f"[{timestamp}] UNKNOWN: {receiver_name} encountered {symbol_name}"
+        self.collisions.record("unknown", receiver_name, symbol_name, line=log_entry, ts=timestamp)
         
         # Try LLM research if available (fire-and-forget via message bus)
         if receiver_name in self.agents:
             print(f"📡 Asking {receiver_name} to research unknown symbol {symbol_name}...")
-            local_vocab = sorted(self._full_vocabulary(receiver))
+            local_vocab = receiver.effective_vocabulary()
             context = f"Local Vocabulary: {local_vocab}"
             prompt = f"research new symbol: {symbol_name}"
             self.message_bus_send_and_wait("HelloWorld", receiver_name, prompt, context=context)
@@ -1411,6 +2380,7 @@ class Dispatcher:
         if name not in self.registry:
             persisted = self.vocab_manager.load(name)
             receiver = Receiver(name, persisted if persisted else set())
+            receiver._cache = self.resolution_cache
             parent_name = self.vocab_manager.load_parent(name)
             if parent_name:
                 receiver._parent_name = parent_name
@@ -0,0 +1,236 @@
+"""HelloWorld pooled HTTP — keep-alive connections shared by the API clients.
+
+urllib.request opens a new connection, and for HTTPS a new TLS session,
+for every call. The Gemini model and the ClawNet transport talk to one
+host each, again and again, so this module keeps their connections open
+between requests:
+
+    from http_pool import urlopen
+    with urlopen(Request(url, data=body, method="POST"), timeout=30) as resp:
+        body = json.loads(resp.read())
+
+urlopen() takes the same Request objects and raises the same HTTPError
+and URLError as urllib's, so callers only change the import. On top of
+that it asks for gzip and decodes it, and retries transient failures
+(connection resets, 429, 502, 503, 504) with jittered exponential backoff.
+A request that may already have reached the server is retried only if
+its method is idempotent.
+"""
+
+import gzip
+import http.client
+import io
+import random
+import select
+import threading
+import time
+from collections import deque
+from email.message import Message as HeaderMessage
+from typing import Deque, Dict, Optional, Tuple, Union
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request
+
+IDEMPOTENT = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+REFUSED_STATUSES = frozenset({429, 503})    # the server did not act on the request
+
+HostKey = Tuple[str, str, int]
+
+
+class PooledResponse:
+    """A fully read response. Quacks like the object urllib's urlopen returns."""
+
+    def __init__(self, url: str, status: int, reason: str, headers: HeaderMessage, body: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = io.BytesIO(body)
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._body.read(amt)
+
+    def getcode(self) -> int:
+        return self.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def info(self) -> HeaderMessage:
+        return self.headers
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class HttpPool:
+    """Idle keep-alive connections per (scheme, host, port).
+
+    At most max_idle connections per host are kept between requests;
+    concurrent requests beyond that open extra connections, which are
+    closed when they finish. Idle connections the server has since
+    closed are discarded at checkout. One that turns out dropped anyway is
+    replaced without spending a retry, as long as the request cannot have
+    reached the server or is idempotent.
+    """
+
+    def __init__(self, max_idle: int = 4, timeout: float = 30.0, retries: int = 2,
+                 backoff: float = 0.25, max_backoff: float = 8.0):
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._idle: Dict[HostKey, Deque[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.opened = 0            # connections created, for tests and benchmarks
+
+    # --- Connections ---
+
+    def _checkout(self, key: HostKey, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """An idle connection to key, or a new one. The flag says whether it was reused."""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                conn = idle.pop() if idle else None
+                if conn is None:
+                    self.opened += 1
+                    break
+            if _dropped(conn):
+                conn.close()
+                continue
+            conn.timeout = timeout
+            conn.sock.settimeout(timeout)
+            return conn, True
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=timeout), False
+
+    def _checkin(self, key: HostKey, conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    # --- Requests ---
+
+    def urlopen(self, req: Union[Request, str], data: Optional[bytes] = None,
+                timeout: Optional[float] = None) -> PooledResponse:
+        """Send req over a pooled connection and read the whole response.
+
+        Raises HTTPError for a final status of 400 or more, URLError when
+        the host cannot be reached, like urllib.request.urlopen.
+        """
+        if isinstance(req, str):
+            req = Request(req, data=data)
+        elif data is not None:
+            req.data = data
+        url = req.full_url
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise URLError(f"unsupported scheme: {parts.scheme}")
+        key = (parts.scheme, parts.hostname or "", parts.port or (443 if parts.scheme == "https" else 80))
+        method = req.get_method()
+        headers = dict(req.header_items())
+        present = {name.lower() for name in headers}
+        if "accept-encoding" not in present:
+            headers["Accept-Encoding"] = "gzip"
+        if req.data is not None and "content-type" not in present:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"   # as urllib does
+        timeout = self.timeout if timeout is None else timeout
+
+        attempt = 0
+        while True:
+            conn, reused = self._checkout(key, timeout)
+            sent = False
+            try:
+                conn.request(method, req.selector, body=req.data, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                if (reused and (not sent or method in IDEMPOTENT)
+                        and isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError,
+                                           BrokenPipeError))):
+                    continue            # dropped while idle: try a fresh connection for free
+                if attempt < self.retries and (not sent or method in IDEMPOTENT):
+                    self._sleep(attempt, None)
+                    attempt += 1
+                    continue
+                raise URLError(e) from e
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            if resp.getheader("Content-Encoding", "").lower() == "gzip":
+                body = gzip.decompress(body)
+
+            status = resp.status
+            if (status in RETRY_STATUSES and attempt < self.retries
+                    and (status in REFUSED_STATUSES or method in IDEMPOTENT)):
+                self._sleep(attempt, resp.getheader("Retry-After"))
+                attempt += 1
+                continue
+            if status >= 400:
+                raise HTTPError(url, status, resp.reason, resp.msg, io.BytesIO(body))
+            return PooledResponse(url, status, resp.reason, resp.msg, body)
+
+    def _sleep(self, attempt: int, retry_after: Optional[str]):
+        """Full-jitter exponential backoff, or the server's Retry-After when it gives seconds."""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        if retry_after and retry_after.strip().isdigit():
+            delay = min(self.max_backoff, float(retry_after))
+        time.sleep(delay)
+
+
+def _dropped(conn: http.client.HTTPConnection) -> bool:
+    """Whether an idle connection is unusable: closed by the server, or holding unasked-for bytes.
+
+    An idle keep-alive socket has nothing to read until the server hangs up.
+    """
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+_shared: Optional[HttpPool] = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool() -> HttpPool:
+    """The process-wide pool, created on first use."""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = HttpPool()
+    return _shared
+
+
+def urlopen(req: Union[Request, str], data: Optional[bytes] = None,
+            timeout: Optional[float] = None) -> PooledResponse:
+    """urllib.request.urlopen over the shared keep-alive pool."""
+    return shared_pool().urlopen(req, data=data, timeout=timeout)
@@ -16,6 +16,7 @@ from datetime import datetime
 from typing import Optional
 
 from hw_reader import read_hw_file, read_hw_directory, save_hw_symbol, update_hw_symbol
+import collision_store
 import message_bus
 
 logger = logging.getLogger("helloworld.tools")
@@ -178,21 +179,21 @@ class HwTools:
         collision_type: str = "collision",
         context: Optional[str] = None,
     ) -> dict:
-        """Append a collision entry to collisions.log.
+        """Record a collision event (collision_store, mirrored to collisions.log).
 
         Returns:
-            dict with keys: logged, entry
+            dict with keys: logged, entry, id
         """
         timestamp = datetime.now().isoformat()
         entry = f"[{timestamp}] {collision_type.upper()}: {receiver_name} {symbol_name}"
         if context:
             entry += f" — {context}"
-        entry += "\n"
 
-        with open(self.log_file, "a") as f:
-            f.write(entry)
-
-        return {"logged": True, "entry": entry.strip()}
+        event_id = collision_store.for_log(self.log_file).record(
+            collision_type.lower(), receiver_name, symbol_name,
+            context=context, line=entry, ts=timestamp,
+        )
+        return {"logged": True, "entry": entry, "id": event_id}
 
     def message_send(
         self, sender: str, receiver: str, content: str
@@ -3,7 +3,7 @@
 import re
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Tuple
 
 
 class TokenType(Enum):
@@ -37,273 +37,188 @@ class Token:
     column: int
 
 
+# Markdown structure, recognized only at column 1: "## " before "# ".
+_MARKDOWN_RE = re.compile(r'(## |# |- )([^\n]*)')
+_MARKDOWN_TYPES = {
+    '## ': TokenType.HEADING2,
+    '# ': TokenType.HEADING1,
+    '- ': TokenType.LIST_ITEM,
+}
+
+# One alternative per token shape, roughly in order of frequency; tokens
+# sharing a first character keep the longer one first (## before #name,
+# :: before :). \w is exactly str.isalnum() plus '_', so identifier runs
+# match the old character-at-a-time scanner; start characters that \w
+# accepts but str.isalpha() does not (e.g. '²') are re-checked in code.
+_TOKEN_RE = re.compile(r"""
+    [ \t]*                                  # whitespace before any token
+    (?:
+      (?P<NEWLINE>\n)
+    | (?P<WORD>[^\W\d][\w—]*)
+    | (?P<DOUBLE_HASH>\#\#)
+    | (?P<SYMBOL>\#(?=[^ \t\n.,:\[\]→])[\w—]*)
+    | (?P<DOUBLE_COLON>::)
+    | (?P<PUNCT>[.\[\],:])
+    | (?P<STRING>'[^']*'?)
+    | (?P<HASH>\#)
+    | (?P<ARROW>→)
+    | (?P<AT>@)
+    | (?P<NUMBER>\d)                         # scanned by _scan_number
+    | (?P<COMMENT>"[^"]*"?)                 # Smalltalk-style "double-quote" comment
+    | (?P<HTML_COMMENT><!--.*?(?:-->|\Z))   # <!-- ... -->, possibly unterminated
+    | (?P<END>\Z)
+    )
+""", re.VERBOSE | re.DOTALL)
+_SPACE_RUN = re.compile(r'[ \t]*')
+
+_IDENTIFIER_RUN = re.compile(r'[\w—]*')
+_ALNUM_RUN = re.compile(r'[^\W_]*')
+_FRONTMATTER_CLOSE = re.compile(r'^---', re.MULTILINE)
+
+_FIXED_TOKENS = {
+    'DOUBLE_HASH': TokenType.DOUBLE_HASH,
+    'HASH': TokenType.HASH,
+    'ARROW': TokenType.ARROW,
+    'DOUBLE_COLON': TokenType.DOUBLE_COLON,
+}
+
+_PUNCTUATION = {
+    '.': TokenType.DOT,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
+    ',': TokenType.COMMA,
+    ':': TokenType.COLON,
+}
+
+
 class Lexer:
+    """Single-pass scanner driven by one compiled master pattern.
+
+    Line and column follow the historical rules exactly: only newlines in
+    whitespace, comments and frontmatter start a new line (a newline inside
+    a 'string' does not), and column counts characters since that line
+    start. tokenize() returns the full list; iter_tokens() yields the same
+    tokens lazily, which is what Parser.from_source consumes.
+    """
+
+    # Reserved keywords that are not identifiers
+    KEYWORDS = {'super': TokenType.SUPER}
+
     def __init__(self, source: str):
         self.source = source
         self.pos = 0
         self.line = 1
         self.column = 1
         self.tokens: List[Token] = []
-    
-    def tokenize(self) -> List[Token]:
-        self._skip_frontmatter()
-        while self.pos < len(self.source):
-            self._skip_whitespace_and_comments()
-
-            if self.pos >= len(self.source):
-                break
 
-            if self._match_markdown():
-                continue
-            if self._match_receiver():
-                continue
-            if self._match_symbol():
-                continue
-            if self._match_arrow():
-                continue
-            if self._match_string():
-                continue
-            if self._match_number():
-                continue
-            if self._match_punctuation():
-                continue
-            if self._match_identifier():
-                continue
-
-            raise SyntaxError(f"Unexpected character '{self.source[self.pos]}' at line {self.line}, column {self.column}")
-
-        self.tokens.append(Token(TokenType.EOF, '', self.line, self.column))
+    def tokenize(self) -> List[Token]:
+        self.tokens.extend(self.iter_tokens())
         return self.tokens
 
-    def _skip_frontmatter(self):
-        """Skip YAML/QMD frontmatter (--- delimited block) at start of source."""
-        if self.source[self.pos:self.pos + 3] == '---':
-            # Skip opening ---
-            self.pos += 3
-            self.column += 3
-            while self.pos < len(self.source) and self.source[self.pos] != '\n':
-                self._advance()
-            if self.pos < len(self.source):
-                self._advance()
-                self.line += 1
-                self.column = 1
-            # Skip until closing ---
-            while self.pos < len(self.source):
-                if self.column == 1 and self.source[self.pos:self.pos + 3] == '---':
-                    self.pos += 3
-                    self.column += 3
-                    while self.pos < len(self.source) and self.source[self.pos] != '\n':
-                        self._advance()
-                    if self.pos < len(self.source):
-                        self._advance()
-                        self.line += 1
-                        self.column = 1
-                    return
-                if self.source[self.pos] == '\n':
-                    self.line += 1
-                    self.column = 0
-                self._advance()
-
-    def _match_markdown(self) -> bool:
-        """Recognize Markdown structure at column 1: headings and list items."""
-        if self.column != 1:
-            return False
-
-        # ## name (HEADING2 — must check before single #)
-        if (self.source[self.pos:self.pos + 2] == '##'
-                and self.pos + 2 < len(self.source)
-                and self.source[self.pos + 2] == ' '):
-            col = self.column
-            self.pos += 3  # skip "## "
-            self.column += 3
-            start = self.pos
-            while self.pos < len(self.source) and self.source[self.pos] != '\n':
-                self._advance()
-            value = self.source[start:self.pos].strip()
-            self.tokens.append(Token(TokenType.HEADING2, value, self.line, col))
-            return True
-
-        # # Name (HEADING1 — only when followed by space then text)
-        if (self.source[self.pos] == '#'
-                and self.pos + 1 < len(self.source)
-                and self.source[self.pos + 1] == ' '):
-            col = self.column
-            self.pos += 2  # skip "# "
-            self.column += 2
-            start = self.pos
-            while self.pos < len(self.source) and self.source[self.pos] != '\n':
-                self._advance()
-            value = self.source[start:self.pos].strip()
-            self.tokens.append(Token(TokenType.HEADING1, value, self.line, col))
-            return True
-
-        # - text (LIST_ITEM)
-        if (self.source[self.pos] == '-'
-                and self.pos + 1 < len(self.source)
-                and self.source[self.pos + 1] == ' '):
-            col = self.column
-            self.pos += 2  # skip "- "
-            self.column += 2
-            start = self.pos
-            while self.pos < len(self.source) and self.source[self.pos] != '\n':
-                self._advance()
-            value = self.source[start:self.pos].strip()
-            self.tokens.append(Token(TokenType.LIST_ITEM, value, self.line, col))
-            return True
-
-        return False
-
-    def _match_receiver(self) -> bool:
-        """Legacy @name syntax — normalize to Capitalized bare word."""
-        if self.source[self.pos] == '@':
-            start = self.pos
-            col = self.column
-            self._advance()
-            if self.pos < len(self.source) and (self.source[self.pos].isalpha() or self.source[self.pos] == '_'):
-                name = self._read_identifier()
-                # Normalize: @guardian → Guardian (matches bare-word convention)
-                normalized = name[0].upper() + name[1:] if name else name
-                self.tokens.append(Token(TokenType.RECEIVER, normalized, self.line, col))
+    def iter_tokens(self) -> Iterator[Token]:
+        src = self.source
+        end = len(src)
+        pos, line, line_start = self._skip_frontmatter()
+        match = _TOKEN_RE.match
+
+        while pos < end:
+            if pos == line_start:
+                m = _MARKDOWN_RE.match(src, pos)
+                if m:
+                    pos = m.end()
+                    yield Token(_MARKDOWN_TYPES[m.group(1)], m.group(2).strip(), line, 1)
+                    continue
+
+            m = match(src, pos)
+            if m is None:
+                kind = None
+                start = _SPACE_RUN.match(src, pos).end()
             else:
-                # Bare @ → HelloWorld (the root receiver)
-                self.tokens.append(Token(TokenType.RECEIVER, 'HelloWorld', self.line, col))
-            return True
-        return False
-    
-    def _skip_whitespace_and_comments(self):
-        while self.pos < len(self.source):
-            if self.source[self.pos] in ' \t':
-                self._advance()
-            elif self.source[self.pos] == '\n':
-                self._advance()
-                self.line += 1
-                self.column = 1
-            elif self.source[self.pos] == '"':
-                # Smalltalk-style "double-quote" comments
-                self._advance()
-                while self.pos < len(self.source) and self.source[self.pos] != '"':
-                    if self.source[self.pos] == '\n':
-                        self.line += 1
-                        self.column = 0
-                    self._advance()
-                if self.pos < len(self.source):
-                    self._advance()  # consume closing "
-            elif self.source[self.pos:self.pos + 4] == '<!--':
-                # HTML comment: <!-- ... -->
-                self.pos += 4
-                self.column += 4
-                while self.pos < len(self.source):
-                    if self.source[self.pos:self.pos + 3] == '-->':
-                        self.pos += 3
-                        self.column += 3
-                        break
-                    if self.source[self.pos] == '\n':
-                        self.line += 1
-                        self.column = 0
-                    self._advance()
-            else:
-                break
-    
-    def _match_symbol(self) -> bool:
-        if self.source[self.pos] == '#':
-            start = self.pos
-            col = self.column
-            self._advance()
-            # ## — double hash (inherited vocabulary query)
-            if self.pos < len(self.source) and self.source[self.pos] == '#':
-                self._advance()
-                self.tokens.append(Token(TokenType.DOUBLE_HASH, '##', self.line, col))
-                return True
-            if self.pos < len(self.source) and self.source[self.pos] not in ' \t\n.,:[]→':
-                name = self._read_identifier()
-                self.tokens.append(Token(TokenType.SYMBOL, f'#{name}', self.line, col))
-            else:
-                self.tokens.append(Token(TokenType.HASH, '#', self.line, col))
-            return True
-        return False
-    
-    def _match_arrow(self) -> bool:
-        if self.source[self.pos] == '→':
-            self.tokens.append(Token(TokenType.ARROW, '→', self.line, self.column))
-            self._advance()
-            return True
-        return False
-    
-    def _match_string(self) -> bool:
-        if self.source[self.pos] == "'":
-            col = self.column
-            self._advance()
-            start = self.pos
-            while self.pos < len(self.source) and self.source[self.pos] != "'":
-                self._advance()
-            value = self.source[start:self.pos]
-            if self.pos < len(self.source):
-                self._advance()
-            self.tokens.append(Token(TokenType.STRING, value, self.line, col))
-            return True
-        return False
-    
-    def _match_number(self) -> bool:
-        if self.source[self.pos].isdigit():
-            col = self.column
-            start = self.pos
-            while self.pos < len(self.source) and (self.source[self.pos].isdigit() or self.source[self.pos] == '.'):
-                self._advance()
-            if self.pos < len(self.source) and self.source[self.pos].isalpha():
-                while self.pos < len(self.source) and self.source[self.pos].isalnum():
-                    self._advance()
-            value = self.source[start:self.pos]
-            self.tokens.append(Token(TokenType.NUMBER, value, self.line, col))
-            return True
-        return False
-    
-    def _match_punctuation(self) -> bool:
-        char = self.source[self.pos]
-        
-        # Check for double-char tokens first
-        if char == ':' and self.pos + 1 < len(self.source) and self.source[self.pos+1] == ':':
-            self.tokens.append(Token(TokenType.DOUBLE_COLON, '::', self.line, self.column))
-            self._advance()
-            self._advance()
-            return True
-
-        token_map = {
-            '.': TokenType.DOT,
-            '[': TokenType.LBRACKET,
-            ']': TokenType.RBRACKET,
-            ',': TokenType.COMMA,
-            ':': TokenType.COLON,
-        }
-        if char in token_map:
-            self.tokens.append(Token(token_map[char], char, self.line, self.column))
-            self._advance()
-            return True
-        return False
-    
-    # Reserved keywords that are not identifiers
-    KEYWORDS = {'super': TokenType.SUPER}
-
-    def _match_identifier(self) -> bool:
-        if self.source[self.pos].isalpha() or self.source[self.pos] == '_':
-            col = self.column
-            name = self._read_identifier()
-            # Check reserved keywords first
-            if name in self.KEYWORDS:
-                self.tokens.append(Token(self.KEYWORDS[name], name, self.line, col))
-            # Capitalized words are receivers (Smalltalk class convention)
-            elif name[0].isupper():
-                self.tokens.append(Token(TokenType.RECEIVER, name, self.line, col))
+                kind = m.lastgroup
+                start = m.start(kind)
+                pos = m.end()
+            column = start - line_start + 1
+
+            if kind == 'NEWLINE':
+                line_start = pos
+                line += 1
+            elif kind == 'WORD' and (src[start].isalpha() or src[start] == '_'):
+                name = m.group(kind)
+                if name in self.KEYWORDS:
+                    yield Token(self.KEYWORDS[name], name, line, column)
+                # Capitalized words are receivers (Smalltalk class convention)
+                elif name[0].isupper():
+                    yield Token(TokenType.RECEIVER, name, line, column)
+                else:
+                    yield Token(TokenType.IDENTIFIER, name, line, column)
+            elif kind == 'SYMBOL':
+                yield Token(TokenType.SYMBOL, m.group(kind), line, column)
+            elif kind == 'PUNCT':
+                char = m.group(kind)
+                yield Token(_PUNCTUATION[char], char, line, column)
+            elif kind in _FIXED_TOKENS:
+                yield Token(_FIXED_TOKENS[kind], m.group(kind), line, column)
+            elif kind == 'STRING':
+                text = m.group(kind)
+                closed = len(text) > 1 and text[-1] == "'"
+                yield Token(TokenType.STRING, text[1:-1] if closed else text[1:], line, column)
+            elif kind == 'COMMENT' or kind == 'HTML_COMMENT':
+                text = m.group(kind)
+                newlines = text.count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = start + text.rindex('\n') + 1
+            elif kind == 'AT':
+                # Legacy @name syntax — normalize to Capitalized bare word
+                if pos < end and (src[pos].isalpha() or src[pos] == '_'):
+                    name = _IDENTIFIER_RUN.match(src, pos).group()
+                    pos += len(name)
+                    yield Token(TokenType.RECEIVER, name[0].upper() + name[1:], line, column)
+                else:
+                    # Bare @ → HelloWorld (the root receiver)
+                    yield Token(TokenType.RECEIVER, 'HelloWorld', line, column)
+            elif kind == 'END':
+                pass
+            elif start < end and src[start].isdigit():
+                # \d digits, plus the rarer str.isdigit() ones such as '²'
+                pos = self._scan_number(start)
+                yield Token(TokenType.NUMBER, src[start:pos], line, column)
             else:
-                self.tokens.append(Token(TokenType.IDENTIFIER, name, self.line, col))
-            return True
-        return False
-    
-    def _read_identifier(self) -> str:
-        start = self.pos
-        while self.pos < len(self.source) and (self.source[self.pos].isalnum() or self.source[self.pos] in '_—'):
-            self._advance()
-        return self.source[start:self.pos]
-    
-    def _advance(self):
-        self.pos += 1
-        self.column += 1
+                self.pos, self.line, self.column = start, line, column
+                raise SyntaxError(f"Unexpected character '{src[start]}' at line {line}, column {column}")
+
+        self.pos, self.line, self.column = pos, line, pos - line_start + 1
+        yield Token(TokenType.EOF, '', self.line, self.column)
+
+    def _skip_frontmatter(self) -> Tuple[int, int, int]:
+        """Skip YAML/QMD frontmatter (--- delimited block) at start of source.
+
+        Returns (pos, line, line_start) for the first character after it.
+        """
+        src = self.source
+        if not src.startswith('---'):
+            return 0, 1, 0
+        # Skip the opening --- line
+        eol = src.find('\n', 3)
+        if eol < 0:
+            return len(src), 1, 0
+        # Skip until a line starting with the closing ---
+        close = _FRONTMATTER_CLOSE.search(src, eol + 1)
+        if close is None:
+            pos = len(src)
+        else:
+            eol = src.find('\n', close.end())
+            pos = len(src) if eol < 0 else eol + 1
+        line = 1 + src.count('\n', 0, pos)
+        line_start = src.rfind('\n', 0, pos) + 1
+        return pos, line, line_start
+
+    def _scan_number(self, pos: int) -> int:
+        """Return the end of the number at pos: digits and dots, then an optional unit (7.days)."""
+        src = self.source
+        end = len(src)
+        while pos < end and (src[pos].isdigit() or src[pos] == '.'):
+            pos += 1
+        if pos < end and src[pos].isalpha():
+            pos = _ALNUM_RUN.match(src, pos).end()
+        return pos
@@ -5,6 +5,7 @@ When GEMINI_API_KEY is set, calls the real Gemini REST API.
 When no key is present, falls back to mock responses for testing.
 """
 
+import asyncio
 import json
 import os
 import urllib.request
@@ -12,11 +13,17 @@ import urllib.error
 from typing import List, Dict, Optional, Any, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import http_pool
+
 
 class BaseLlm:
     def call(self, prompt: str, **kwargs) -> str:
         raise NotImplementedError
 
+    async def acall(self, prompt: str, **kwargs) -> str:
+        """Awaitable call. By default runs call() on a worker thread so the event loop stays free."""
+        return await asyncio.to_thread(self.call, prompt, **kwargs)
+
 
 def has_api_key() -> bool:
     """Check if a Gemini API key is available."""
@@ -45,7 +52,7 @@ class GeminiModel(BaseLlm):
         self.arguments = kwargs
 
     def _call_api(self, prompt: str) -> str:
-        """Make a real API call to Gemini."""
+        """Make a real API call to Gemini over a pooled keep-alive connection."""
         url = self.GEMINI_API_URL.format(model=self.model_name)
         url += f"?key={self.api_key}"
 
@@ -66,7 +73,7 @@ class GeminiModel(BaseLlm):
         )
 
         try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
+            with http_pool.urlopen(req, timeout=30) as resp:
                 body = json.loads(resp.read().decode("utf-8"))
                 candidates = body.get("candidates", [])
                 if candidates:
@@ -91,6 +98,17 @@ class GeminiModel(BaseLlm):
             return parser_func(response)
         return response
 
+    async def acall(self, prompt: str, parser_func: Optional[Callable] = None) -> str:
+        """Awaitable call. The REST request runs on a worker thread; mock responses return inline."""
+        if self.api_key:
+            response = await asyncio.to_thread(self._call_api, prompt)
+        else:
+            response = self._mock_call(prompt)
+
+        if parser_func:
+            return parser_func(response)
+        return response
+
     def _mock_call(self, prompt: str) -> str:
         """Mock response for testing without API key."""
         if "handle collision" in prompt or "collide on" in prompt:
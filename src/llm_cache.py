@@ -0,0 +1,306 @@
+"""HelloWorld LLM response cache — skip the round trip for prompts already answered.
+
+The prompt builders in prompts.py are deterministic for a given
+vocabulary state, so the same lookup asks the same question again and
+again. Models run at low temperature (ClaudeModel at 0.3), and a cached
+answer stands in for a fresh sample of one; HW_LLM_CACHE=0 turns this
+off where that matters. CachedLlm
+wraps any BaseLlm and answers repeats from an in-memory LRU, backed by
+a SQLite file so answers survive restarts and are shared by processes.
+
+    llm = CachedLlm(ClaudeModel())
+    llm.call(prompt)          # API round trip
+    llm.call(prompt)          # microseconds
+    llm.cache.stats()         # {"hits": 1, "misses": 1, "coalesced": 0, ...}
+
+Identical requests already in flight are not sent twice: callers that
+arrive while one is pending wait for it and share its answer (single
+flight), which matters when every agent looks up the same symbols at once.
+
+Entries are keyed by model, temperature, max_tokens, system prompt and
+the prompt with runs of whitespace collapsed, and expire after a TTL
+(HW_LLM_CACHE_TTL seconds, a day by default). HW_LLM_CACHE_DB moves the
+file from storage/llm_cache.db.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from llm import BaseLlm
+
+DEFAULT_DB = str(Path(__file__).resolve().parent.parent / "storage" / "llm_cache.db")
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def fingerprint(model: str, system: Optional[str], prompt: str) -> str:
+    """Cache key for one request. Whitespace differences do not change it."""
+    normalized = " ".join(prompt.split())
+    payload = json.dumps([model, system or "", normalized], ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class SingleFlight:
+    """Concurrent calls for one key share the result of the first.
+
+    Threads and coroutines can both join a flight, with one exception:
+    a thread never waits on a flight led by a coroutine, since it may be
+    the very thread running that coroutine's event loop. It makes its
+    own call instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, Tuple[Future, bool]] = {}   # key -> (result, led by a coroutine)
+        self.coalesced = 0
+
+    def _join(self, key: str, from_async: bool) -> Tuple[Optional[Future], bool]:
+        """(future, leading): the flight to wait on or to complete, or None to go alone."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                future = Future()
+                self._flights[key] = (future, from_async)
+                return future, True
+            future, led_by_async = flight
+            if led_by_async and not from_async:
+                return None, False
+            self.coalesced += 1
+            return future, False
+
+    def _land(self, key: str, future: Future, result=None, error: Optional[BaseException] = None):
+        with self._lock:
+            del self._flights[key]
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def do(self, key: str, fn: Callable[[], str]) -> str:
+        future, leading = self._join(key, from_async=False)
+        if future is None:
+            return fn()
+        if not leading:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._land(key, future, error=e)
+            raise
+        self._land(key, future, result)
+        return result
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[str]]) -> str:
+        future, leading = self._join(key, from_async=True)
+        if leading:
+            # The call runs as its own task, so cancelling the caller that started it leaves it flying
+            task = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._land_task(key, future, done))
+        # Shielded: a cancelled caller, leader or waiter, must not cancel the flight for everyone else
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _land_task(self, key: str, future: Future, task: "asyncio.Task"):
+        if task.cancelled():
+            self._land(key, future, error=asyncio.CancelledError())
+        elif task.exception() is not None:
+            self._land(key, future, error=task.exception())
+        else:
+            self._land(key, future, task.result())
+
+
+class LlmCache:
+    """Responses by fingerprint: an LRU dict in front of an optional SQLite table.
+
+    A memory miss falls through to disk, and a disk hit is promoted back
+    into memory. Expired entries count as misses and are dropped when
+    met; prune() clears the rest from disk. `flights` coalesces the
+    requests for keys that are still being answered.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = 1024,
+                 ttl: Optional[float] = DEFAULT_TTL):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.flights = SingleFlight()
+        self._conn = None
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def _expiry(self) -> float:
+        return time.time() + self.ttl if self.ttl else float("inf")
+
+    def get(self, key: str) -> Optional[str]:
+        """The cached response for key, or None. Counts a hit or a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._memory[key]
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT response, expires FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    self._remember(key, row[1], row[0])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0]
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+            self.misses += 1
+            return None
+
+    def put(self, key: str, response: str):
+        expires = self._expiry()
+        with self._lock:
+            self._remember(key, expires, response)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, expires) VALUES (?, ?, ?)",
+                    (key, response, expires),
+                )
+                self._conn.commit()
+
+    def _remember(self, key: str, expires: float, response: str):
+        # Caller holds self._lock
+        self._memory[key] = (expires, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def prune(self) -> int:
+        """Drop expired entries from disk. Returns how many were removed."""
+        if self._conn is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self):
+        """Forget every entry, in memory and on disk, and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.disk_hits = self.misses = self.flights.coalesced = 0
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "coalesced": self.flights.coalesced,     # duplicate calls saved
+                "entries": len(self._memory),
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CachedLlm(BaseLlm):
+    """A BaseLlm that answers repeated prompts from an LlmCache.
+
+    A miss joins the cache's in-flight request for the same key, if there
+    is one. Errors are never cached; callers waiting on a failed flight
+    all see its error. parser_func, when given, runs on the cached raw
+    response, so callers parsing differently share one entry. Anything
+    else is forwarded to the wrapped model.
+    """
+
+    def __init__(self, llm: BaseLlm, cache: Optional[LlmCache] = None):
+        self.llm = llm
+        self.cache = cache if cache is not None else shared_cache()
+
+    def __getattr__(self, name):
+        # Only reached for attributes CachedLlm does not define itself
+        llm = self.__dict__.get("llm")
+        if llm is None:
+            raise AttributeError(name)
+        return getattr(llm, name)
+
+    def _key(self, prompt: str, system: Optional[str]) -> str:
+        # Sampling settings are part of the model: a reply written for another budget is not this one's
+        model = (f"{type(self.llm).__name__}:{getattr(self.llm, 'model_name', '')}"
+                 f":t={getattr(self.llm, 'temperature', '')}:max={getattr(self.llm, 'max_tokens', '')}")
+        return fingerprint(model, system or getattr(self.llm, "system_prompt", None), prompt)
+
+    def call(self, prompt: str, parser_func: Optional[Callable] = None, **kwargs) -> str:
+        key = self._key(prompt, kwargs.get("system"))
+        response = self.cache.get(key)
+        if response is None:
+            def fetch():
+                answer = self.llm.call(prompt, **kwargs)
+                self.cache.put(key, answer)
+                return answer
+            response = self.cache.flights.do(key, fetch)
+        return parser_func(response) if parser_func else response
+
+    async def acall(self, prompt: str, parser_func: Optional[Callable] = None, **kwargs) -> str:
+        key = self._key(prompt, kwargs.get("system"))
+        response = self.cache.get(key)
+        if response is None:
+            async def fetch():
+                if inspect.iscoroutinefunction(getattr(self.llm, "acall", None)):
+                    answer = await self.llm.acall(prompt, **kwargs)
+                else:
+                    answer = await asyncio.to_thread(self.llm.call, prompt, **kwargs)
+                self.cache.put(key, answer)
+                return answer
+            response = await self.cache.flights.ado(key, fetch)
+        return parser_func(response) if parser_func else response
+
+
+_shared: Optional[LlmCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> LlmCache:
+    """The process-wide cache, configured from the environment on first use."""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                ttl = float(os.environ.get("HW_LLM_CACHE_TTL", DEFAULT_TTL))
+                _shared = LlmCache(os.environ.get("HW_LLM_CACHE_DB", DEFAULT_DB), ttl=ttl)
+    return _shared
+
+
+def cached(llm: BaseLlm) -> BaseLlm:
+    """Wrap llm in the shared cache, unless HW_LLM_CACHE=0 or it only returns mock responses."""
+    if os.environ.get("HW_LLM_CACHE", "1") == "0" or not getattr(llm, "api_key", None):
+        return llm
+    return CachedLlm(llm)
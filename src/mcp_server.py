@@ -75,7 +75,7 @@ def _detect_verb(content: str) -> tuple:
 async def _helloworld_daemon():
     """Background loop: @HelloWorld receiver daemon.
 
-    Polls the @HelloWorld inbox. Handles hello/goodbye as registry
+    Waits on the @HelloWorld inbox. Handles hello/goodbye as registry
     mutations. Other messages go through Claude API or structural dispatch.
     """
     logger.info("@HelloWorld daemon started")
@@ -96,9 +96,8 @@ async def _helloworld_daemon():
 
     while True:
         try:
-            msg = message_bus.receive("@HelloWorld")
-            if msg is None:
-                msg = message_bus.receive("HelloWorld")
+            # @HelloWorld and HelloWorld share one inbox; wake as soon as it fills
+            msg = await message_bus.areceive("HelloWorld", timeout=1.0)
 
             if msg and msg.sender != "HelloWorld":
                 logger.info("@HelloWorld received from %s: %s",
@@ -134,14 +133,14 @@ async def _helloworld_daemon():
                             f"Network: [{network_ctx}]\n"
                             f"From {msg.sender}:\n{msg.content}"
                         )
-                        response = llm.call(prompt)
+                        response = await llm.acall(prompt)
                     except Exception as e:
                         logger.error("@HelloWorld LLM error: %s", e)
                         response = "acknowledged"
                 else:
                     # Structural dispatch fallback
                     try:
-                        results = _dispatcher.dispatch_source(msg.content)
+                        results = await _dispatcher.adispatch_source(msg.content)
                         response = "; ".join(str(r) for r in results) if results else "acknowledged"
                     except Exception:
                         response = "acknowledged"
@@ -151,8 +150,7 @@ async def _helloworld_daemon():
 
         except Exception as e:
             logger.error("@HelloWorld daemon error: %s", e)
-
-        await asyncio.sleep(1)
+            await asyncio.sleep(1)   # back off rather than spin on a failing transport
 
 
 @asynccontextmanager
@@ -221,16 +219,19 @@ _registry = NetworkRegistry()
 
 
 @mcp.tool()
-def dispatch(source: str) -> dict:
+def dispatch(source: str, concurrency: int = 1) -> dict:
     """Parse and execute HelloWorld source code.
 
+    concurrency > 1 runs read-only statements on different receivers in
+    parallel; results keep their source order.
+
     Examples:
         dispatch("@claude")           -> Claude's vocabulary
         dispatch("@claude.#observe")  -> What #observe means to Claude
         dispatch("@copilot say: #build 'let us build'")
     """
     logger.info("dispatch: %s", source[:200])
-    results = _dispatcher.dispatch_source(source)
+    results = list(_dispatcher.dispatch_stream(source, concurrency=max(1, concurrency)))
     return {
         "source": source,
         "results": [str(r) for r in results],
@@ -1,8 +1,13 @@
-"""HelloWorld Memory Bus — per-agent store/recall backed by QMD.
+"""HelloWorld Memory Bus — per-agent store/recall with a local BM25 index.
 
 Each agent gets its own memory directory under runtimes/<agent>/memory/.
-Files are markdown with YAML frontmatter. QMD provides hybrid search
-(BM25 + vector + LLM re-ranking) when installed; store/get work without it.
+Files are markdown with YAML frontmatter. recall() searches them in-process
+with a BM25 index kept in SQLite FTS5 (runtimes/<agent>/memory_index.db),
+which store() updates as it writes, fused with embedding similarity when
+NumPy is installed (memory_vectors.py). QMD's hybrid search (BM25 + vector +
+LLM re-ranking) remains available as a backend: pass backend="qmd" or set
+HW_MEMORY_BACKEND=qmd. Busy agents can keep memories in an append-only
+segment log instead of one file each (storage="log", see memory_log.py).
 
     from memory_bus import MemoryBus
     mem = MemoryBus("non_serviam")
@@ -10,19 +15,26 @@ Files are markdown with YAML frontmatter. QMD provides hybrid search
     mem.recall("how does severith communicate")
 """
 
+import bisect
 import fnmatch
 import hashlib
 import json
 import os
 import re
 import shutil
+import sqlite3
 import subprocess
-from dataclasses import dataclass, field
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+import memory_vectors
 import message_bus  # for BASE_DIR
+from memory_log import MemoryLog, log_for
+from memory_vectors import HashingEmbedder, VectorMatrix, fuse
 
 
 class QMDNotFoundError(RuntimeError):
@@ -39,6 +51,11 @@ class MemoryResult:
 
 
 _VALID_MODES = {"query", "search", "vsearch"}
+_BACKENDS = {"local", "qmd"}
+_STORAGES = {"files", "log"}
+_MEMORY_SUFFIXES = (".hw", ".md")
+_RACY_NS = 2_000_000_000   # coarsest directory mtime step we allow for (FAT and HFS+ are 1-2 s)
+_RESCAN_NS = 30_000_000_000  # full stat scan at least this often, for edits that leave the directory mtime alone
 
 _QMD_SEARCH_PATHS = [
     os.path.expanduser("~/.bun/bin/qmd"),
@@ -127,77 +144,572 @@ class MemoryEntry:
     content: str = ""
 
 
+def _read_entry(p: Path) -> Optional[MemoryEntry]:
+    """Parse one memory file, or None if it cannot be read."""
+    try:
+        text = p.read_text()
+    except OSError:
+        return None
+    return _parse_entry(p, text)
+
+
+def _parse_entry(p: Path, text: str) -> MemoryEntry:
+    """Parse memory text stored at (or, in a log, named after) p."""
+    meta, content = _parse_frontmatter(text)
+    tags_raw = meta.get("tags", [])
+    if isinstance(tags_raw, str):
+        tags_raw = [t.strip() for t in tags_raw.split(",")]
+    return MemoryEntry(
+        path=p,
+        title=meta.get("title", p.stem),
+        created=meta.get("created"),
+        updated=meta.get("updated"),
+        tags=tags_raw,
+        content=content,
+    )
+
+
+def _mtime_ns(path: Path) -> int:
+    """A file or directory's mtime in ns, 0 if it is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _recheck_after(mtime: int, scanned_at: int) -> int:
+    """When a scan of a directory with this mtime, started at scanned_at, must be repeated; 0 if never.
+
+    Filesystem clocks are coarse, so a write landing in the same tick as
+    the scan leaves the directory's mtime unchanged. A scan made while
+    the mtime was that fresh is trusted only until the tick has surely
+    passed, then done once more.
+    """
+    return mtime + _RACY_NS if scanned_at - mtime <= _RACY_NS else 0
+
+
+def _stale(mtime: int, scanned_mtime: Optional[int], recheck_after: int, scanned_at: int) -> bool:
+    """Whether a directory now at mtime, last scanned in full at scanned_at, needs a rescan.
+
+    Rewriting a file in place changes the file's mtime but not the
+    directory's, so the directory's mtime alone would miss it forever.
+    """
+    now = time.time_ns()
+    return (mtime != scanned_mtime or bool(recheck_after and now > recheck_after)
+            or now - scanned_at > _RESCAN_NS)
+
+
 class MemoryIndex:
-    """Pure-Python structured queries over .hw/.md memory files."""
+    """Pure-Python structured queries over .hw/.md memory files.
+
+    Maintained incrementally. A query first checks the directory's mtime
+    and, if it moved, re-reads only the files whose (mtime, size) changed.
+    A file rewritten in place leaves the directory's mtime alone, so such
+    edits are seen at the next full scan, made at least every _RESCAN_NS.
+    add() takes a file just written without rescanning. Tags map to
+    postings of file names, and (created, name) pairs are kept sorted,
+    so by_tag() intersects sets and recent(n) reads n off the end.
+
+    Given a MemoryLog, it indexes the log's records instead of files, and
+    a query reads only the records appended since the last one, dropping
+    removed ones when the log's generation moves.
+    """
 
-    def __init__(self, memory_dir: Path):
+    def __init__(self, memory_dir: Path, log: Optional[MemoryLog] = None):
         self._memory_dir = memory_dir
-        self._entries: Optional[List[MemoryEntry]] = None
-
-    def refresh(self) -> None:
-        """Re-scan directory and rebuild the index."""
-        entries = []
-        if not self._memory_dir.is_dir():
-            self._entries = entries
+        self._log = log
+        self._log_seq = 0
+        self._log_generation = 0
+        self._entries: Optional[Dict[str, MemoryEntry]] = None   # file name -> entry
+        self._stamps: Dict[str, Tuple[int, int]] = {}             # file name -> (mtime_ns, size) or (seq, 0)
+        self._names: List[str] = []                               # sorted file names
+        self._tags: Dict[str, Set[str]] = {}                      # tag -> file names
+        self._by_created: List[Tuple[str, str]] = []              # sorted (created, file name)
+        self._dir_mtime = 0
+        self._recheck_after = 0
+        self._scanned_at = 0
+        self._lock = threading.RLock()
+
+    def _insert(self, name: str, entry: MemoryEntry, stamp: Tuple[int, int]) -> None:
+        # Caller holds self._lock
+        self._discard(name)
+        self._entries[name] = entry
+        self._stamps[name] = stamp
+        bisect.insort(self._names, name)
+        for tag in entry.tags:
+            self._tags.setdefault(tag, set()).add(name)
+        bisect.insort(self._by_created, (entry.created or "", name))
+
+    def _discard(self, name: str) -> None:
+        # Caller holds self._lock
+        entry = self._entries.pop(name, None)
+        if entry is None:
             return
+        del self._stamps[name]
+        del self._names[bisect.bisect_left(self._names, name)]
+        for tag in entry.tags:
+            postings = self._tags.get(tag)
+            if postings is not None:
+                postings.discard(name)
+                if not postings:
+                    del self._tags[tag]
+        del self._by_created[bisect.bisect_left(self._by_created, (entry.created or "", name))]
 
-        for p in sorted(self._memory_dir.iterdir()):
-            if p.suffix not in (".hw", ".md"):
-                continue
+    def refresh(self) -> None:
+        """Re-scan the directory, re-reading only files added or changed since the last scan."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = {}
+            if self._log is not None:
+                generation = self._log.version()[1]
+                if generation != self._log_generation:
+                    live = self._log.names()
+                    for name in [n for n in self._names if n not in live]:
+                        self._discard(name)
+                    self._log_generation = generation
+                for seq, name, text in self._log.since(self._log_seq):
+                    self._insert(name, _parse_entry(self._memory_dir / name, text), (seq, 0))
+                    self._log_seq = seq
+                return
+            started = time.time_ns()
+            mtime = _mtime_ns(self._memory_dir)
+            seen = set()
             try:
-                text = p.read_text()
+                scan = list(os.scandir(self._memory_dir))
             except OSError:
-                continue
-            meta, content = _parse_frontmatter(text)
-            tags_raw = meta.get("tags", [])
-            if isinstance(tags_raw, str):
-                tags_raw = [t.strip() for t in tags_raw.split(",")]
-            entries.append(MemoryEntry(
-                path=p,
-                title=meta.get("title", p.stem),
-                created=meta.get("created"),
-                updated=meta.get("updated"),
-                tags=tags_raw,
-                content=content,
-            ))
-        self._entries = entries
-
-    def _ensure_loaded(self) -> List[MemoryEntry]:
-        if self._entries is None:
-            self.refresh()
-        return self._entries  # type: ignore[return-value]
+                scan = []
+            for item in scan:
+                if not item.name.endswith(_MEMORY_SUFFIXES) or not item.is_file():
+                    continue
+                try:
+                    st = item.stat()
+                except OSError:
+                    continue
+                seen.add(item.name)
+                stamp = (st.st_mtime_ns, st.st_size)
+                if self._stamps.get(item.name) == stamp:
+                    continue
+                entry = _read_entry(Path(item.path))
+                if entry is not None:
+                    self._insert(item.name, entry, stamp)
+            for name in [n for n in self._names if n not in seen]:
+                self._discard(name)
+            self._dir_mtime = mtime
+            self._recheck_after = _recheck_after(mtime, started)
+            self._scanned_at = started
+
+    def add(self, path: Path, dir_mtime_before: Optional[int] = None) -> None:
+        """Index a file just written to the memory directory.
+
+        dir_mtime_before is the directory's mtime from just before the
+        write. If it matches the last scan, the next query skips its scan.
+        """
+        path = Path(path)
+        with self._lock:
+            if self._entries is None or self._log is not None:
+                return              # nothing loaded yet, or the next query reads the log
+            try:
+                st = path.stat()
+            except OSError:
+                return
+            entry = _read_entry(path)
+            if entry is None:
+                return
+            self._insert(path.name, entry, (st.st_mtime_ns, st.st_size))
+            if dir_mtime_before and dir_mtime_before == self._dir_mtime:
+                now = time.time_ns()
+                self._dir_mtime = _mtime_ns(self._memory_dir)
+                self._recheck_after = max(self._recheck_after, _recheck_after(self._dir_mtime, now))
+
+    def _ensure_loaded(self) -> Dict[str, MemoryEntry]:
+        with self._lock:
+            if self._entries is None:
+                self.refresh()
+            elif self._log is not None:
+                last_seq, generation = self._log.version()
+                if last_seq > self._log_seq or generation != self._log_generation:
+                    self.refresh()
+            elif _stale(_mtime_ns(self._memory_dir), self._dir_mtime, self._recheck_after, self._scanned_at):
+                self.refresh()
+            return self._entries  # type: ignore[return-value]
 
     def all(self) -> List[MemoryEntry]:
         """Return all memory entries."""
-        return list(self._ensure_loaded())
+        with self._lock:
+            entries = self._ensure_loaded()
+            return [entries[name] for name in self._names]
 
     def titles(self) -> List[str]:
         """Quick listing of all memory titles."""
-        return [e.title for e in self._ensure_loaded()]
+        return [e.title for e in self.all()]
 
     def by_tag(self, *tags: str) -> List[MemoryEntry]:
         """Return entries matching ALL given tags (AND)."""
-        tag_set = set(tags)
-        return [e for e in self._ensure_loaded() if tag_set <= set(e.tags)]
+        if not tags:
+            return self.all()
+        with self._lock:
+            entries = self._ensure_loaded()
+            postings = sorted((self._tags.get(t, set()) for t in set(tags)), key=len)
+            names = set(postings[0]).intersection(*postings[1:])
+            return [entries[name] for name in sorted(names)]
 
     def by_title(self, pattern: str) -> List[MemoryEntry]:
         """Return entries whose title matches pattern (substring or glob)."""
         lowered = pattern.lower()
         # If pattern contains glob chars, use fnmatch
         if any(c in pattern for c in "*?[]"):
-            return [e for e in self._ensure_loaded()
+            return [e for e in self.all()
                     if fnmatch.fnmatch(e.title.lower(), lowered)]
         # Otherwise substring match
-        return [e for e in self._ensure_loaded()
+        return [e for e in self.all()
                 if lowered in e.title.lower()]
 
     def recent(self, n: int = 5) -> List[MemoryEntry]:
         """Return the n most recently created entries (by created desc)."""
-        entries = self._ensure_loaded()
-        # Sort by created descending; entries without created go last
-        with_date = [(e, e.created or "") for e in entries]
-        with_date.sort(key=lambda x: x[1], reverse=True)
-        return [e for e, _ in with_date[:n]]
+        with self._lock:
+            entries = self._ensure_loaded()
+            order = self._by_created
+            # Newest first; entries without created go last, ties in name order
+            out: List[MemoryEntry] = []
+            end = len(order)
+            while end > 0 and len(out) < n:
+                start = end - 1
+                while start > 0 and order[start - 1][0] == order[end - 1][0]:
+                    start -= 1
+                out.extend(entries[name] for _, name in order[start:end])
+                end = start
+            return out[:n]
+
+
+class FullTextIndex:
+    """BM25 search over one memory directory, in a SQLite FTS5 table.
+
+    The index file sits beside the directory, not in it, so QMD never
+    indexes it. add() keeps it current for memories this process writes;
+    sync() picks up files that others wrote, changed or deleted. sync()
+    compares (mtime, size) per file, and is skipped while the directory's
+    own mtime is unchanged since the last one. A file rewritten in place
+    leaves that mtime alone, so sync() also scans in full at least every
+    _RESCAN_NS; until then such an edit is not searchable.
+
+    Given a MemoryLog, it indexes the log's records instead, in search.db
+    inside the log directory, and sync() reads the records appended since.
+
+    With NumPy installed, every memory also gets an embedding, kept as a
+    row of a memory-mapped matrix in a .vec file beside the database
+    (see memory_vectors.py). files.vec_row points at it; rows left behind
+    by changed or deleted files are skipped until embed(force=True)
+    rebuilds the matrix.
+    """
+
+    def __init__(self, memory_dir: Path, db_path: Optional[Path] = None,
+                 log: Optional[MemoryLog] = None, embedder=None):
+        self.memory_dir = Path(memory_dir)
+        self.log = log
+        if db_path:
+            self.db_path = Path(db_path)
+        elif log is not None:
+            self.db_path = log.log_dir / "search.db"
+        else:
+            self.db_path = self.memory_dir.parent / "memory_index.db"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        try:
+            self._create_schema()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+        self.embedder = None
+        self.vectors: Optional[VectorMatrix] = None
+        self.use_embedder(embedder or HashingEmbedder())
+
+    def _create_schema(self) -> None:
+        """Raises sqlite3.OperationalError where SQLite was built without FTS5."""
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "  id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL,"
+            "  mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, vec_row INTEGER);"
+            "CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5("
+            "  title, tags, content, tokenize='porter unicode61');"
+            "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value);"
+        )
+        if "vec_row" not in {row[1] for row in self._conn.execute("PRAGMA table_info(files)")}:
+            self._conn.execute("ALTER TABLE files ADD COLUMN vec_row INTEGER")
+        self._conn.executescript(
+            "CREATE INDEX IF NOT EXISTS idx_files_vec_row ON files (vec_row);"
+            "CREATE INDEX IF NOT EXISTS idx_files_unembedded ON files (id) WHERE vec_row IS NULL;"
+        )
+        self._conn.commit()
+
+    def use_embedder(self, embedder) -> None:
+        """Embed with embedder from now on. Re-embeds everything if it differs from the stored one."""
+        with self._lock:
+            if self.embedder is not None and embedder.name == self.embedder.name:
+                return
+            self.embedder = embedder
+            if not memory_vectors.available():
+                return
+            self.vectors = VectorMatrix(self.db_path.with_suffix(".vec"), embedder.dim)
+            stored = dict(self._conn.execute("SELECT key, value FROM state")).get("embedder")
+            if stored != embedder.name:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.execute("UPDATE files SET vec_row = NULL")
+                self._conn.execute("INSERT OR REPLACE INTO state (key, value) VALUES ('embedder', ?)",
+                                   (embedder.name,))
+                self.vectors.reset()
+                self._conn.commit()
+
+    def _state(self) -> Tuple[Optional[int], int, int]:
+        """(directory mtime at the last sync, when that sync must be repeated, when it ran)."""
+        rows = dict(self._conn.execute("SELECT key, value FROM state"))
+        return rows.get("dir_mtime_ns"), rows.get("recheck_after_ns", 0), rows.get("scanned_at_ns", 0)
+
+    def _set_state(self, mtime: int, recheck_after: int, scanned_at: Optional[int] = None) -> None:
+        rows = [("dir_mtime_ns", mtime), ("recheck_after_ns", recheck_after)]
+        if scanned_at is not None:
+            rows.append(("scanned_at_ns", scanned_at))
+        self._conn.executemany("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", rows)
+
+    def _put(self, name: str, entry: Optional[MemoryEntry], mtime_ns: int, size: int) -> None:
+        # Caller holds self._lock and commits
+        if entry is None:
+            return
+        self._drop(name)
+        cur = self._conn.execute(
+            "INSERT INTO files (name, mtime_ns, size) VALUES (?, ?, ?)",
+            (name, mtime_ns, size),
+        )
+        self._conn.execute(
+            "INSERT INTO docs (rowid, title, tags, content) VALUES (?, ?, ?, ?)",
+            (cur.lastrowid, entry.title, " ".join(entry.tags), entry.content),
+        )
+
+    def _drop(self, name: str) -> None:
+        # Caller holds self._lock and commits
+        row = self._conn.execute("SELECT id FROM files WHERE name = ?", (name,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM docs WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM files WHERE id = ?", (row[0],))
+
+    def add(self, path: Path, dir_mtime_before: Optional[int] = None) -> None:
+        """Index a file just written to the memory directory.
+
+        dir_mtime_before is the directory's mtime from just before the
+        write. If it matches the last sync, the next search skips its sync.
+        """
+        path = Path(path)
+        with self._lock:
+            try:
+                st = path.stat()
+            except OSError:
+                return
+            self._put(path.name, _read_entry(path), st.st_mtime_ns, st.st_size)
+            synced, recheck, _ = self._state()
+            if dir_mtime_before and dir_mtime_before == synced:
+                now = time.time_ns()
+                mtime = _mtime_ns(self.memory_dir)
+                self._set_state(mtime, max(recheck, _recheck_after(mtime, now)))
+            self._embed_missing()
+            self._conn.commit()
+
+    def sync(self) -> int:
+        """Reconcile the index with the directory. Returns the files (re)indexed or dropped."""
+        if self.log is not None:
+            return self._sync_log()
+        started = time.time_ns()
+        mtime = _mtime_ns(self.memory_dir)
+        with self._lock:
+            if not _stale(mtime, *self._state()):
+                return 0
+            known = {name: (m, size) for name, m, size in
+                     self._conn.execute("SELECT name, mtime_ns, size FROM files")}
+            changed = 0
+            try:
+                scan = list(os.scandir(self.memory_dir))
+            except OSError:
+                scan = []
+            for entry in scan:
+                if not entry.name.endswith(_MEMORY_SUFFIXES) or not entry.is_file():
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if known.pop(entry.name, None) != (st.st_mtime_ns, st.st_size):
+                    self._put(entry.name, _read_entry(Path(entry.path)), st.st_mtime_ns, st.st_size)
+                    changed += 1
+            for name in known:
+                self._drop(name)
+                changed += 1
+            self._set_state(mtime, _recheck_after(mtime, started), started)
+            self._embed_missing()
+            self._conn.commit()
+            return changed
+
+    def _sync_log(self) -> int:
+        """Index the log records appended, and drop those removed, since the last sync. Returns how many."""
+        with self._lock:
+            state = dict(self._conn.execute("SELECT key, value FROM state"))
+            seq, generation = state.get("log_seq", 0), state.get("log_generation", 0)
+            last_seq, current = self.log.version()
+            if last_seq <= seq and current == generation:
+                return 0
+            changed = 0
+            if current != generation:
+                live = self.log.names()
+                for (name,) in self._conn.execute("SELECT name FROM files").fetchall():
+                    if name not in live:
+                        self._drop(name)
+                        changed += 1
+            for seq, name, text in self.log.since(seq):
+                self._put(name, _parse_entry(self.memory_dir / name, text), seq, len(text))
+                changed += 1
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                [("log_seq", seq), ("log_generation", current)],
+            )
+            self._embed_missing()
+            self._conn.commit()
+            return changed
+
+    def search(self, query: str, n: int = 5) -> List[MemoryResult]:
+        """The n best BM25 matches for any of the query's words, best first."""
+        words = re.findall(r"\w+", query.lower())
+        if not words:
+            return []
+        self.sync()
+        match = " OR ".join(f'"{w}"' for w in dict.fromkeys(words))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT f.name, bm25(docs, 2.0, 1.5, 1.0) AS rank, docs.title,"
+                " snippet(docs, 2, '', '', '...', 24)"
+                " FROM docs JOIN files f ON f.id = docs.rowid"
+                " WHERE docs MATCH ? ORDER BY rank LIMIT ?",
+                (match, n),
+            ).fetchall()
+        # bm25() is negative, lower is better; flip it so higher scores win as in QMD
+        return [
+            MemoryResult(path=str(self.memory_dir / name), score=-rank,
+                         snippet=snippet, title=title, docid=name)
+            for name, rank, title, snippet in rows
+        ]
+
+    def _embed_missing(self) -> int:
+        """Embed the memories without a vector row. Returns how many.
+
+        Caller holds self._lock and commits. New rows are numbered from
+        the .vec file's size, so this runs under the SQLite write lock.
+        """
+        if self.vectors is None:
+            return 0
+        if self._conn.execute("SELECT 1 FROM files WHERE vec_row IS NULL LIMIT 1").fetchone() is None:
+            return 0
+        if not self._conn.in_transaction:
+            self._conn.execute("BEGIN IMMEDIATE")
+        rows = self._conn.execute(
+            "SELECT f.id, docs.title, docs.tags, docs.content"
+            " FROM files f JOIN docs ON docs.rowid = f.id WHERE f.vec_row IS NULL"
+        ).fetchall()
+        for start in range(0, len(rows), 256):
+            batch = rows[start:start + 256]
+            first = self.vectors.append(self.embedder.embed(
+                [f"{title}\n{tags}\n{content}" for _, title, tags, content in batch]))
+            self._conn.executemany(
+                "UPDATE files SET vec_row = ? WHERE id = ?",
+                [(first + i, row[0]) for i, row in enumerate(batch)],
+            )
+        return len(rows)
+
+    def embed(self, force: bool = False) -> int:
+        """Embed memories that have no vector yet; with force, rebuild the matrix. Returns how many."""
+        if self.vectors is None:
+            return 0
+        self.sync()
+        with self._lock:
+            if force:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.execute("UPDATE files SET vec_row = NULL")
+                self.vectors.reset()
+            embedded = self._embed_missing()
+            self._conn.commit()
+            return embedded
+
+    def _results_for_rows(self, hits: List[Tuple[int, float]]) -> List[MemoryResult]:
+        # Caller holds self._lock. Rows no file points at any more are dropped.
+        found = {}
+        rows = [row for row, _ in hits]
+        for start in range(0, len(rows), 500):
+            chunk = rows[start:start + 500]
+            found.update((row[0], row[1:]) for row in self._conn.execute(
+                "SELECT f.vec_row, f.name, docs.title, substr(docs.content, 1, 200)"
+                " FROM files f JOIN docs ON docs.rowid = f.id"
+                f" WHERE f.vec_row IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ))
+        return [
+            MemoryResult(path=str(self.memory_dir / found[row][0]), score=score,
+                         snippet=found[row][2], title=found[row][1], docid=found[row][0])
+            for row, score in hits if row in found
+        ]
+
+    def vector_search(self, query: str, n: int = 5) -> List[MemoryResult]:
+        """The n memories with embeddings closest to the query's, best first. [] without NumPy."""
+        if self.vectors is None:
+            return []
+        vector = self.embedder.embed([query])[0]
+        if not any(vector):
+            return []
+        self.sync()
+        with self._lock:
+            if self._embed_missing():
+                self._conn.commit()
+            k = n
+            while True:
+                hits = [(row, score) for row, score in self.vectors.top_k(vector, k) if score > 0]
+                results = self._results_for_rows(hits)
+                # Stale rows took some of the k places: look further, unless the matrix ran out
+                if len(results) >= n or len(hits) < k:
+                    return results[:n]
+                k *= 4
+
+    def hybrid_search(self, query: str, n: int = 5) -> List[MemoryResult]:
+        """BM25 and vector rankings fused by reciprocal rank. BM25 alone without NumPy."""
+        lexical = self.search(query, n * 4)
+        semantic = self.vector_search(query, n * 4)
+        if not semantic:
+            return lexical[:n]
+        by_name = {r.docid: r for r in semantic}
+        by_name.update((r.docid, r) for r in lexical)     # BM25 snippets show the matched words
+        fused = fuse([[r.docid for r in lexical], [r.docid for r in semantic]])
+        return [replace(by_name[name], score=score) for name, score in fused[:n]]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_full_text: Dict[str, FullTextIndex] = {}
+_full_text_lock = threading.Lock()
+
+
+def full_text_for(memory_dir: Path, log: Optional[MemoryLog] = None, embedder=None) -> FullTextIndex:
+    """The shared full-text index for a memory directory, or for its log."""
+    key = os.path.abspath(log.log_dir if log is not None else memory_dir)
+    index = _full_text.get(key)
+    if index is None:
+        with _full_text_lock:
+            index = _full_text.get(key)
+            if index is None:
+                index = _full_text[key] = FullTextIndex(Path(memory_dir), log=log, embedder=embedder)
+    if embedder is not None:
+        index.use_embedder(embedder)
+    return index
 
 
 def _memory_dir(agent_id: str) -> Path:
@@ -208,13 +720,38 @@ def _memory_dir(agent_id: str) -> Path:
 
 
 class MemoryBus:
-    """Store and recall agent memory as markdown files, searched via QMD."""
+    """Store and recall agent memory as markdown files.
+
+    backend is "local" (the in-process BM25 index, the default) or "qmd";
+    HW_MEMORY_BACKEND sets it when none is passed.
+
+    storage is "files" (one .md file per memory, the default) or "log"
+    (records appended to segments in runtimes/<agent>/memory_log/, for
+    agents that store a lot); HW_MEMORY_STORAGE sets it when none is
+    passed. Both expose the same store/get/index/recall. With the log,
+    paths name where export() would write the memory, and memory files
+    left in the directory from before are not indexed.
+
+    embedder replaces the local backend's default HashingEmbedder (see
+    memory_vectors.py) for vector and hybrid recall.
+    """
 
-    def __init__(self, agent_id: str):
+    def __init__(self, agent_id: str, backend: Optional[str] = None,
+                 storage: Optional[str] = None, embedder=None):
+        backend = backend or os.environ.get("HW_MEMORY_BACKEND", "local")
+        if backend not in _BACKENDS:
+            raise ValueError(f"Invalid backend {backend!r} — must be one of {_BACKENDS}")
+        storage = storage or os.environ.get("HW_MEMORY_STORAGE", "files")
+        if storage not in _STORAGES:
+            raise ValueError(f"Invalid storage {storage!r} — must be one of {_STORAGES}")
         self.agent_id = agent_id
+        self.backend = backend
+        self.storage = storage
+        self.embedder = embedder
         self._qmd_bin: Optional[str] = None
         self._collection_registered = False
         self._index: Optional[MemoryIndex] = None
+        self._full_text_error: Optional[str] = None
 
     @property
     def memory_dir(self) -> Path:
@@ -225,9 +762,32 @@ class MemoryBus:
     def index(self) -> MemoryIndex:
         """Lazily create a MemoryIndex for this agent's memory dir."""
         if self._index is None:
-            self._index = MemoryIndex(self.memory_dir)
+            self._index = MemoryIndex(self.memory_dir, log=self.log)
         return self._index
 
+    @property
+    def log(self) -> Optional[MemoryLog]:
+        """The segment log memories are stored in, or None for file storage."""
+        if self.storage != "log":
+            return None
+        return log_for(self.memory_dir.parent / "memory_log")
+
+    @property
+    def full_text(self) -> Optional[FullTextIndex]:
+        """The BM25 index the local backend searches, or None if SQLite cannot build it.
+
+        Without it (SQLite built without FTS5, an unwritable runtime dir)
+        memories are still stored, but recall() finds nothing and
+        available() is False.
+        """
+        if self._full_text_error is not None:
+            return None
+        try:
+            return full_text_for(self.memory_dir, self.log, self.embedder)
+        except sqlite3.OperationalError as e:
+            self._full_text_error = str(e)
+            return None
+
     def _find_qmd(self) -> Optional[str]:
         """Find the qmd binary. Cache result."""
         if self._qmd_bin is not None:
@@ -264,11 +824,20 @@ class MemoryBus:
         self._collection_registered = True
 
     def available(self) -> bool:
-        """Check if the QMD CLI is installed."""
+        """Check whether recall can run: locally if SQLite can index, with QMD if its CLI is installed."""
+        if self.backend == "local":
+            return self.full_text is not None
         return self._find_qmd() is not None
 
     def status(self) -> dict:
-        """Return QMD index health info."""
+        """Return index health info."""
+        if self.backend == "local":
+            index = self.full_text
+            if index is None:
+                return {"ok": False, "backend": "local", "error": self._full_text_error}
+            index.sync()
+            return {"ok": True, "backend": "local", "documents": index.count(),
+                    "index": str(index.db_path)}
         qmd = self._require_qmd()
         self._ensure_collection(qmd)
         result = subprocess.run(
@@ -289,9 +858,10 @@ class MemoryBus:
         title: Optional[str] = None,
         tags: Optional[list[str]] = None,
     ) -> Path:
-        """Write a markdown memory file with YAML frontmatter. No QMD needed."""
+        """Write a markdown memory with YAML frontmatter, as a file or a log record. No QMD needed."""
         now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         mem_dir = self.memory_dir
+        log = self.log
 
         if title:
             slug = _slugify(title)
@@ -301,9 +871,10 @@ class MemoryBus:
 
         filename = f"{slug}.md"
         path = mem_dir / filename
+        dir_mtime = _mtime_ns(mem_dir)
 
-        # Handle collision — append short hash
-        if path.exists():
+        # Handle collision — append short hash (the log picks its own free name below)
+        if log is None and path.exists():
             h = hashlib.sha256((content + now).encode()).hexdigest()[:8]
             filename = f"{slug}-{h}.md"
             path = mem_dir / filename
@@ -319,12 +890,48 @@ class MemoryBus:
         fm_lines.append("---")
 
         text = "\n".join(fm_lines) + "\n\n" + content + "\n"
+        if log is not None:
+            # The indexes catch up from the log's sequence numbers
+            _, filename = log.append_unique(filename, text)
+            return mem_dir / filename
         path.write_text(text)
+        if self._index is not None:
+            self._index.add(path, dir_mtime)
+        if self.backend == "local":
+            try:
+                index = self.full_text
+                if index is not None:
+                    index.add(path, dir_mtime)
+            except sqlite3.Error:
+                pass        # the file is written; the next search's sync() indexes it
         return path
 
+    def remove(self, names: Iterable[str]) -> int:
+        """Delete memories by filename. Returns the bytes they held.
+
+        The indexes notice on their next query. With the log, the space is
+        only given back to the disk by log.vacuum().
+        """
+        log = self.log
+        if log is not None:
+            return log.remove(names)
+        freed = 0
+        for name in names:
+            path = self.memory_dir / Path(name).name
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            freed += size
+        return freed
+
     def get(self, path_or_docid: str) -> str:
-        """Read a memory file by path or filename."""
+        """Read a memory by path or filename."""
         p = Path(path_or_docid)
+        log = self.log
+        if log is not None and p.name in log:
+            return log.read(p.name)
         if not p.is_absolute():
             p = self.memory_dir / p
         return p.read_text()
@@ -335,12 +942,28 @@ class MemoryBus:
         n: int = 5,
         mode: str = "query",
     ) -> list[MemoryResult]:
-        """Search memory via QMD. Modes: query (hybrid), search (BM25), vsearch (vector)."""
+        """Search memory. Modes: query (hybrid), search (BM25), vsearch (vector).
+
+        The local backend fuses BM25 and embedding rankings for query, and
+        falls back to BM25 for every mode without NumPy. QMD runs the mode
+        asked for.
+        """
         if mode not in _VALID_MODES:
             raise ValueError(f"Invalid mode {mode!r} — must be one of {_VALID_MODES}")
+        if self.backend == "local":
+            index = self.full_text
+            if index is None:
+                return []
+            if mode == "search" or index.vectors is None:
+                return index.search(query, n)
+            if mode == "vsearch":
+                return index.vector_search(query, n)
+            return index.hybrid_search(query, n)
 
         qmd = self._require_qmd()
         self._ensure_collection(qmd)
+        if self.log is not None:
+            self.export()
 
         # Update index before searching
         subprocess.run(
@@ -377,8 +1000,29 @@ class MemoryBus:
             )
         return results
 
+    def export(self, target_dir: Optional[Path] = None) -> int:
+        """Write log-stored memories out as .md files, by default into memory_dir.
+
+        Files already there are kept. Returns how many were written; always
+        0 for file storage, where every memory is a file already.
+        """
+        log = self.log
+        if log is None:
+            return 0
+        return log.export(Path(target_dir) if target_dir else self.memory_dir)
+
     def embed(self, force: bool = False) -> None:
-        """Generate/refresh vector embeddings. Explicit, not automatic."""
+        """Generate/refresh vector embeddings. Explicit, not automatic.
+
+        The local backend embeds new memories as it indexes them, so this
+        only catches up on ones indexed without NumPy; force rebuilds the
+        matrix, dropping rows of deleted memories.
+        """
+        if self.backend == "local":
+            index = self.full_text
+            if index is not None:
+                index.embed(force)
+            return
         qmd = self._require_qmd()
         self._ensure_collection(qmd)
         cmd = [qmd, "embed"]
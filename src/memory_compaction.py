@@ -0,0 +1,182 @@
+"""HelloWorld memory compaction — retention policies and per-sender digests.
+
+Every interaction leaves memories behind: an ooda-r trace per dispatched
+message, an inbox and an outbox entry per message an agent handles, one
+per human response. Left alone they pile up without bound, and every
+index and recall pays for them. A MemoryCompactor applies one
+RetentionPolicy per tag: memories beyond the newest keep_last, or older
+than max_age_days, expire. Expired memories are first rolled up into one
+digest per (tag, sender), then deleted.
+
+    compactor = MemoryCompactor(MemoryBus("Claude"))
+    compactor.plan()               # [(policy, expired entries), ...]
+    report = compactor.run()
+    report.entries_removed, report.bytes_reclaimed
+
+A digest is extractive by default: one line per memory with its date,
+title and first line. Given an llm, the compactor asks it to summarize
+instead (prompts.memory_digest_prompt), and falls back to the extractive
+digest when the call fails. Digests are tagged "digest" and are never
+compacted themselves.
+
+AgentProcess runs a compactor every HW_MEMORY_COMPACT_INTERVAL seconds.
+"""
+
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from memory_bus import MemoryBus, MemoryEntry
+from prompts import memory_digest_prompt
+
+DIGEST_TAG = "digest"
+DIGEST_LINES = 100     # most memories listed in, or sent to the LLM for, one digest
+_CREATED = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How many memories with one tag are kept, and for how long. None means no limit."""
+    tag: str
+    max_age_days: Optional[float] = None
+    keep_last: Optional[int] = None
+    digest: bool = True          # roll expired memories into digests before deleting them
+
+
+DEFAULT_POLICIES: Tuple[RetentionPolicy, ...] = (
+    RetentionPolicy("ooda-r", max_age_days=7, keep_last=200),
+    RetentionPolicy("inbox", max_age_days=14, keep_last=500),
+    RetentionPolicy("outbox", max_age_days=14, keep_last=500),
+    RetentionPolicy("human", max_age_days=90),
+)
+
+
+@dataclass
+class CompactionReport:
+    """What one compaction run removed and wrote."""
+    entries_removed: int = 0
+    bytes_removed: int = 0
+    digests_written: int = 0
+    digest_bytes: int = 0
+    bytes_vacuumed: int = 0                               # segment space given back, with log storage
+    by_tag: Dict[str, int] = field(default_factory=dict)  # tag -> memories removed
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        """Bytes of memory removed, net of the digests that replaced them."""
+        return self.bytes_removed - self.digest_bytes
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "bytes_reclaimed": self.bytes_reclaimed}
+
+    def summary(self) -> str:
+        return (f"{self.entries_removed} memories removed, {self.digests_written} digests written, "
+                f"{self.bytes_reclaimed} bytes reclaimed")
+
+
+def _created_at(entry: MemoryEntry) -> Optional[datetime]:
+    try:
+        return datetime.strptime(entry.created or "", _CREATED).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def _sender(entry: MemoryEntry, tag: str) -> str:
+    """Who a memory is about: its first tag after the policy's, as the runtime tags them."""
+    for t in entry.tags:
+        if t != tag:
+            return t
+    return tag
+
+
+def _digest_line(entry: MemoryEntry) -> str:
+    first = next((line.strip() for line in entry.content.splitlines() if line.strip()), "")
+    if len(first) > 160:
+        first = first[:157] + "..."
+    return f"- {entry.created or '?'} {entry.title}: {first}"
+
+
+class MemoryCompactor:
+    """Applies retention policies to one agent's memory.
+
+    llm, when given, is any model with call(prompt, system=...) and writes
+    the digests. now pins the clock, for tests.
+    """
+
+    def __init__(self, memory: MemoryBus, policies: Sequence[RetentionPolicy] = DEFAULT_POLICIES,
+                 llm=None, now: Optional[datetime] = None):
+        self.memory = memory
+        self.policies = list(policies)
+        self.llm = llm
+        self.now = now
+
+    def plan(self) -> List[Tuple[RetentionPolicy, List[MemoryEntry]]]:
+        """The memories each policy would expire, oldest first. Nothing is changed."""
+        now = self.now or datetime.now(timezone.utc)
+        taken = set()
+        plan = []
+        for policy in self.policies:
+            entries = sorted(
+                (e for e in self.memory.index.by_tag(policy.tag)
+                 if DIGEST_TAG not in e.tags and e.path.name not in taken),
+                key=lambda e: (e.created or "", e.path.name),
+            )
+            keep_from = 0        # entries before this index are past keep_last
+            if policy.keep_last is not None:
+                keep_from = max(0, len(entries) - policy.keep_last)
+            cutoff = now - timedelta(days=policy.max_age_days) if policy.max_age_days is not None else None
+            expired = []
+            for i, entry in enumerate(entries):
+                created = _created_at(entry)
+                if i < keep_from or (cutoff is not None and created is not None and created < cutoff):
+                    expired.append(entry)
+            if expired:
+                taken.update(e.path.name for e in expired)
+                plan.append((policy, expired))
+        return plan
+
+    def _digest(self, policy: RetentionPolicy, sender: str, entries: List[MemoryEntry]) -> str:
+        lines = [_digest_line(e) for e in entries[-DIGEST_LINES:]]
+        header = (f"Digest of {len(entries)} {policy.tag} memories involving {sender}, "
+                  f"{entries[0].created or '?'} to {entries[-1].created or '?'}.")
+        if self.llm is not None:
+            try:
+                summary = self.llm.call(memory_digest_prompt(self.memory.agent_id, sender, policy.tag, lines))
+                return f"{header}\n\n{summary.strip()}"
+            except Exception:
+                pass        # the extractive digest below loses less than no digest at all
+        if len(entries) > DIGEST_LINES:
+            lines.insert(0, f"- ... {len(entries) - DIGEST_LINES} earlier memories not listed")
+        return header + "\n\n" + "\n".join(lines)
+
+    def run(self) -> CompactionReport:
+        """Digest and delete every expired memory. Returns what was reclaimed."""
+        report = CompactionReport()
+        stamp = (self.now or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+        for policy, expired in self.plan():
+            if policy.digest:
+                by_sender: Dict[str, List[MemoryEntry]] = defaultdict(list)
+                for entry in expired:
+                    by_sender[_sender(entry, policy.tag)].append(entry)
+                for sender, entries in sorted(by_sender.items()):
+                    content = self._digest(policy, sender, entries)
+                    self.memory.store(content, title=f"digest-{policy.tag}-{sender}-{stamp}",
+                                      tags=[DIGEST_TAG, policy.tag, sender])
+                    report.digests_written += 1
+                    report.digest_bytes += len(content.encode("utf-8"))
+            report.bytes_removed += self.memory.remove(e.path.name for e in expired)
+            report.entries_removed += len(expired)
+            report.by_tag[policy.tag] = len(expired)
+        if not report.entries_removed:
+            return report
+        log = self.memory.log
+        if log is not None:
+            report.bytes_vacuumed = log.vacuum()
+        index = self.memory.full_text if self.memory.backend == "local" else None
+        if index is not None:
+            index.sync()
+            # Removed memories leave their vector rows behind until the matrix is rebuilt
+            if index.vectors is not None and index.vectors.rows() > 2 * index.count():
+                index.embed(force=True)
+        return report
@@ -0,0 +1,351 @@
+"""HelloWorld memory log — agent memories appended to rolling segment files.
+
+One markdown file per memory means a busy agent ends up with millions of
+tiny files, and every directory operation slows down with them. A
+MemoryLog appends each memory to the current segment file instead, and
+starts a new segment past segment_bytes. An SQLite table maps each
+memory's name to its (segment, offset, length), so reading one is a
+single positioned read.
+
+    log = MemoryLog(Path("runtimes/claude/memory_log"))
+    log.append("severith-style.md", text)
+    log.read("severith-style.md")
+    log.since(seq)                      # records appended after seq, in order
+    log.export(Path("runtimes/claude/memory"))   # back to one file per memory
+
+Records are never rewritten. Every record gets a sequence number, so
+readers in any process can catch up on what was appended since they last
+looked. Each record is framed by a "@@ <name> <length>" line, which keeps
+the segments readable and lets rebuild() recover the index from them.
+Appends from several processes are serialized by the SQLite write lock.
+
+remove() forgets records and bumps the log's generation, which tells
+readers to drop them too; vacuum() then copies the live records of
+mostly-dead segments into a new segment and deletes the old files.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+
+_SEGMENT_NAME = "segment-{:06d}.log"
+_SEGMENT_FILE = re.compile(r"^segment-(\d{6})\.log$")
+_FRAME = re.compile(rb"@@ (\S+) (\d+)\n")
+
+
+class MemoryLog:
+    """Append-only memory records in rolling segments, indexed by name."""
+
+    def __init__(self, log_dir: Path, segment_bytes: int = DEFAULT_SEGMENT_BYTES):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.log_dir / "index.db"), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE NOT NULL,"
+            "segment INTEGER NOT NULL, offset INTEGER NOT NULL, length INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_records_segment ON records (segment, offset)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value INTEGER)")
+        self._conn.commit()
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.log_dir / _SEGMENT_NAME.format(segment)
+
+    def segments(self) -> List[Path]:
+        """Segment files, oldest first."""
+        return sorted(p for p in self.log_dir.iterdir() if _SEGMENT_FILE.match(p.name))
+
+    # --- Writing ---
+
+    def append(self, name: str, text: str) -> int:
+        """Append a memory under a new name. Returns its sequence number.
+
+        Raises ValueError if the name is already taken or contains whitespace.
+        """
+        return self._append(name, text, unique=False)[0]
+
+    def append_unique(self, name: str, text: str) -> Tuple[int, str]:
+        """Append a memory under name, or name-2, name-3, ... if taken. Returns (seq, name used).
+
+        The free name is chosen inside the append's write transaction, so
+        concurrent writers, in this process or another, never collide.
+        """
+        return self._append(name, text, unique=True)
+
+    def _append(self, name: str, text: str, unique: bool) -> Tuple[int, str]:
+        if not name or any(c.isspace() for c in name):
+            raise ValueError(f"Invalid memory name {name!r}")
+        body = text.encode("utf-8")
+        stem, ext = os.path.splitext(name)
+        with self._lock:
+            # The write lock keeps other processes' appends out until commit
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                n = 1
+                while self._conn.execute("SELECT 1 FROM records WHERE name = ?", (name,)).fetchone():
+                    if not unique:
+                        raise ValueError(f"Memory {name!r} already exists")
+                    n += 1
+                    name = f"{stem}-{n}{ext}"
+                frame = f"@@ {name} {len(body)}\n".encode("utf-8")
+                row = self._conn.execute("SELECT MAX(segment) FROM records").fetchone()
+                segment = row[0] or 1
+                path = self._segment_path(segment)
+                if path.exists() and path.stat().st_size >= self.segment_bytes:
+                    segment += 1
+                    path = self._segment_path(segment)
+                with open(path, "ab") as f:
+                    f.write(frame + body + b"\n")
+                    offset = f.tell() - len(body) - 1
+                cursor = self._conn.execute(
+                    "INSERT INTO records (name, segment, offset, length) VALUES (?, ?, ?, ?)",
+                    (name, segment, offset, len(body)),
+                )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            return cursor.lastrowid, name
+
+    # --- Reading ---
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM records WHERE name = ?", (name,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def last_seq(self) -> int:
+        """Sequence number of the newest record, 0 if the log is empty."""
+        with self._lock:
+            return self._conn.execute("SELECT MAX(seq) FROM records").fetchone()[0] or 0
+
+    def version(self) -> Tuple[int, int]:
+        """(last_seq, generation): a reader that saw both unchanged has nothing new to read or drop."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT (SELECT MAX(seq) FROM records), (SELECT value FROM state WHERE key = 'generation')"
+            ).fetchone()
+        return row[0] or 0, row[1] or 0
+
+    def names(self) -> Set[str]:
+        """Every name in the log."""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT name FROM records")}
+
+    def _read_at(self, segment: int, offset: int, length: int) -> str:
+        with open(self._segment_path(segment), "rb") as f:
+            f.seek(offset)
+            return f.read(length).decode("utf-8")
+
+    def read(self, name: str) -> str:
+        """The text stored under name. Raises FileNotFoundError if there is none."""
+        for attempt in range(2):
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT segment, offset, length FROM records WHERE name = ?", (name,)
+                ).fetchone()
+            if row is None:
+                raise FileNotFoundError(f"No memory named {name!r} in {self.log_dir}")
+            try:
+                return self._read_at(*row)
+            except FileNotFoundError:
+                # vacuum() moved the record after we looked it up: look again, once
+                if attempt:
+                    raise
+
+    def since(self, seq: int = 0) -> Iterator[Tuple[int, str, str]]:
+        """(seq, name, text) for every record after seq, oldest first."""
+        retried_at = None
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, name, segment, offset, length FROM records WHERE seq > ? ORDER BY seq",
+                    (seq,),
+                ).fetchall()
+            handles = {}
+            try:
+                for seq_, name, segment, offset, length in rows:
+                    f = handles.get(segment)
+                    if f is None:
+                        f = handles[segment] = open(self._segment_path(segment), "rb")
+                    f.seek(offset)
+                    text = f.read(length).decode("utf-8")
+                    yield seq_, name, text
+                    seq = seq_
+                return
+            except FileNotFoundError:
+                # vacuum() moved the rest since the query: re-read their places, once per record
+                if retried_at == seq:
+                    raise
+                retried_at = seq
+            finally:
+                for f in handles.values():
+                    f.close()
+
+    # --- Maintenance ---
+
+    def export(self, target_dir: Path) -> int:
+        """Write each memory to target_dir/<name>, skipping files already there.
+
+        Returns how many files were written. Gives QMD, or a human, the
+        one-file-per-memory layout back.
+        """
+        target_dir = Path(target_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        written = 0
+        for _, name, text in self.since(0):
+            path = target_dir / name
+            if path.exists():
+                continue
+            tmp = path.with_name(f".{name}.tmp")
+            tmp.write_text(text)
+            os.replace(tmp, path)
+            written += 1
+        return written
+
+    def rebuild(self) -> int:
+        """Re-create the index from the segment files. Returns the records found.
+
+        For an index that was lost or damaged. The partial record left by
+        an append cut short is skipped. Records removed since the last vacuum()
+        come back.
+        """
+        records = []
+        for path in self.segments():
+            segment = int(_SEGMENT_FILE.match(path.name).group(1))
+            data = path.read_bytes()
+            pos = 0
+            while pos < len(data):
+                m = _FRAME.match(data, pos)
+                end = m.end() + int(m.group(2)) if m else 0
+                if m is None or data[end:end + 1] != b"\n":
+                    # A torn append: skip ahead to the next frame, if any
+                    m = _FRAME.search(data, pos + 1)
+                    if m is None:
+                        break
+                    pos = m.start()
+                    continue
+                records.append((m.group(1).decode("utf-8"), segment, m.end(), end - m.end()))
+                pos = end + 1
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM records")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO records (name, segment, offset, length) VALUES (?, ?, ?, ?)",
+                records,
+            )
+            self._conn.commit()
+        return len(records)
+
+    def remove(self, names: Iterable[str]) -> int:
+        """Forget the records with these names. Returns the bytes of text they held.
+
+        The text stays in its segment until vacuum() reclaims the space.
+        Names that are not in the log are ignored.
+        """
+        names = list(names)
+        removed = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for i in range(0, len(names), 500):
+                    chunk = names[i:i + 500]
+                    marks = ",".join("?" * len(chunk))
+                    removed += self._conn.execute(
+                        f"SELECT COALESCE(SUM(length), 0) FROM records WHERE name IN ({marks})", chunk
+                    ).fetchone()[0]
+                    self._conn.execute(f"DELETE FROM records WHERE name IN ({marks})", chunk)
+                self._conn.execute(
+                    "INSERT INTO state (key, value) VALUES ('generation', 1)"
+                    " ON CONFLICT(key) DO UPDATE SET value = value + 1"
+                )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return removed
+
+    def vacuum(self, min_garbage: float = 0.5) -> int:
+        """Rewrite segments that are at least min_garbage removed records. Returns the bytes freed.
+
+        The live records of those segments are copied, in order, to one new
+        segment, which later appends go on to fill. Readers that looked up a
+        record before the move find it again by name or sequence number.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                on_disk = {int(_SEGMENT_FILE.match(p.name).group(1)): p.stat().st_size for p in self.segments()}
+                last = self._conn.execute("SELECT MAX(segment) FROM records").fetchone()[0]
+                doomed, live = [], []
+                for segment, size in sorted(on_disk.items()):
+                    if segment == last or not size:
+                        continue
+                    rows = self._conn.execute(
+                        "SELECT seq, name, offset, length FROM records WHERE segment = ? ORDER BY offset",
+                        (segment,),
+                    ).fetchall()
+                    kept = sum(len(f"@@ {name} {length}\n".encode("utf-8")) + length + 1
+                               for _, name, _, length in rows)
+                    if size - kept >= size * min_garbage:
+                        doomed.append(segment)
+                        live.extend((segment, row) for row in rows)
+                if not doomed:
+                    self._conn.rollback()
+                    return 0
+                freed = sum(on_disk[segment] for segment in doomed)
+                if live:
+                    target = max(max(on_disk), last or 0) + 1
+                    moves = []
+                    with open(self._segment_path(target), "ab") as out:
+                        for segment, (seq, name, offset, length) in live:
+                            frame = f"@@ {name} {length}\n".encode("utf-8")
+                            with open(self._segment_path(segment), "rb") as f:
+                                f.seek(offset)
+                                body = f.read(length)
+                            out.write(frame + body + b"\n")
+                            moves.append((target, out.tell() - length - 1, seq))
+                        out.flush()
+                        os.fsync(out.fileno())
+                        freed -= out.tell()
+                    self._conn.executemany("UPDATE records SET segment = ?, offset = ? WHERE seq = ?", moves)
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        for segment in doomed:
+            self._segment_path(segment).unlink(missing_ok=True)
+        return freed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_logs: Dict[str, MemoryLog] = {}
+_logs_lock = threading.Lock()
+
+
+def log_for(log_dir: Path) -> MemoryLog:
+    """The shared MemoryLog for a directory."""
+    key = os.path.abspath(log_dir)
+    log = _logs.get(key)
+    if log is None:
+        with _logs_lock:
+            log = _logs.get(key)
+            if log is None:
+                log = _logs[key] = MemoryLog(Path(key))
+    return log
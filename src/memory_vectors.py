@@ -0,0 +1,155 @@
+"""HelloWorld memory vectors — embedding search for the local memory backend.
+
+recall(mode="vsearch") ranks memories by cosine similarity between
+embeddings, and mode="query" fuses that ranking with BM25's. The
+embeddings are the rows of one float32 matrix, appended to a flat file
+and memory-mapped for search, so a query is a matrix-vector product over
+the mapping and an argpartition for the top k. Nothing is loaded into
+memory up front, and rows written by other processes are seen as soon
+as the file grows.
+
+    matrix = VectorMatrix(Path("runtimes/claude/memory_index.vec"), dim=256)
+    first = matrix.append(HashingEmbedder().embed(["severith prefers short messages"]))
+    matrix.top_k(query_vector, 5)          # [(row, cosine), ...] best first
+
+An embedder is anything with `name`, `dim` and `embed(texts) -> vectors`.
+The default, HashingEmbedder, hashes words and adjacent word pairs into
+signed buckets: deterministic, offline and free, good at shared wording
+and blind to synonyms. Pass a model-backed one to MemoryBus for more.
+
+NumPy is optional, like the rest of HelloWorld's dependencies. Without
+it no vectors are stored and recall() answers every mode with BM25.
+"""
+
+import hashlib
+import math
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_DIM = 256
+RRF_K = 60            # reciprocal rank fusion constant, as in Cormack et al.
+_BLOCK_ROWS = 65536   # rows scored per matrix product, to bound temporary memory
+
+_WORD = re.compile(r"\w+")
+
+
+def available() -> bool:
+    """Whether vector search can run (NumPy is installed)."""
+    return np is not None
+
+
+class HashingEmbedder:
+    """Feature-hashed bag of words and word pairs, L2-normalized."""
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        self.dim = dim
+        self.name = f"hashing-v1:{dim}"
+
+    def _features(self, text: str) -> Iterable[str]:
+        words = _WORD.findall(text.lower())
+        yield from words
+        for a, b in zip(words, words[1:]):
+            yield f"{a} {b}"
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        vectors = []
+        for text in texts:
+            vec = [0.0] * self.dim
+            for feature in self._features(text):
+                h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+                vec[h % self.dim] += 1.0 if (h >> 63) & 1 else -1.0
+            norm = math.sqrt(sum(v * v for v in vec))
+            vectors.append([v / norm for v in vec] if norm else vec)
+        return vectors
+
+
+class VectorMatrix:
+    """Float32 rows of width dim in a flat file: appended in place, memory-mapped to search.
+
+    Rows are never moved or rewritten, so a row number stays valid for
+    as long as the file exists. Callers serialize append() across
+    processes (FullTextIndex does it under its SQLite write lock).
+    """
+
+    def __init__(self, path: Path, dim: int):
+        if np is None:
+            raise RuntimeError("VectorMatrix needs NumPy")
+        self.path = Path(path)
+        self.dim = dim
+        self._row_bytes = dim * 4
+        self._map = None
+        self._mapped: Tuple[int, int] = (0, 0)     # (inode, rows) behind self._map
+
+    def _shape(self) -> Tuple[int, int]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return 0, 0
+        return st.st_ino, st.st_size // self._row_bytes
+
+    def rows(self) -> int:
+        return self._shape()[1]
+
+    def append(self, vectors: Sequence[Sequence[float]]) -> int:
+        """Append vectors as rows. Returns the row number of the first."""
+        block = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        with open(self.path, "ab") as f:
+            size = f.seek(0, 2)
+            if size % self._row_bytes:
+                # A row cut short by a crash: pad it out so later rows stay aligned
+                f.write(b"\0" * (self._row_bytes - size % self._row_bytes))
+                size = f.tell()
+            f.write(block.tobytes())
+        return size // self._row_bytes
+
+    def reset(self) -> None:
+        """Drop every row.
+
+        The file is replaced, not truncated: other processes may have the
+        old one mapped, and reading a mapping past the end of a shrunken
+        file kills the process.
+        """
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_bytes(b"")
+        os.replace(tmp, self.path)
+
+    def _matrix(self):
+        shape = self._shape()
+        if shape != self._mapped:
+            rows = shape[1]
+            self._map = np.memmap(self.path, dtype=np.float32, mode="r", shape=(rows, self.dim)) if rows else None
+            self._mapped = shape
+        return self._map
+
+    def top_k(self, query: Sequence[float], k: int) -> List[Tuple[int, float]]:
+        """The k rows with the highest dot product with query, best first."""
+        matrix = self._matrix()
+        if matrix is None or k <= 0:
+            return []
+        q = np.asarray(query, dtype=np.float32)
+        rows, scores = [], []
+        for start in range(0, matrix.shape[0], _BLOCK_ROWS):
+            block = matrix[start:start + _BLOCK_ROWS] @ q
+            take = min(k, block.shape[0])
+            best = np.argpartition(-block, take - 1)[:take]
+            rows.append(best + start)
+            scores.append(block[best])
+        rows, scores = np.concatenate(rows), np.concatenate(scores)
+        order = np.argsort(-scores, kind="stable")[:k]
+        return [(int(rows[i]), float(scores[i])) for i in order]
+
+
+def fuse(rankings: Sequence[Sequence[str]], k: int = RRF_K) -> List[Tuple[str, float]]:
+    """Reciprocal rank fusion: (name, score) by the sum of 1 / (k + rank) over the rankings."""
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, name in enumerate(ranking, start=1):
+            scores[name] = scores.get(name, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
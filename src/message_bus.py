@@ -1,22 +1,37 @@
 """HelloWorld Message Bus — three functions matching the three vocabulary verbs.
 
     send(sender, receiver, content)  →  HelloWorld #send
-    receive(receiver)                →  HelloWorld #receive
+    receive(receiver[, timeout])     →  HelloWorld #receive
     hello(sender)                    →  HelloWorld #hello
 
+receive() returns None at once when the inbox is empty; with a timeout it
+blocks until a message arrives. areceive() is the awaitable form.
+
 Messages are routed through pluggable transports.  The default is
 FileTransport (runtimes/<agent>/inbox/*.hw).  Set HW_TRANSPORT=clawnet
-or call set_transport() for ClawNet.
+or call set_transport() for ClawNet, HW_TRANSPORT=sqlite for a shared
+database, or HW_TRANSPORT=memory for agents sharing one process.
 
 Receiver names support #address format: receiver@context (e.g. claude@purdy).
 Qualified and unqualified names route to different inboxes.
 """
 
+import asyncio
+import atexit
+import heapq
+import json
 import os
-import uuid
+import secrets
+import select
+import struct
+import sys
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
@@ -33,6 +48,22 @@ def _normalize_receiver(receiver: str) -> str:
     return name
 
 
+def _message_id() -> str:
+    """A msg-<hex> id that leads with the clock, so ids sort (and index) in send order."""
+    return f"msg-{time.time_ns():016x}{secrets.token_hex(4)}"
+
+
+def _id_time(msg_id: str) -> Optional[int]:
+    """The send time (ns) encoded in a _message_id(), or None for other ids."""
+    if len(msg_id) != 28 or not msg_id.startswith("msg-"):
+        return None
+    try:
+        int(msg_id[20:], 16)
+        return int(msg_id[4:20], 16)
+    except ValueError:
+        return None
+
+
 @dataclass
 class Message:
     """A HelloWorld message between agents."""
@@ -45,28 +76,171 @@ class Message:
 # Transport ABC
 # ---------------------------------------------------------------------------
 
+class _Doorbell:
+    """Wakes threads and event loops waiting for messages to arrive.
+
+    ring() bumps a counter. A waiter reads the counter before it checks its
+    inbox and waits only while the counter still has that value, so a ring
+    that lands between the check and the wait is never missed.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._rings = 0
+        self._futures: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def rings(self) -> int:
+        return self._rings
+
+    def ring(self):
+        with self._cond:
+            self._rings += 1
+            self._cond.notify_all()
+            futures, self._futures = self._futures, []
+        for loop, future in futures:
+            try:
+                loop.call_soon_threadsafe(_settle, future)
+            except RuntimeError:
+                pass  # that event loop has closed
+
+    def wait(self, seen: int, timeout: float):
+        """Block until ring() is called after `seen` rings, or timeout passes."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._rings != seen, timeout)
+
+    async def await_ring(self, seen: int, timeout: float):
+        """Awaitable wait(): suspends the task without holding a thread."""
+        loop = asyncio.get_running_loop()
+        entry = (loop, loop.create_future())
+        with self._cond:
+            if self._rings != seen:
+                return
+            self._futures.append(entry)
+        try:
+            await asyncio.wait_for(entry[1], timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._cond:
+                if entry in self._futures:
+                    self._futures.remove(entry)
+
+
+def _settle(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
 class Transport(ABC):
-    """Abstract base for message transports."""
+    """Abstract base for message transports.
+
+    Blocking receives wait on the transport's doorbell. Transports ring it
+    when they learn of new messages; arrivals nothing rings for (another
+    process, a remote API) are found by re-checking every POLL_INTERVAL.
+    """
+
+    POLL_INTERVAL = 0.05   # seconds between checks for arrivals that ring no bell
 
     @abstractmethod
     def send(self, sender: str, receiver: str, content: str) -> str:
         """Deliver a message.  Returns a msg_id."""
 
     @abstractmethod
-    def receive(self, receiver: str) -> Optional[Message]:
-        """Read the next message for *receiver* (or None)."""
+    def receive(self, receiver: str, timeout: Optional[float] = None) -> Optional[Message]:
+        """Read the next message for *receiver* (or None).
+
+        With a timeout, wait up to that many seconds for one to arrive.
+        """
+
+    async def areceive(self, receiver: str, timeout: Optional[float] = None) -> Optional[Message]:
+        """Awaitable receive(). Waiting suspends the task rather than a thread."""
+        if not timeout:
+            return self._poll(receiver)
+        deadline = time.monotonic() + timeout
+        while True:
+            seen = self._doorbell.rings
+            msg = self._poll(receiver)
+            remaining = deadline - time.monotonic()
+            if msg is not None or remaining <= 0:
+                return msg
+            await self._doorbell.await_ring(seen, min(remaining, self._wait_interval(receiver)))
 
     def hello(self, sender: str) -> str:
         """Announce presence.  Default sends to HelloWorld."""
         return self.send(sender, "HelloWorld", f"{sender} #hello")
 
+    def send_many(self, messages: Iterable[Tuple[str, str, str]]) -> List[str]:
+        """Deliver (sender, receiver, content) triples.  Returns their msg_ids."""
+        return [self.send(sender, receiver, content) for sender, receiver, content in messages]
+
+    def receive_batch(self, receiver: str, n: int) -> List[Message]:
+        """Read up to *n* of the oldest messages for *receiver*, oldest first."""
+        batch = []
+        while len(batch) < n:
+            msg = self.receive(receiver)
+            if msg is None:
+                break
+            batch.append(msg)
+        return batch
+
+    @property
+    def _doorbell(self) -> _Doorbell:
+        # Created on first use so subclasses need not call Transport.__init__
+        bell = self.__dict__.get("_bell")
+        if bell is None:
+            bell = self.__dict__.setdefault("_bell", _Doorbell())
+        return bell
+
+    def _poll(self, receiver: str) -> Optional[Message]:
+        """One non-blocking receive attempt, as made by a waiting receiver."""
+        return self.receive(receiver)
+
+    def _wait(self, receiver: str, timeout: float) -> Optional[Message]:
+        """Poll receiver's inbox until a message arrives or timeout seconds pass."""
+        deadline = time.monotonic() + timeout
+        while True:
+            seen = self._doorbell.rings
+            msg = self._poll(receiver)
+            remaining = deadline - time.monotonic()
+            if msg is not None or remaining <= 0:
+                return msg
+            self._doorbell.wait(seen, min(remaining, self._wait_interval(receiver)))
+
+    def _wait_interval(self, receiver: str) -> float:
+        """Prepare to wait on receiver's inbox; return the longest sleep between checks."""
+        return self.POLL_INTERVAL
+
 
 # ---------------------------------------------------------------------------
 # FileTransport — the original filesystem implementation
 # ---------------------------------------------------------------------------
 
 class FileTransport(Transport):
-    """Deliver messages via .hw files in runtimes/<agent>/inbox/."""
+    """Deliver messages via .hw files in runtimes/<agent>/inbox/.
+
+    Message ids lead with the clock, so file names sort in send order.
+    Each inbox this process reads keeps an _InboxCursor of pending files.
+    New files are picked up through inotify where available. Otherwise the
+    directory is listed again only once the cursor runs dry. Draining N
+    messages therefore costs O(N log N), not a glob + stat + sort per
+    message.
+
+    A blocking receive starts a daemon thread that applies inotify events
+    as they arrive and rings the doorbell, so a waiter wakes as soon as a
+    message lands. Without inotify it re-lists every POLL_INTERVAL.
+    """
+
+    WATCHED_POLL_INTERVAL = 1.0   # safety net while inotify reports arrivals
+
+    def __init__(self, watch: bool = True):
+        self._watch = watch
+        self._watcher: Optional[_InboxWatcher] = None
+        self._watcher_pid: Optional[int] = None
+        self._cursors: Dict[Path, _InboxCursor] = {}
+        self._watched: Dict[int, _InboxCursor] = {}   # inotify wd → cursor
+        self._pump_pid: Optional[int] = None
+        self._lock = threading.Lock()
 
     @property
     def base_dir(self) -> Path:
@@ -74,51 +248,276 @@ class FileTransport(Transport):
         return BASE_DIR
 
     def send(self, sender: str, receiver: str, content: str) -> str:
-        msg_id = f"msg-{uuid.uuid4().hex[:8]}"
+        msg_id = _message_id()
         timestamp = datetime.now(timezone.utc).isoformat()
-
-        msg_file = _inbox(receiver) / f"{msg_id}.hw"
-        msg_file.write_text(
+        text = (
             f"# From: {sender}\n"
             f"# Timestamp: {timestamp}\n"
             f"\n"
             f"{content}\n"
         )
+
+        # Write under a name readers ignore, then rename into place
+        inbox = self.base_dir / _normalize_receiver(receiver) / "inbox"
+        tmp = inbox / f".{msg_id}.tmp"
+        try:
+            tmp.write_text(text)
+        except FileNotFoundError:
+            inbox.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(text)
+        os.replace(tmp, inbox / f"{msg_id}.hw")
+        self._doorbell.ring()
         return msg_id
 
-    def receive(self, receiver: str) -> Optional[Message]:
-        inbox = _inbox(receiver)
-        files = sorted(inbox.glob("msg-*.hw"), key=lambda p: p.stat().st_mtime)
-        if not files:
+    def receive(self, receiver: str, timeout: Optional[float] = None) -> Optional[Message]:
+        if timeout:
+            return self._wait(receiver, timeout)
+        inbox = self.base_dir / _normalize_receiver(receiver) / "inbox"
+        with self._lock:
+            cursor = self._cursor(inbox)
+            while True:
+                name = cursor.pop()
+                if name is None:
+                    return None
+                msg_file = inbox / name
+                try:
+                    text = msg_file.read_text()
+                except FileNotFoundError:
+                    continue  # taken by another reader since we listed it
+                try:
+                    msg_file.unlink()
+                except FileNotFoundError:
+                    pass
+                return _parse_message_file(text)
+
+    def _wait_interval(self, receiver: str) -> float:
+        inbox = self.base_dir / _normalize_receiver(receiver) / "inbox"
+        inbox.mkdir(parents=True, exist_ok=True)   # only an existing directory can be watched
+        with self._lock:
+            watcher = self._current_watcher()
+            if watcher is None or self._cursor(inbox).wd is None:
+                return self.POLL_INTERVAL
+            if self._pump_pid != os.getpid():
+                self._pump_pid = os.getpid()
+                threading.Thread(
+                    target=self._pump, args=(weakref.ref(self), watcher),
+                    name="hw-inbox-watch", daemon=True,
+                ).start()
+        return self.WATCHED_POLL_INTERVAL
+
+    @staticmethod
+    def _pump(ref: 'weakref.ref[FileTransport]', watcher: '_InboxWatcher'):
+        """Apply inotify events as they arrive and wake waiters.
+
+        Holds the transport weakly and exits once it is gone or has a new watcher.
+        """
+        while True:
+            try:
+                readable, _, _ = select.select([watcher.fileno()], [], [], 1.0)
+            except (OSError, ValueError):
+                return
+            transport = ref()
+            if transport is None or transport._watcher is not watcher:
+                return
+            if readable:
+                with transport._lock:
+                    changed = transport._apply_events(watcher)
+                if changed:
+                    transport._doorbell.ring()
+            del transport
+
+    def _cursor(self, inbox: Path) -> '_InboxCursor':
+        """The cursor for inbox, brought up to date with the directory."""
+        watcher = self._current_watcher()
+        if watcher is not None:
+            self._apply_events(watcher)
+        cursor = self._cursors.get(inbox)
+        if cursor is None:
+            cursor = self._cursors[inbox] = _InboxCursor(inbox)
+        if cursor.wd is None and watcher is not None and inbox.is_dir():
+            # Watch before listing so nothing lands between the two unseen
+            try:
+                cursor.wd = watcher.watch(inbox)
+                self._watched[cursor.wd] = cursor
+                cursor.stale = True
+            except OSError:
+                pass
+        if cursor.stale or (cursor.wd is None and not cursor):
+            cursor.rescan()
+        return cursor
+
+    def _current_watcher(self) -> Optional['_InboxWatcher']:
+        if not self._watch:
             return None
+        if self._watcher_pid != os.getpid():
+            # First use, or a forked child: the inherited descriptor belongs to the parent
+            self._watcher = _InboxWatcher.create()
+            self._watcher_pid = os.getpid()
+            self._watched.clear()
+            for cursor in self._cursors.values():
+                cursor.wd = None
+        return self._watcher
+
+    def _apply_events(self, watcher: '_InboxWatcher') -> bool:
+        """Fold queued inotify events into the cursors. True if any inbox may have grown."""
+        changed = False
+        for wd, mask, name in watcher.read_events():
+            if mask & _InboxWatcher.IN_Q_OVERFLOW:
+                for cursor in self._cursors.values():
+                    cursor.stale = True
+                changed = True
+                continue
+            cursor = self._watched.get(wd)
+            if cursor is None:
+                continue
+            if mask & _InboxWatcher.IN_IGNORED:
+                # The inbox directory went away; poll until it is watched again
+                del self._watched[wd]
+                cursor.wd = None
+                cursor.stale = True
+                changed = True
+            elif name:
+                changed = cursor.add(name) or changed
+        return changed
+
+
+def _parse_message_file(text: str) -> Message:
+    """Split a .hw message file into its headers and body."""
+    sender = ""
+    timestamp = ""
+    content_start = 0
+
+    lines = text.split("\n")
+    for i, line in enumerate(lines):
+        if line.startswith("# From:"):
+            sender = line.split(":", 1)[1].strip()
+        elif line.startswith("# Timestamp:"):
+            timestamp = line.split(":", 1)[1].strip()
+        elif not line.startswith("#") and line.strip():
+            content_start = i
+            break
+
+    content = "\n".join(lines[content_start:]).strip()
+    return Message(sender=sender, content=content, timestamp=timestamp)
+
+
+def _is_message_file(name: str) -> bool:
+    return name.startswith("msg-") and name.endswith(".hw")
+
+
+class _InboxCursor:
+    """Pending message files of one inbox directory, oldest first.
+
+    Files named by _message_id() order by the time in their name. Files
+    with any other msg-*.hw name order by mtime, stat'ed once when first
+    seen.
+    """
 
-        msg_file = files[0]
+    def __init__(self, path: Path):
+        self.path = path
+        self.wd: Optional[int] = None   # inotify watch, when one is active
+        self.stale = True               # the directory must be listed again
+        self._heap: List[Tuple[int, str]] = []
+        self._queued: Set[str] = set()
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def add(self, name: str) -> bool:
+        """Queue a file name. False if it is not a new message file."""
+        if name in self._queued or not _is_message_file(name):
+            return False
+        key = _id_time(name[:-3])
+        if key is None:
+            try:
+                key = os.stat(self.path / name).st_mtime_ns
+            except FileNotFoundError:
+                return False
+        self._queued.add(name)
+        heapq.heappush(self._heap, (key, name))
+        return True
+
+    def pop(self) -> Optional[str]:
+        if not self._heap:
+            return None
+        _, name = heapq.heappop(self._heap)
+        self._queued.discard(name)
+        return name
+
+    def rescan(self):
+        self.stale = False
         try:
-            text = msg_file.read_text()
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    self.add(entry.name)
         except FileNotFoundError:
-            return None
+            pass
 
-        sender = ""
-        timestamp = ""
-        content_start = 0
-
-        for i, line in enumerate(text.split("\n")):
-            if line.startswith("# From:"):
-                sender = line.split(":", 1)[1].strip()
-            elif line.startswith("# Timestamp:"):
-                timestamp = line.split(":", 1)[1].strip()
-            elif not line.startswith("#") and line.strip():
-                content_start = i
-                break
 
-        content = "\n".join(text.split("\n")[content_start:]).strip()
+class _InboxWatcher:
+    """One inotify instance for every inbox this process reads (Linux only)."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+    _EVENT = struct.Struct("iIII")   # wd, mask, cookie, len
 
+    def __init__(self, libc, fd: int):
+        self._libc = libc
+        self._fd = fd
+
+    @classmethod
+    def create(cls) -> Optional['_InboxWatcher']:
+        """A watcher, or None where inotify is unavailable (callers fall back to polling)."""
+        if os.environ.get("HW_INBOX_WATCH", "1") == "0" or not sys.platform.startswith("linux"):
+            return None
         try:
-            msg_file.unlink()
-        except FileNotFoundError:
-            pass
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(cls._IN_NONBLOCK | cls._IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        return cls(libc, fd)
+
+    def fileno(self) -> int:
+        return self._fd
 
-        return Message(sender=sender, content=content, timestamp=timestamp)
+    def watch(self, path: Path) -> int:
+        import ctypes
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(path), self.IN_CLOSE_WRITE | self.IN_MOVED_TO,
+        )
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+
+    def read_events(self) -> List[Tuple[int, int, str]]:
+        """Drain queued events without blocking: (wd, mask, file name) each."""
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                name = data[offset:offset + length].split(b"\0", 1)[0]
+                offset += length
+                events.append((wd, mask, os.fsdecode(name)))
+
+    def __del__(self):
+        try:
+            os.close(self._fd)
+        except (OSError, AttributeError):
+            pass
 
 
 # ---------------------------------------------------------------------------
@@ -133,18 +532,39 @@ class SQLiteTransport(Transport):
 
     Supports #address format: claude@purdy and claude@cancelself are
     different inboxes. Plain "claude" is a third, distinct inbox.
+
+    Receives claim messages with a single UPDATE ... RETURNING against the
+    (receiver, read, ts) index, so concurrent readers — threads sharing
+    this connection or other processes on the same file — never get the
+    same message twice.  Read rows are deleted once an inbox has claimed
+    ``compact_every`` messages (0 disables this; see compact()).
+
+    Sends through this transport wake its blocking receivers directly;
+    sends from other processes are seen within POLL_INTERVAL.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    _CLAIM_SQL = (
+        "UPDATE messages SET read = 1 WHERE rowid IN ("
+        "SELECT rowid FROM messages WHERE receiver = ? AND read = 0 "
+        "ORDER BY ts, rowid LIMIT ?) "
+        "RETURNING rowid, sender, content, ts"
+    )
+
+    def __init__(self, db_path: Optional[str] = None, compact_every: int = 1000):
         import sqlite3
         self._db_path = db_path or os.environ.get(
             "HW_SQLITE_PATH",
             str(Path(__file__).resolve().parent.parent / "storage" / "messages.db"),
         )
         os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
-        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._returning = sqlite3.sqlite_version_info >= (3, 35, 0)
+        self._lock = threading.Lock()   # one connection, shared across threads
+        self._compact_every = compact_every
+        self._claimed: Dict[str, int] = {}   # receiver → claims since its last compaction
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False, timeout=30)
         self._conn.execute("PRAGMA journal_mode=WAL")
-        self._conn.execute("""
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
             CREATE TABLE IF NOT EXISTS messages (
                 id       TEXT PRIMARY KEY,
                 sender   TEXT NOT NULL,
@@ -152,33 +572,303 @@ class SQLiteTransport(Transport):
                 content  TEXT NOT NULL,
                 ts       TEXT NOT NULL,
                 read     INTEGER NOT NULL DEFAULT 0
-            )
+            );
+            CREATE INDEX IF NOT EXISTS idx_messages_inbox ON messages (receiver, read, ts);
         """)
         self._conn.commit()
 
     def send(self, sender: str, receiver: str, content: str) -> str:
-        msg_id = f"msg-{uuid.uuid4().hex[:8]}"
-        ts = datetime.now(timezone.utc).isoformat()
-        self._conn.execute(
-            "INSERT INTO messages (id, sender, receiver, content, ts) VALUES (?, ?, ?, ?, ?)",
-            (msg_id, sender, _normalize_receiver(receiver), content, ts),
-        )
-        self._conn.commit()
-        return msg_id
+        return self.send_many([(sender, receiver, content)])[0]
 
-    def receive(self, receiver: str) -> Optional[Message]:
+    def send_many(self, messages: Iterable[Tuple[str, str, str]]) -> List[str]:
+        """Deliver (sender, receiver, content) triples in one transaction."""
+        ts = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (_message_id(), sender, _normalize_receiver(receiver), content, ts)
+            for sender, receiver, content in messages
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO messages (id, sender, receiver, content, ts) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        self._doorbell.ring()
+        return [row[0] for row in rows]
+
+    def receive(self, receiver: str, timeout: Optional[float] = None) -> Optional[Message]:
+        if timeout:
+            return self._wait(receiver, timeout)
+        batch = self.receive_batch(receiver, 1)
+        return batch[0] if batch else None
+
+    def _poll(self, receiver: str) -> Optional[Message]:
+        # Waiters re-check every POLL_INTERVAL for other processes' sends.
+        # A read-only index probe keeps idle waiters off the write lock.
+        with self._lock:
+            pending = self._conn.execute(
+                "SELECT 1 FROM messages WHERE receiver = ? AND read = 0 LIMIT 1",
+                (_normalize_receiver(receiver),),
+            ).fetchone()
+        return self.receive(receiver) if pending else None
+
+    def receive_batch(self, receiver: str, n: int) -> List[Message]:
+        """Claim up to n of the oldest unread messages for receiver, oldest first."""
+        if n <= 0:
+            return []
         name = _normalize_receiver(receiver)
-        row = self._conn.execute(
-            "SELECT id, sender, content, ts FROM messages "
-            "WHERE receiver = ? AND read = 0 ORDER BY ts LIMIT 1",
-            (name,),
-        ).fetchone()
-        if not row:
-            return None
-        msg_id, sender, content, ts = row
-        self._conn.execute("UPDATE messages SET read = 1 WHERE id = ?", (msg_id,))
+        with self._lock:
+            if self._returning:
+                rows = self._conn.execute(self._CLAIM_SQL, (name, n)).fetchall()
+            else:
+                # Pre-3.35 SQLite: take the write lock first so the claim stays atomic
+                self._conn.execute("BEGIN IMMEDIATE")
+                rows = self._conn.execute(
+                    "SELECT rowid, sender, content, ts FROM messages "
+                    "WHERE receiver = ? AND read = 0 ORDER BY ts, rowid LIMIT ?",
+                    (name, n),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE messages SET read = 1 WHERE rowid = ?", [(row[0],) for row in rows],
+                )
+            self._conn.commit()
+            if rows and self._compact_every:
+                claimed = self._claimed.get(name, 0) + len(rows)
+                if claimed >= self._compact_every:
+                    self._delete_read(name)
+                    claimed = 0
+                self._claimed[name] = claimed
+        # RETURNING does not promise an order
+        rows.sort(key=lambda row: (row[3], row[0]))
+        return [Message(sender=sender, content=content, timestamp=ts) for _, sender, content, ts in rows]
+
+    def compact(self, receiver: Optional[str] = None) -> int:
+        """Delete read messages for one receiver, or every inbox. Returns rows removed."""
+        with self._lock:
+            if receiver is not None:
+                names = [_normalize_receiver(receiver)]
+            else:
+                names = [row[0] for row in self._conn.execute("SELECT DISTINCT receiver FROM messages")]
+            removed = sum(self._delete_read(name) for name in names)
+            for name in names:
+                self._claimed.pop(name, None)
+        return removed
+
+    def _delete_read(self, name: str) -> int:
+        # Caller holds self._lock; the (receiver, read) index prefix bounds the scan
+        cursor = self._conn.execute("DELETE FROM messages WHERE receiver = ? AND read = 1", (name,))
         self._conn.commit()
-        return Message(sender=sender, content=content, timestamp=ts)
+        return cursor.rowcount
+
+
+# ---------------------------------------------------------------------------
+# MemoryTransport — in-process, for co-located agents
+# ---------------------------------------------------------------------------
+
+# Messages read before MemoryTransport rewrites its log without them
+MEMORY_LOG_COMPACT_AFTER = 10000
+
+
+class MemoryTransport(Transport):
+    """Deliver messages through per-receiver queues in this process.
+
+    For agents sharing one process (agent_daemon.py --all, simulations,
+    load tests): send() queues a Message and receive() hands back that
+    same object, so nothing is serialized or parsed on the way. Blocking
+    receives wake through the transport's doorbell, from threads or from
+    event loops. Other processes cannot reach these inboxes.
+
+    Messages live only as long as the process unless a log_path is given
+    (or HW_MEMORY_LOG is set). Sends and receives are then appended to that
+    JSON-lines file by a background thread. Senders never wait on disk,
+    and a restarted process picks up the messages nobody had read. Writes
+    that are still queued when the process crashes are lost. Once more
+    than compact_after messages have been read since the last rewrite,
+    and they outnumber the unread ones, the log is rewritten to hold just
+    the unread messages, so it stays bounded in a long-running process.
+    """
+
+    def __init__(self, log_path: Optional[str] = None, compact_after: int = MEMORY_LOG_COMPACT_AFTER):
+        self._inboxes: Dict[str, Deque[Tuple[str, Message]]] = {}
+        self._lock = threading.Lock()
+        self._log: Optional[_WriteBehindLog] = None
+        self.compact_after = compact_after
+        self._acked = 0                 # acks written since the log was last rewritten
+        if log_path:
+            for msg_id, name, msg in _WriteBehindLog.replay(log_path):
+                self._inboxes.setdefault(name, deque()).append((msg_id, msg))
+            self._log = _WriteBehindLog(log_path)
+
+    def send(self, sender: str, receiver: str, content: str) -> str:
+        return self.send_many([(sender, receiver, content)])[0]
+
+    def send_many(self, messages: Iterable[Tuple[str, str, str]]) -> List[str]:
+        timestamp = datetime.now(timezone.utc).isoformat()
+        entries = [
+            (_message_id(), _normalize_receiver(receiver),
+             Message(sender=sender, content=content, timestamp=timestamp))
+            for sender, receiver, content in messages
+        ]
+        with self._lock:
+            for msg_id, name, msg in entries:
+                inbox = self._inboxes.get(name)
+                if inbox is None:
+                    inbox = self._inboxes[name] = deque()
+                inbox.append((msg_id, msg))
+            if self._log is not None:
+                self._log.append([_send_record(msg_id, name, msg) for msg_id, name, msg in entries])
+        self._doorbell.ring()
+        return [msg_id for msg_id, _, _ in entries]
+
+    def receive(self, receiver: str, timeout: Optional[float] = None) -> Optional[Message]:
+        if timeout:
+            return self._wait(receiver, timeout)
+        batch = self.receive_batch(receiver, 1)
+        return batch[0] if batch else None
+
+    def receive_batch(self, receiver: str, n: int) -> List[Message]:
+        with self._lock:
+            inbox = self._inboxes.get(_normalize_receiver(receiver))
+            if not inbox or n <= 0:
+                return []
+            taken = [inbox.popleft() for _ in range(min(n, len(inbox)))]
+            if self._log is not None:
+                self._log.append([{"op": "ack", "id": msg_id} for msg_id, _ in taken])
+                self._acked += len(taken)
+                if self._acked > self.compact_after:
+                    self._compact_log()
+        return [msg for _, msg in taken]
+
+    def _compact_log(self):
+        # Caller holds self._lock, so the snapshot is ordered with every logged send and ack
+        unread = sum(len(inbox) for inbox in self._inboxes.values())
+        if self._acked <= unread:
+            return
+        self._log.rewrite([
+            _send_record(msg_id, name, msg)
+            for name, inbox in self._inboxes.items() for msg_id, msg in inbox
+        ])
+        self._acked = 0
+
+    def pending(self, receiver: str) -> int:
+        """Number of unread messages queued for receiver."""
+        inbox = self._inboxes.get(_normalize_receiver(receiver))
+        return len(inbox) if inbox else 0
+
+    def flush(self):
+        """Block until every logged send and receive has reached the log file."""
+        if self._log is not None:
+            self._log.flush()
+
+
+def _send_record(msg_id: str, name: str, msg: Message) -> dict:
+    return {"op": "send", "id": msg_id, "to": name, "from": msg.sender,
+            "content": msg.content, "ts": msg.timestamp}
+
+
+def _write_snapshot(path: str, records: List[dict]):
+    """Replace the file at path with records, atomically."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write("".join(json.dumps(record) + "\n" for record in records))
+    os.replace(tmp, path)
+
+
+class _Snapshot:
+    """A queued rewrite: the log's whole content as of the moment it was queued."""
+
+    def __init__(self, records: List[dict]):
+        self.records = records
+
+
+class _WriteBehindLog:
+    """A JSON-lines file appended to from a daemon thread.
+
+    append() only queues records. The thread writes whatever has queued
+    up since its last write in one go, so writes batch themselves under load.
+    rewrite() queues a replacement for the whole file, which the same
+    thread swaps in, in order with the appends around it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._queued: List[dict] = []
+        self._writing = False
+        self._cond = threading.Condition()
+        # Opened here so a bad path fails the caller, not the writer thread
+        self._file = open(path, "a", encoding="utf-8")
+        threading.Thread(target=self._run, name="hw-memory-log", daemon=True).start()
+        atexit.register(self.flush)
+
+    def append(self, records: List[dict]):
+        with self._cond:
+            self._queued.extend(records)
+            self._cond.notify_all()
+
+    def rewrite(self, records: List[dict]):
+        with self._cond:
+            self._queued.append(_Snapshot(records))
+            self._cond.notify_all()
+
+    def flush(self):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._queued and not self._writing)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queued)
+                batch, self._queued = self._queued, []
+                self._writing = True
+            try:
+                lines = []
+                for item in batch:
+                    if isinstance(item, _Snapshot):
+                        # The snapshot already holds what was queued before it
+                        lines = []
+                        self._file.close()
+                        try:
+                            _write_snapshot(self.path, item.records)
+                        finally:
+                            self._file = open(self.path, "a", encoding="utf-8")
+                    else:
+                        lines.append(json.dumps(item) + "\n")
+                self._file.write("".join(lines))
+                self._file.flush()
+            except OSError as e:
+                # Keep serving: a dead writer would leave flush() waiting forever
+                print(f"[message_bus] memory log write to {self.path} failed: {e}", file=sys.stderr)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    @staticmethod
+    def replay(path: str) -> List[Tuple[str, str, Message]]:
+        """The unread (msg_id, receiver, Message) entries in a log, oldest first.
+
+        Rewrites the log to hold just those entries, so it does not grow
+        across restarts. A torn last line from a crash is skipped.
+        """
+        unread: Dict[str, Tuple[str, str, Message]] = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get("op") == "send":
+                        unread[record["id"]] = (record["id"], record["to"], Message(
+                            sender=record["from"], content=record["content"], timestamp=record["ts"],
+                        ))
+                    elif record.get("op") == "ack":
+                        unread.pop(record.get("id"), None)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        entries = list(unread.values())
+        _write_snapshot(path, [_send_record(msg_id, name, msg) for msg_id, name, msg in entries])
+        return entries
 
 
 # ---------------------------------------------------------------------------
@@ -203,6 +893,8 @@ def _get_transport() -> Transport:
         _transport = TwitterTransport()
     elif name == "sqlite":
         _transport = SQLiteTransport()
+    elif name == "memory":
+        _transport = MemoryTransport(log_path=os.environ.get("HW_MEMORY_LOG"))
     else:
         _transport = FileTransport()
     return _transport
@@ -240,9 +932,29 @@ def send(sender: str, receiver: str, content: str) -> str:
     return _get_transport().send(sender, receiver, content)
 
 
-def receive(receiver: str) -> Optional[Message]:
-    """HelloWorld #receive — read the oldest message from a receiver's inbox."""
-    return _get_transport().receive(receiver)
+def receive(receiver: str, timeout: Optional[float] = None) -> Optional[Message]:
+    """HelloWorld #receive — read the oldest message from a receiver's inbox.
+
+    With a timeout, block up to that many seconds for a message to arrive.
+    """
+    if timeout is None:
+        return _get_transport().receive(receiver)
+    return _get_transport().receive(receiver, timeout=timeout)
+
+
+async def areceive(receiver: str, timeout: Optional[float] = None) -> Optional[Message]:
+    """Awaitable receive(): waits without blocking the event loop."""
+    return await _get_transport().areceive(receiver, timeout)
+
+
+def send_many(messages: Iterable[Tuple[str, str, str]]) -> List[str]:
+    """Deliver several (sender, receiver, content) messages at once."""
+    return _get_transport().send_many(messages)
+
+
+def receive_batch(receiver: str, n: int) -> List[Message]:
+    """Read up to n of the oldest messages from a receiver's inbox."""
+    return _get_transport().receive_batch(receiver, n)
 
 
 def hello(sender: str) -> str:
@@ -2,7 +2,9 @@
 Managed by: Gemini
 """
 
-from typing import List, Optional, Union, Dict
+import bisect
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 from lexer import Lexer, Token, TokenType
 from ast_nodes import (
     Node, SymbolNode, ReceiverNode, LiteralNode,
@@ -27,16 +29,21 @@ class ValueType(Enum):
     RECEIVER = auto()
 
 class Parser:
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
+    def __init__(self, tokens: Iterable[Token]):
+        # A list is used as-is; any other iterable (e.g. Lexer.iter_tokens())
+        # is pulled into self.tokens only as far as the parser has looked.
+        self._stream: Optional[Iterator[Token]] = None
+        if isinstance(tokens, list):
+            self.tokens = tokens
+        else:
+            self.tokens = []
+            self._stream = iter(tokens)
         self.pos = 0
     
     @classmethod
     def from_source(cls, source: str) -> 'Parser':
-        """Create a Parser from source code."""
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        return cls(tokens)
+        """Create a Parser that lexes source lazily as it parses."""
+        return cls(Lexer(source).iter_tokens())
 
     def parse(self) -> List[Node]:
         nodes = []
@@ -274,7 +281,153 @@ class Parser:
         return self._peek().type == TokenType.EOF
 
     def _peek(self) -> Token:
+        if self.pos >= len(self.tokens):
+            # Streaming: the lexer ends with EOF, past which the parser never advances
+            self.tokens.append(next(self._stream))
         return self.tokens[self.pos]
 
     def _previous(self) -> Token:
         return self.tokens[self.pos - 1]
+
+
+# Start of every "## " line, i.e. every candidate H2 section.
+_SECTION_START = re.compile(r'^## ', re.MULTILINE)
+# A section that lexes the same on its own: the "## " line followed only by
+# "- " items and blank lines, so no string or comment can cross its edges.
+_PLAIN_SECTION = re.compile(r'## [^\n]*(?:\n(?:- [^\n]*|[ \t]*))*')
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the longest common prefix, bisecting on slice compares."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the longest common suffix, at most limit."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:len(a) - lo] == b[len(b) - mid:len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+class IncrementalParser:
+    """Parses successive versions of one .hw document, re-lexing only edited H2 sections.
+
+    After a full parse the source is split at its "## " lines and the
+    HeadingNode of each section is kept with the section's offset. When
+    every section is plain markdown hanging off the receiver's H1, a later
+    parse() diffs the new source against the previous one and re-lexes
+    only the sections the change overlaps. Edits to the preamble (H1,
+    identity, frontmatter) or to non-plain sections fall back to a full
+    parse, so the result always equals Parser.from_source(source).parse().
+    """
+
+    def __init__(self):
+        self.source: Optional[str] = None
+        self.full_parses = 0
+        self.sections_reparsed = 0
+        self._incremental = False
+        self._head: List[Node] = []               # top-level nodes before the H1
+        self._h1: Optional[HeadingNode] = None    # the H1 with its identity children
+        self._starts: List[int] = []              # offset of each "## " section
+        self._sections: List[HeadingNode] = []
+
+    def parse(self, source: str) -> List[Node]:
+        if self._incremental and self.source is not None:
+            if source == self.source or self._reparse_changed(source):
+                self.source = source
+                return self._compose()
+        return self._full_parse(source)
+
+    def _full_parse(self, source: str) -> List[Node]:
+        self.source, self._incremental = None, False
+        nodes = Parser.from_source(source).parse()
+        self.full_parses += 1
+        self.source = source
+        self._index(source, nodes)
+        return nodes
+
+    def _index(self, source: str, nodes: List[Node]):
+        """Split a fully parsed source into sections, if it is safe to re-parse them alone."""
+        starts = [m.start() for m in _SECTION_START.finditer(source)]
+        if not starts or not nodes:
+            return
+        bounds = starts + [len(source)]
+        if not all(_PLAIN_SECTION.fullmatch(source, bounds[k], bounds[k + 1])
+                   for k in range(len(starts))):
+            return
+        try:
+            head = Parser.from_source(source[:starts[0]]).parse()
+        except SyntaxError:
+            return
+        if not head or not isinstance(head[-1], HeadingNode) or head[-1].level != 1:
+            return
+        h1, whole = head[-1], nodes[-1]
+        n_identity = len(h1.children)
+        # The preamble must parse the same alone, and every section must attach to its H1
+        if (nodes[:-1] != head[:-1] or not isinstance(whole, HeadingNode)
+                or (whole.level, whole.name, whole.parent) != (1, h1.name, h1.parent)
+                or whole.children[:n_identity] != h1.children
+                or len(whole.children) != n_identity + len(starts)):
+            return
+        self._head, self._h1 = head[:-1], h1
+        self._starts = starts
+        self._sections = whole.children[n_identity:]
+        self._incremental = True
+
+    def _reparse_changed(self, source: str) -> bool:
+        """Re-parse the sections an edit overlaps. False means a full parse is needed."""
+        old = self.source
+        prefix = _common_prefix(old, source)
+        old_end = len(old) - _common_suffix(old, source, min(len(old), len(source)) - prefix)
+        # First affected section: the last whose "## " and preceding newline are untouched
+        i = bisect.bisect_right(self._starts, prefix - 3) - 1
+        if i < 0:
+            return False  # The preamble changed
+        # First unaffected section: its preceding newline lies after the change
+        j = bisect.bisect_right(self._starts, old_end)
+        delta = len(source) - len(old)
+        lo = self._starts[i]
+        hi = self._starts[j] + delta if j < len(self._starts) else len(source)
+
+        # Sections inside the span whose text did not change keep their nodes
+        old_bounds = self._starts[i:j] + [self._starts[j] if j < len(self._starts) else len(old)]
+        unchanged = {
+            old[old_bounds[k]:old_bounds[k + 1]]: node
+            for k, node in enumerate(self._sections[i:j])
+        }
+        starts = [m.start() for m in _SECTION_START.finditer(source, lo, hi)]
+        bounds = starts + [hi]
+        sections = []
+        reparsed = 0
+        for k, start in enumerate(starts):
+            text = source[start:bounds[k + 1]]
+            node = unchanged.get(text)
+            if node is None:
+                if not _PLAIN_SECTION.fullmatch(text):
+                    return False
+                node, = Parser.from_source(text).parse()
+                reparsed += 1
+            sections.append(node)
+
+        self._starts[i:] = starts + [start + delta for start in self._starts[j:]]
+        self._sections[i:j] = sections
+        self.sections_reparsed += reparsed
+        return True
+
+    def _compose(self) -> List[Node]:
+        h1 = self._h1
+        root = HeadingNode(level=1, name=h1.name, parent=h1.parent,
+                           children=h1.children + self._sections)
+        return self._head + [root]
@@ -149,3 +149,22 @@ def collision_prompt(
     lines.append(f"Both hold {symbol_name} natively but with different meaning.")
     lines.append("Voice both perspectives, then synthesize what neither could say alone.")
     return "\n".join(lines)
+
+
+def memory_digest_prompt(
+    agent_name: str,
+    sender: str,
+    tag: str,
+    memories: List[str],
+) -> str:
+    """Build prompt for rolling old memories of one sender into a digest."""
+    lines = [
+        f"You are {agent_name}. These are your oldest {tag} memories involving {sender}, oldest first:",
+        "",
+    ]
+    lines.extend(memories)
+    lines.append("")
+    lines.append("They are about to be deleted. Summarize what is worth remembering about "
+                 f"{sender} from them: decisions, preferences, open threads, recurring themes.")
+    lines.append("Respond in at most 10 short bullet points.")
+    return "\n".join(lines)
@@ -2,8 +2,6 @@
 
 import os
 import sys
-import time
-from pathlib import Path
 from typing import Optional
 
 from ast_nodes import ReceiverNode, MessageNode, ScopedLookupNode, UnaryMessageNode, VocabularyQueryNode
@@ -211,19 +209,17 @@ class REPL:
             else:
                 print(f"  {name}: (not present)")
 
-    def _show_collisions(self, count: int = 10):
-        """Show last N entries from collisions.log."""
-        log_path = Path(self.dispatcher.log_file)
-        if not log_path.exists():
+    def _show_collisions(self, count: int = 10, receiver: Optional[str] = None,
+                         symbol: Optional[str] = None, status: Optional[str] = None):
+        """Show the last N collision events, optionally filtered."""
+        events = self.dispatcher.collisions.query(
+            receiver=receiver, symbol=symbol, status=status, limit=count,
+        )
+        if not events:
             print(f"{self.YELLOW}No collisions recorded.{self.RESET}")
             return
-        lines = log_path.read_text().strip().split("\n")
-        if not lines or lines == [""]:
-            print(f"{self.YELLOW}No collisions recorded.{self.RESET}")
-            return
-        recent = lines[-count:]
-        for line in recent:
-            print(f"  {line}")
+        for event in events:
+            print(f"  {event.line}")
 
     def _toggle_trace(self, mode: str):
         """Toggle dispatch tracing on or off."""
@@ -267,7 +263,7 @@ class REPL:
         print("  .chain <Receiver>           Show inheritance chain")
         print("  .lookup <Receiver> #symbol  Lookup outcome + description")
         print("  .super <Receiver> #symbol   Walk chain with descriptions")
-        print("  .collisions [N]             Last N collision log entries")
+        print("  .collisions [N] [filters]   Last N collisions (Receiver, #symbol, resolved|unresolved)")
         print("  .trace on|off               Toggle dispatch tracing")
         print()
         print(f"{self.BOLD}Syntax:{self.RESET}")
@@ -292,18 +288,15 @@ class REPL:
         return None
 
     def _query_daemon(self, target: str, source: str, timeout: float = 30.0) -> str:
-        """Send source to a daemon via message bus and poll for response."""
+        """Send source to a daemon via message bus and wait for its response."""
         repl_id = "REPL"
         # Drain any stale messages for REPL
         while message_bus.receive(repl_id):
             pass
         message_bus.send(repl_id, target, source)
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            msg = message_bus.receive(repl_id)
-            if msg:
-                return msg.content
-            time.sleep(0.25)
+        msg = message_bus.receive(repl_id, timeout=timeout)
+        if msg:
+            return msg.content
         return "(daemon did not respond within timeout)"
 
     def start(self):
@@ -378,8 +371,17 @@ class REPL:
                     continue
 
                 if text.startswith('.collisions'):
-                    count = int(parts[1]) if len(parts) > 1 else 10
-                    self._show_collisions(count)
+                    filters = {"count": 10}
+                    for arg in parts[1:]:
+                        if arg.isdigit():
+                            filters["count"] = int(arg)
+                        elif arg.startswith("#"):
+                            filters["symbol"] = arg
+                        elif arg.lower() in ("resolved", "unresolved"):
+                            filters["status"] = arg.lower()
+                        else:
+                            filters["receiver"] = arg
+                    self._show_collisions(**filters)
                     continue
 
                 if text.startswith('.trace ') and len(parts) == 2:
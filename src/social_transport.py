@@ -19,6 +19,8 @@ class SocialTransport(Transport):
     Social methods are opt-in — defaults raise NotImplementedError.
     """
 
+    POLL_INTERVAL = 2.0   # blocking receives poll a remote API; stay well inside rate limits
+
     # --- Posts / Public Timeline ---
 
     def post(self, content: str, parent_id: Optional[str] = None) -> dict:
@@ -232,8 +232,10 @@ class TwitterTransport(SocialTransport):
         msg_id = f"msg-{uuid.uuid4().hex[:8]}"
         return msg_id
 
-    def receive(self, receiver: str) -> Optional[Message]:
+    def receive(self, receiver: str, timeout: Optional[float] = None) -> Optional[Message]:
         """Poll for new DMs since the last check."""
+        if timeout:
+            return self._wait(receiver, timeout)
         path = "/2/dm_events?event_types=MessageCreate&max_results=1"
         if self._last_dm_event_id:
             path += f"&since_id={self._last_dm_event_id}"
@@ -5,15 +5,139 @@ No JSON, no .vocab files. The language defines itself.
 """
 
 import os
-from typing import Set, Optional
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set, Tuple
+
+
+def _bare_symbol(symbol_name: str) -> str:
+    return symbol_name.lstrip("#") if symbol_name != "#" else "#"
+
+
+def _heading_key(name: str) -> str:
+    """Normalize a ## heading to the bare form used for description lookup."""
+    if name != "#" and name.startswith("#"):
+        return name[1:]
+    return name
+
+
+@dataclass
+class HwDocument:
+    """Everything the runtime reads from one parsed .hw file."""
+    parent: Optional[str] = None
+    identity: Optional[str] = None
+    symbols: Set[str] = field(default_factory=set)
+    descriptions: Dict[str, Optional[str]] = field(default_factory=dict)  # bare name → text
+
+    @classmethod
+    def from_source(cls, text: str) -> 'HwDocument':
+        """Parse .hw source once and index it. Unparseable files yield an empty document."""
+        from parser import Parser
+
+        try:
+            nodes = Parser.from_source(text).parse()
+        except Exception:
+            return cls()
+        return cls.from_nodes(nodes)
+
+    @classmethod
+    def from_nodes(cls, nodes) -> 'HwDocument':
+        """Index already-parsed top-level nodes of a .hw file."""
+        from ast_nodes import HeadingNode, DescriptionNode
+
+        doc = cls()
+        seen_h1 = False
+        for node in nodes:
+            if not (isinstance(node, HeadingNode) and node.level == 1):
+                continue
+            if not seen_h1:
+                # The first receiver heading owns parent and identity
+                seen_h1 = True
+                doc.parent = node.parent
+                descs = [c.text for c in node.children if isinstance(c, DescriptionNode)]
+                doc.identity = " ".join(descs) if descs else None
+            for child in node.children:
+                if isinstance(child, HeadingNode) and child.level == 2:
+                    name = child.name
+                    doc.symbols.add(name if name.startswith("#") else f"#{name}")
+                    descs = [c.text for c in child.children if isinstance(c, DescriptionNode)]
+                    doc.descriptions.setdefault(
+                        _heading_key(name), " ".join(descs) if descs else None,
+                    )
+        return doc
 
 
 class VocabularyManager:
     def __init__(self, storage_dir: str = "vocabularies"):
         self.storage_dir = storage_dir
+        # path → ((mtime_ns, size), parsed document)
+        self._documents: Dict[str, Tuple[Tuple[int, int], HwDocument]] = {}
+        # path → incremental parse state, kept only for files that change while cached
+        self._parsers: Dict[str, 'IncrementalParser'] = {}
+        self._lock = threading.Lock()   # serializes cache misses from concurrent dispatch
         if not os.path.exists(self.storage_dir):
             os.makedirs(self.storage_dir)
 
+    def _document(self, path: str) -> Optional[HwDocument]:
+        """Return the parsed document for path, re-parsing only when the file changed.
+
+        Entries are keyed by (mtime, size), so edits made outside this
+        manager are picked up on the next read. Once a file has changed
+        under the cache it gets an IncrementalParser, and later versions
+        re-lex only the ## sections that differ.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._documents.pop(path, None)
+            self._parsers.pop(path, None)
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._documents.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        with self._lock:
+            try:
+                with open(path, "r") as f:
+                    text = f.read()
+            except OSError:
+                return None
+            parser = self._parsers.get(path)
+            if parser is None and cached is not None:
+                parser = self._parsers[path] = self._new_parser()
+            if parser is None:
+                doc = HwDocument.from_source(text)
+            else:
+                try:
+                    doc = HwDocument.from_nodes(parser.parse(text))
+                except Exception:
+                    doc = HwDocument()
+            self._documents[path] = (stamp, doc)
+        return doc
+
+    @staticmethod
+    def _new_parser() -> 'IncrementalParser':
+        from parser import IncrementalParser
+        return IncrementalParser()
+
+    def _edited(self, path: str):
+        """Drop the cached document for a file this manager just wrote, keeping its parse state."""
+        self._documents.pop(path, None)
+        self._parsers.setdefault(path, self._new_parser())
+
+    def prime(self, path: str, stamp: Tuple[int, int], doc: HwDocument):
+        """Seed the cache with a document parsed elsewhere (e.g. during bootstrap)."""
+        self._documents[path] = (stamp, doc)
+
+    def invalidate(self, receiver_name: Optional[str] = None):
+        """Drop cached documents for one receiver, or all of them."""
+        if receiver_name is None:
+            self._documents.clear()
+            self._parsers.clear()
+        else:
+            self._documents.pop(self._get_path(receiver_name), None)
+            self._parsers.pop(self._get_path(receiver_name), None)
+
     def save(self, receiver_name: str, vocabulary: Set[str], parent: str = None,
              descriptions: dict = None):
         """Persist a receiver's vocabulary to its .hw file.
@@ -39,6 +163,7 @@ class VocabularyManager:
                     lines.append(f"- {desc}\n")
             with open(path, "w") as f:
                 f.writelines(lines)
+            self._edited(path)
         elif new_symbols:
             # Append new symbols to existing file
             with open(path, "a") as f:
@@ -50,34 +175,19 @@ class VocabularyManager:
                         f.write(f"- {desc}\n")
                     else:
                         f.write("- (learned through dialogue)\n")
+            self._edited(path)
 
     def load(self, receiver_name: str) -> Optional[Set[str]]:
         """Load a receiver's vocabulary from its .hw file."""
-        path = self._get_path(receiver_name)
-        if not os.path.exists(path):
+        doc = self._document(self._get_path(receiver_name))
+        if doc is None:
             return None
-        symbols = self._read_symbols(path)
-        return symbols if symbols is not None else set()
+        return set(doc.symbols)
 
     def load_parent(self, receiver_name: str) -> Optional[str]:
         """Read parent name from .hw file's # Name : Parent heading."""
-        path = self._get_path(receiver_name)
-        if not os.path.exists(path):
-            return None
-
-        from parser import Parser
-        from ast_nodes import HeadingNode
-
-        try:
-            text = open(path, "r").read()
-            nodes = Parser.from_source(text).parse()
-        except Exception:
-            return None
-
-        for node in nodes:
-            if isinstance(node, HeadingNode) and node.level == 1:
-                return node.parent
-        return None
+        doc = self._document(self._get_path(receiver_name))
+        return doc.parent if doc else None
 
     def load_description(self, receiver_name: str, symbol_name: str) -> Optional[str]:
         """Read the description text from a .hw file for a given symbol.
@@ -85,58 +195,17 @@ class VocabularyManager:
         Looks for a ## heading matching symbol_name under the receiver's
         HEADING1 node, then returns the concatenated description lines.
         """
-        path = self._get_path(receiver_name)
-        if not os.path.exists(path):
-            return None
-
-        from parser import Parser
-        from ast_nodes import HeadingNode, DescriptionNode
-
-        try:
-            text = open(path, "r").read()
-            nodes = Parser.from_source(text).parse()
-        except Exception:
+        doc = self._document(self._get_path(receiver_name))
+        if doc is None:
             return None
-
         # Strip leading # from symbol_name for heading comparison
         bare = symbol_name.lstrip("#") if symbol_name != "#" else "#"
-
-        for node in nodes:
-            if isinstance(node, HeadingNode) and node.level == 1:
-                for child in node.children:
-                    if isinstance(child, HeadingNode) and child.level == 2:
-                        if child.name == bare or child.name == f"#{bare}":
-                            # Collect all description children
-                            descs = [
-                                c.text for c in child.children
-                                if isinstance(c, DescriptionNode)
-                            ]
-                            return " ".join(descs) if descs else None
-        return None
+        return doc.descriptions.get(bare)
 
     def load_identity(self, receiver_name: str) -> Optional[str]:
         """Read the receiver's top-level description (the list items after # Name)."""
-        path = self._get_path(receiver_name)
-        if not os.path.exists(path):
-            return None
-
-        from parser import Parser
-        from ast_nodes import HeadingNode, DescriptionNode
-
-        try:
-            text = open(path, "r").read()
-            nodes = Parser.from_source(text).parse()
-        except Exception:
-            return None
-
-        for node in nodes:
-            if isinstance(node, HeadingNode) and node.level == 1:
-                descs = [
-                    c.text for c in node.children
-                    if isinstance(c, DescriptionNode)
-                ]
-                return " ".join(descs) if descs else None
-        return None
+        doc = self._document(self._get_path(receiver_name))
+        return doc.identity if doc else None
 
     def update_description(self, receiver_name: str, symbol_name: str, description: str):
         """Replace the description of an existing symbol, or append the symbol if absent.
@@ -145,68 +214,57 @@ class VocabularyManager:
         `- ` description lines under it, and writes the file back.  If the symbol
         is not present in the file, appends a new ## heading with the description.
         """
+        self.update_descriptions(receiver_name, {symbol_name: description})
+
+    def update_descriptions(self, receiver_name: str, descriptions: Dict[str, str]):
+        """update_description for several symbols with one read and one write of the file."""
+        if not descriptions:
+            return
         path = self._get_path(receiver_name)
         if not os.path.exists(path):
-            # No file yet — create one with just this symbol
-            bare = symbol_name.lstrip("#") if symbol_name != "#" else "#"
+            # No file yet — create one with just these symbols
             with open(path, "w") as f:
                 f.write(f"# {receiver_name}\n")
-                f.write(f"## {bare}\n")
-                f.write(f"- {description}\n")
+                for symbol_name, description in descriptions.items():
+                    f.write(f"## {_bare_symbol(symbol_name)}\n")
+                    f.write(f"- {description}\n")
+            self._edited(path)
             return
 
         lines = open(path, "r").readlines()
-        bare = symbol_name.lstrip("#") if symbol_name != "#" else "#"
-
-        # Find the ## heading that matches the symbol
-        heading_idx = None
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith("## "):
-                heading_name = stripped[3:].strip()
-                if heading_name == bare or heading_name == f"#{bare}":
-                    heading_idx = i
-                    break
-
-        if heading_idx is not None:
-            # Remove old description lines immediately after the heading
-            desc_start = heading_idx + 1
-            desc_end = desc_start
-            while desc_end < len(lines) and lines[desc_end].startswith("- "):
-                desc_end += 1
-            # Replace with new description
-            new_lines = lines[:desc_start] + [f"- {description}\n"] + lines[desc_end:]
-            with open(path, "w") as f:
-                f.writelines(new_lines)
-        else:
-            # Symbol not in file — append
-            with open(path, "a") as f:
-                f.write(f"## {bare}\n")
-                f.write(f"- {description}\n")
+        appended = []
+        for symbol_name, description in descriptions.items():
+            bare = _bare_symbol(symbol_name)
+
+            # Find the ## heading that matches the symbol
+            heading_idx = None
+            for i, line in enumerate(lines):
+                stripped = line.strip()
+                if stripped.startswith("## "):
+                    heading_name = stripped[3:].strip()
+                    if heading_name == bare or heading_name == f"#{bare}":
+                        heading_idx = i
+                        break
+
+            if heading_idx is not None:
+                # Replace the description lines immediately after the heading
+                desc_start = heading_idx + 1
+                desc_end = desc_start
+                while desc_end < len(lines) and lines[desc_end].startswith("- "):
+                    desc_end += 1
+                lines[desc_start:desc_end] = [f"- {description}\n"]
+            else:
+                # Symbol not in file — append
+                appended += [f"## {bare}\n", f"- {description}\n"]
+
+        with open(path, "w") as f:
+            f.writelines(lines + appended)
+        self._edited(path)
 
     def _read_symbols(self, path: str) -> Set[str]:
         """Parse a .hw file and extract symbol names from ## headings."""
-        if not os.path.exists(path):
-            return set()
-
-        from parser import Parser
-        from ast_nodes import HeadingNode
-
-        try:
-            text = open(path, "r").read()
-            nodes = Parser.from_source(text).parse()
-        except Exception:
-            return set()
-
-        symbols = set()
-        for node in nodes:
-            if isinstance(node, HeadingNode) and node.level == 1:
-                for child in node.children:
-                    if isinstance(child, HeadingNode) and child.level == 2:
-                        name = child.name
-                        sym = name if name.startswith("#") else f"#{name}"
-                        symbols.add(sym)
-        return symbols
+        doc = self._document(path)
+        return set(doc.symbols) if doc else set()
 
     def _get_path(self, receiver_name: str) -> str:
         """Case-preserving path: ReceiverName.hw"""
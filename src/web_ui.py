@@ -14,9 +14,8 @@ Usage:
 import json
 import re
 import threading
-import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 
@@ -35,7 +34,7 @@ class EventBus:
 
     def __init__(self):
         self._subscribers: List[list] = []
-        self._lock = threading.Lock()
+        self._lock = threading.Condition()   # notified on every publish
 
     def subscribe(self) -> list:
         """Return a new subscriber queue."""
@@ -58,6 +57,12 @@ class EventBus:
         with self._lock:
             for q in self._subscribers:
                 q.append((event_type, payload))
+            self._lock.notify_all()
+
+    def wait(self, q: list, timeout: float) -> bool:
+        """Block until q holds an event or timeout passes. True if q is non-empty."""
+        with self._lock:
+            return self._lock.wait_for(lambda: bool(q), timeout)
 
 
 # ---------------------------------------------------------------------------
@@ -83,7 +88,9 @@ class HelloWorldWebUI:
     def start(self):
         """Start the HTTP server (blocking)."""
         handler_class = self._make_handler()
-        server = HTTPServer((self.host, self.port), handler_class)
+        # A thread per request: SSE streams and collision long-polls stay open
+        server = ThreadingHTTPServer((self.host, self.port), handler_class)
+        server.daemon_threads = True
         print(f"HelloWorld Web UI: http://{self.host}:{self.port}")
         try:
             server.serve_forever()
@@ -249,13 +256,35 @@ class HelloWorldWebUI:
                 self._send_json({"receiver": name, "messages": messages, "count": len(messages)})
 
             def _handle_collisions(self):
-                log_path = Path(ui.dispatcher.log_file)
-                if not log_path.exists():
-                    self._send_json({"collisions": [], "count": 0})
+                """Newest matching events. Filters: receiver, symbol, status, kind, since, until.
+
+                after=<id> returns only newer events; with wait=<seconds> it
+                long-polls until one arrives (tail-follow for dashboards).
+                """
+                query = parse_qs(urlsplit(self.path).query)
+
+                def arg(key):
+                    return query.get(key, [None])[0]
+
+                filters = {key: arg(key) for key in ("receiver", "symbol", "status", "kind", "since", "until")}
+                try:
+                    limit = min(int(arg("limit") or 50), 500)
+                    after = int(arg("after")) if arg("after") else None
+                    wait = min(float(arg("wait") or 0), 30.0)
+                except ValueError:
+                    self._send_json({"error": "limit, after and wait must be numbers"}, 400)
                     return
-                lines = log_path.read_text().strip().split("\n")
-                lines = [l for l in lines if l.strip()]
-                self._send_json({"collisions": lines[-50:], "count": len(lines)})
+                store = ui.dispatcher.collisions
+                if after is not None and wait > 0 and not any(filters.values()):
+                    events = store.follow(after, timeout=wait, limit=limit)
+                else:
+                    events = store.query(after_id=after, limit=limit, **filters)
+                self._send_json({
+                    "collisions": [e.line for e in events],
+                    "events": [e.to_dict() for e in events],
+                    "count": store.count(**filters),
+                    "last_id": events[-1].id if events else (after or store.last_id()),
+                })
 
             def _handle_agents(self):
                 agents = []
@@ -335,11 +364,15 @@ class HelloWorldWebUI:
                 q = ui.events.subscribe()
                 try:
                     while True:
+                        if not ui.events.wait(q, timeout=15.0):
+                            # Idle: a comment line keeps proxies open and finds dead clients
+                            self.wfile.write(b": keepalive\n\n")
+                            self.wfile.flush()
+                            continue
                         while q:
                             event_type, payload = q.pop(0)
                             self.wfile.write(f"event: {event_type}\ndata: {payload}\n\n".encode())
                             self.wfile.flush()
-                        time.sleep(0.5)
                 except (BrokenPipeError, ConnectionResetError):
                     pass
                 finally:
@@ -74,6 +74,9 @@ def _no_llm_keys(monkeypatch):
     LLM keys in the environment would activate the interpretive path and break
     assertions on structural output. Tests that need a real or mock LLM should
     set the key explicitly or inject a mock via dispatcher.llm.
+
+    The LLM response cache is off too, so no test is answered from another
+    test's cache and none writes storage/llm_cache.db into the checkout.
     """
     monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
     monkeypatch.delenv("GEMINI_API_KEY", raising=False)
@@ -81,6 +84,7 @@ def _no_llm_keys(monkeypatch):
     monkeypatch.delenv("GITHUB_COPILOT_TOKEN", raising=False)
     monkeypatch.delenv("HW_TRANSPORT", raising=False)
     monkeypatch.delenv("CLWNT_TOKEN", raising=False)
+    monkeypatch.setenv("HW_LLM_CACHE", "0")
 
 
 @pytest.fixture
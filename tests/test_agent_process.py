@@ -196,3 +196,23 @@ def test_build_system_prompt(agent):
     assert "Claude" in prompt
     assert "Vocabulary" in prompt
     assert "Constraints" in prompt
+
+
+# ------------------------------------------------------------------
+# Memory compaction
+# ------------------------------------------------------------------
+
+def test_compact_interval_from_env(tmp_vocab, tmp_path, monkeypatch):
+    monkeypatch.setattr(message_bus, "BASE_DIR", tmp_path / "runtimes")
+    monkeypatch.setenv("HW_MEMORY_COMPACT_INTERVAL", "0")
+    assert AgentProcess("Claude", vocab_dir=tmp_vocab).compact_interval == 0
+    assert AgentProcess("Claude", vocab_dir=tmp_vocab, compact_interval=60).compact_interval == 60
+
+
+def test_compact_memory_reports_in_status(agent):
+    for i in range(3):
+        agent.memory.store(f"message {i}", title=f"interaction-Gemini-{i}", tags=["ooda-r", "Gemini"])
+    assert agent.status()["last_compaction"] is None
+    report = asyncio.run(agent.compact_memory())
+    assert report.entries_removed == 0
+    assert agent.status()["last_compaction"]["entries_removed"] == 0
@@ -5,6 +5,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
+import asyncio
 import os
 import pytest
 from claude_llm import ClaudeModel, has_anthropic_key
@@ -105,6 +106,41 @@ class TestCallParallel:
         assert "friction" in results[1]
 
 
+class TestAsyncCall:
+    def test_acall_mock_mode(self):
+        model = ClaudeModel(api_key=None)
+        result = asyncio.run(model.acall("interpret: #Sunyata"))
+        assert result == model.call("interpret: #Sunyata")
+
+    def test_acall_parser_func(self):
+        model = ClaudeModel(api_key=None)
+        result = asyncio.run(model.acall("hello", parser_func=lambda s: s.upper()))
+        assert result == result.upper()
+
+    def test_acall_shares_async_client(self):
+        """Real-mode acall sends the same request as call, through one reused client."""
+        class _Messages:
+            def __init__(self):
+                self.requests = []
+
+            async def create(self, **kwargs):
+                self.requests.append(kwargs)
+                block = type("Block", (), {"text": " synthesized "})()
+                return type("Response", (), {"content": [block]})()
+
+        model = ClaudeModel(api_key="test-key", system_prompt="You are Claude.")
+        messages = _Messages()
+        model._async_client = type("Client", (), {"messages": messages})()
+
+        async def both():
+            return await asyncio.gather(model.acall("one"), model.acall("two", system="Override."))
+
+        assert asyncio.run(both()) == ["synthesized", "synthesized"]
+        assert messages.requests[0] == model._request("one")
+        assert messages.requests[0]["system"] == "You are Claude."
+        assert messages.requests[1]["system"] == "Override."
+
+
 class TestEvaluateFidelity:
     def test_high_fidelity(self):
         model = ClaudeModel(api_key=None)
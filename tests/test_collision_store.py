@@ -0,0 +1,183 @@
+"""Tests for the indexed collision event store."""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import message_bus
+from collision_store import CollisionStore, PendingCollisions
+from dispatcher import Dispatcher
+
+
+def _store(**kwargs):
+    tmp = Path(tempfile.mkdtemp())
+    return CollisionStore(str(tmp / "collisions.log"), **kwargs), tmp
+
+
+def _record(store, kind, receiver, symbol, ts, **fields):
+    line = f"[{ts}] {kind.upper()}: {receiver} {symbol}"
+    return store.record(kind, receiver, symbol, line=line, ts=ts, **fields)
+
+
+def test_record_writes_row_and_log_line():
+    store, tmp = _store()
+    event_id = _record(store, "collision", "Gemini", "#fire", "2026-01-01T00:00:00", other="Claude")
+    assert event_id == 1
+    assert (tmp / "collisions.log").read_text() == "[2026-01-01T00:00:00] COLLISION: Gemini #fire\n"
+    event = store.tail(1)[0]
+    assert (event.kind, event.receiver, event.other, event.symbol) == ("collision", "Gemini", "Claude", "#fire")
+
+
+def test_query_filters_by_receiver_symbol_status_and_time():
+    store, _ = _store()
+    _record(store, "unknown", "Codex", "#parse", "2026-01-01T00:00:00")
+    _record(store, "collision", "Gemini", "#fire", "2026-01-02T00:00:00", other="Claude")
+    _record(store, "collision", "Gemini", "#fire", "2026-01-03T00:00:00", other="Claude",
+            status="unresolved", collision_id="c1")
+    _record(store, "collision", "Codex", "#fire", "2026-01-04T00:00:00", other="Copilot",
+            status="resolved", collision_id="c2")
+
+    assert [e.ts[:10] for e in store.query(symbol="#fire")] == ["2026-01-02", "2026-01-03", "2026-01-04"]
+    assert [e.collision_id for e in store.query(status="unresolved")] == ["c1"]
+    # A receiver matches either party of a collision
+    assert len(store.query(receiver="Claude")) == 2
+    assert [e.receiver for e in store.query(receiver="Codex")] == ["Codex", "Codex"]
+    assert [e.ts[:10] for e in store.query(since="2026-01-02", until="2026-01-04")] == ["2026-01-02", "2026-01-03"]
+    assert [e.id for e in store.query(limit=2)] == [3, 4]
+    assert [e.id for e in store.query(after_id=2)] == [3, 4]
+    assert store.count() == 4
+    assert store.count(symbol="#fire", receiver="Gemini") == 2
+    assert store.count(kind="unknown") == 1
+
+
+def test_new_store_backfills_existing_log():
+    tmp = Path(tempfile.mkdtemp())
+    log = tmp / "collisions.log"
+    log.write_text(
+        "[2026-02-23T14:43:11.573748] UNKNOWN: Codex encountered #unknownSymbol\n"
+        "[2026-02-23T14:43:46.112674] COLLISION: Gemini reached for #fire in context of collision with Claude\n"
+        "[2026-02-23T14:43:46.113151] UNRESOLVED COLLISION [68d7e409]: Claude x Gemini on #fire\n"
+        "[2026-02-23T14:44:00.000000] COLLISION: Codex #parse — with Claude\n"
+        "not an event\n"
+    )
+    store = CollisionStore(str(log))
+    events = store.tail(10)
+    assert [e.kind for e in events] == ["unknown", "collision", "collision", "collision"]
+    assert events[1].context == "collision with Claude"
+    assert (events[2].status, events[2].other, events[2].receiver, events[2].collision_id) == \
+        ("unresolved", "Claude", "Gemini", "68d7e409")
+    assert events[3].context == "with Claude"
+    # Reopening does not import the log a second time
+    assert CollisionStore(str(log)).count() == 4
+
+
+def test_follow_wakes_on_new_event():
+    store, _ = _store()
+    first = _record(store, "unknown", "Codex", "#a", "2026-01-01T00:00:00")
+    assert store.follow(first, timeout=0.05) == []
+
+    threading.Timer(0.05, _record, (store, "unknown", "Codex", "#b", "2026-01-01T00:00:01")).start()
+    start = time.monotonic()
+    events = store.follow(first, timeout=5)
+    assert [e.symbol for e in events] == ["#b"]
+    assert time.monotonic() - start < 1.0
+
+
+def test_rotate_keeps_newest_events_and_rolls_the_log():
+    store, tmp = _store(max_events=0, max_log_bytes=200)
+    for i in range(10):
+        _record(store, "unknown", "Codex", f"#s{i}", f"2026-01-01T00:00:{i:02d}")
+    assert store.rotate(keep=3) == 7
+    assert [e.symbol for e in store.tail(10)] == ["#s7", "#s8", "#s9"]
+    assert store.count() == 3
+    # The text log rolled over once it reached max_log_bytes; nothing was lost
+    current = (tmp / "collisions.log").read_text().splitlines()
+    rolled = (tmp / "collisions.log.1").read_text().splitlines()
+    assert 0 < len(current) < 10
+    assert len(rolled) + len(current) == 10
+
+
+def test_dispatcher_collisions_are_queryable():
+    tmp = tempfile.mkdtemp()
+    original_base = message_bus.BASE_DIR
+    # Collision messages and replies go to the temp dir's inboxes, not the checkout's
+    message_bus.BASE_DIR = Path(tmp)
+    message_bus.reset_transport()
+    try:
+        dispatcher = Dispatcher(vocab_dir=tmp)
+        dispatcher.log_file = str(Path(tmp) / "collisions.log")
+        dispatcher.llm = None
+        dispatcher.dispatch_source("QueryA # → [#tide, #moon]")
+        dispatcher.dispatch_source("QueryB # → [#tide, #sun]")
+        dispatcher.dispatch_source("QueryA send: #tide to: QueryB")
+
+        events = dispatcher.collisions.query(symbol="#tide")
+        assert events
+        assert {e.receiver for e in events} == {"QueryB"}
+        assert any(e.status == "unresolved" and e.other == "QueryA" for e in events)
+        assert "#tide" in Path(dispatcher.log_file).read_text()
+    finally:
+        message_bus.BASE_DIR = original_base
+        message_bus.reset_transport()
+
+
+def _collision_text(collision_id, sender, symbol, target):
+    return (
+        f"# From: dispatcher\n# Collision: {collision_id}\n\n"
+        f"@{sender} send: {symbol} to: @{target} 'COLLISION: both hold {symbol} natively'\n"
+    )
+
+
+def test_pending_registry_writes_looks_up_and_removes_by_symbol():
+    inbox = Path(tempfile.mkdtemp()) / "inbox"
+    registry = PendingCollisions(inbox)
+    registry.add("c1", "#fire", "Claude", "Gemini", "msg-1.hw", _collision_text("c1", "Claude", "#fire", "Gemini"))
+    registry.add("c2", "#fire", "Codex", "Gemini", "msg-2.hw", _collision_text("c2", "Codex", "#fire", "Gemini"))
+    assert (inbox / "msg-1.hw").exists()
+    assert registry.symbols() == {"#fire"}
+
+    pending = registry.lookup("#fire")
+    assert (pending.collision_id, pending.sender, pending.target) == ("c1", "Claude", "Gemini")
+    assert registry.remove("c1").file == "msg-1.hw"
+    assert not (inbox / "msg-1.hw").exists()
+    assert registry.lookup("#fire").collision_id == "c2"
+
+    # A file consumed by another inbox reader drops its entry on lookup
+    (inbox / "msg-2.hw").unlink()
+    assert registry.lookup("#fire") is None
+    assert registry.symbols() == set()
+
+
+def test_pending_registry_sync_reads_only_new_inbox_files():
+    inbox = Path(tempfile.mkdtemp()) / "inbox"
+    registry = PendingCollisions(inbox)
+    (inbox / "msg-hello.hw").write_text("# From: Claude\n\nhello\n")
+    (inbox / "msg-foreign.hw").write_text(_collision_text("abc", "Claude", "#tide", "Codex"))
+    assert registry.sync() == {"#tide"}
+    assert registry.lookup("#tide").sender == "Claude"
+
+    reads = []
+    original = Path.read_text
+    Path.read_text = lambda self, *a, **k: reads.append(self.name) or original(self, *a, **k)
+    try:
+        (inbox / "msg-hello.hw").unlink()
+        (inbox / "msg-late.hw").write_text(_collision_text("def", "Codex", "#moon", "Claude"))
+        assert PendingCollisions(inbox).sync() == {"#tide", "#moon"}
+    finally:
+        Path.read_text = original
+    assert reads == ["msg-late.hw"]
+
+
+if __name__ == "__main__":
+    test_record_writes_row_and_log_line()
+    test_query_filters_by_receiver_symbol_status_and_time()
+    test_new_store_backfills_existing_log()
+    test_follow_wakes_on_new_event()
+    test_rotate_keeps_newest_events_and_rolls_the_log()
+    test_dispatcher_collisions_are_queryable()
+    test_pending_registry_writes_looks_up_and_removes_by_symbol()
+    test_pending_registry_sync_reads_only_new_inbox_files()
+    print("All collision store tests passed")
@@ -1,5 +1,6 @@
 """Tests for the HelloWorld dispatcher."""
 
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -799,6 +800,27 @@ def test_collision_cross_session_persistence():
     assert "#flux" in dispatcher2.pending_collision_symbols
 
 
+def test_pending_collisions_resolve_one_registry_entry_at_a_time():
+    """Each deferred collision is its own registry entry; a symbol stays pending until all resolve."""
+    dispatcher, tmpdir = _fresh_dispatcher_with_dir()
+    dispatcher.dispatch_source("RegA # → [#arc, #bow]")
+    dispatcher.dispatch_source("RegB # → [#arc, #line]")
+    dispatcher.dispatch_source("RegC # → [#arc, #curve]")
+    dispatcher.dispatch_source("RegA send: #arc to: RegB")
+    dispatcher.dispatch_source("RegC send: #arc to: RegB")
+    hw_inbox = Path(tmpdir) / "helloworld" / "inbox"
+    assert len(list(hw_inbox.glob("msg-*.hw"))) == 2
+
+    dispatcher.llm = _MockLLM("Arc: a shared curve.")
+    assert dispatcher._resolve_pending_collision("#arc") == "Arc: a shared curve."
+    assert len(list(hw_inbox.glob("msg-*.hw"))) == 1
+    assert "#arc" in dispatcher.pending_collision_symbols
+
+    assert dispatcher._resolve_pending_collision("#arc") is not None
+    assert list(hw_inbox.glob("msg-*.hw")) == []
+    assert "#arc" not in dispatcher.pending_collision_symbols
+
+
 def test_tier1_logs_resolved_collision():
     """Tier 1: resolved collision is logged with RESOLVED status."""
     dispatcher, tmpdir = _fresh_dispatcher_with_dir()
@@ -855,6 +877,443 @@ def test_collision_prompt_includes_descriptions():
     assert 'BetaR describes #light: "A flash of insight."' in prompt
 
 
+def _copied_vocab_dir():
+    """Copy the canonical .hw files into a temp storage dir."""
+    import shutil
+    tmp = tempfile.mkdtemp()
+    message_bus.BASE_DIR = Path(tmp)
+    vocab = Path(tmp) / "vocab"
+    shutil.copytree(Path(__file__).parent.parent / "vocabularies", vocab)
+    return str(vocab)
+
+
+def _registry_state(dispatcher):
+    return {
+        name: (
+            sorted(r.local_vocabulary),
+            r.parent.name if r.parent else None,
+            dict(r.descriptions),
+            r.identity,
+        )
+        for name, r in dispatcher.registry.items()
+    }
+
+
+def test_bootstrap_parses_each_file_once():
+    """Bootstrap lexes and parses every .hw file exactly once."""
+    from unittest.mock import patch
+    vocab = _copied_vocab_dir()
+    n_files = len(list(Path(vocab).glob("*.hw")))
+
+    with patch.object(Parser, "from_source", wraps=Parser.from_source) as parse:
+        Dispatcher(vocab_dir=vocab)
+
+    assert parse.call_count == n_files
+
+
+def test_bootstrap_clones_snapshot_for_unchanged_dir():
+    """A second Dispatcher over unchanged files clones the first one's snapshot."""
+    from unittest.mock import patch
+    import dispatcher as dispatcher_module
+    vocab = _copied_vocab_dir()
+    Dispatcher(vocab_dir=vocab)   # settles any first-run writes
+    first = Dispatcher(vocab_dir=vocab)
+
+    with patch.object(dispatcher_module, "_parse_vocabulary_files") as parse:
+        second = Dispatcher(vocab_dir=vocab)
+
+    parse.assert_not_called()
+    assert _registry_state(second) == _registry_state(first)
+    assert second.registry["Claude"].chain() == ["Claude", "Agent", "HelloWorld"]
+
+
+def test_cloned_dispatchers_do_not_share_state():
+    """Mutating a cloned registry leaves other Dispatchers untouched."""
+    vocab = _copied_vocab_dir()
+    Dispatcher(vocab_dir=vocab)
+    first = Dispatcher(vocab_dir=vocab)
+    second = Dispatcher(vocab_dir=vocab)
+
+    first.registry["Agent"].add_symbol("#cloneProbe")
+
+    assert "#cloneProbe" not in second.registry["Agent"].local_vocabulary
+    assert second.registry["Codex"].lookup("#cloneProbe").is_unknown()
+    assert first.registry["Codex"].lookup("#cloneProbe").is_inherited()
+
+
+def test_bootstrap_snapshot_invalidated_by_file_change():
+    """Editing a .hw file forces a fresh bootstrap."""
+    vocab = _copied_vocab_dir()
+    Dispatcher(vocab_dir=vocab)
+    Dispatcher(vocab_dir=vocab)
+
+    with open(Path(vocab) / "Codex.hw", "a") as f:
+        f.write("## snapshotProbe\n- Added on disk.\n")
+
+    dispatcher = Dispatcher(vocab_dir=vocab)
+    assert "#snapshotProbe" in dispatcher.registry["Codex"].local_vocabulary
+
+
+def test_parallel_bootstrap_matches_serial():
+    """Parsing in a process pool yields the same registry as parsing serially."""
+    from unittest.mock import patch
+    import dispatcher as dispatcher_module
+    vocab = _copied_vocab_dir()
+    Dispatcher(vocab_dir=vocab)
+    dispatcher_module._bootstrap_snapshots.clear()
+    serial = Dispatcher(vocab_dir=vocab)
+    dispatcher_module._bootstrap_snapshots.clear()
+
+    with patch.object(dispatcher_module, "BOOTSTRAP_PARALLEL_THRESHOLD", 1), \
+            patch.object(dispatcher_module.os, "cpu_count", return_value=2), \
+            patch.dict(os.environ, {"HW_VOCAB_IMAGE": "0"}):
+        parallel = Dispatcher(vocab_dir=vocab)
+
+    assert _registry_state(parallel) == _registry_state(serial)
+
+
+def _fresh_process_bootstrap(vocab):
+    """Bootstrap as a new process would: no in-process snapshots, parsing observed."""
+    from unittest.mock import patch
+    import dispatcher as dispatcher_module
+    dispatcher_module._bootstrap_snapshots.clear()
+    with patch.object(dispatcher_module, "_parse_vocabulary_files",
+                      wraps=dispatcher_module._parse_vocabulary_files) as parse:
+        dispatcher = Dispatcher(vocab_dir=vocab)
+    return dispatcher, parse.call_count > 0
+
+
+def test_vocab_image_skips_parsing_in_new_process():
+    """A compiled registry image written next to the dir replaces the full parse."""
+    from dispatcher import vocab_image_path
+    vocab = _copied_vocab_dir()
+    Dispatcher(vocab_dir=vocab)
+    first = Dispatcher(vocab_dir=vocab)
+    assert vocab_image_path(vocab).exists()
+    assert vocab_image_path(vocab).parent == Path(vocab).parent
+
+    second, parsed = _fresh_process_bootstrap(vocab)
+
+    assert not parsed
+    assert _registry_state(second) == _registry_state(first)
+    assert second.vocab_manager.load_identity("Codex") == first.vocab_manager.load_identity("Codex")
+
+
+def test_vocab_image_keyed_by_content_hash():
+    """Touching a file keeps the image; changing its content invalidates it."""
+    vocab = _copied_vocab_dir()
+    Dispatcher(vocab_dir=vocab)
+    Dispatcher(vocab_dir=vocab)
+    codex = Path(vocab) / "Codex.hw"
+
+    os.utime(codex, ns=(codex.stat().st_atime_ns, codex.stat().st_mtime_ns + 10**9))
+    _, parsed = _fresh_process_bootstrap(vocab)
+    assert not parsed
+
+    with open(codex, "a") as f:
+        f.write("## imageProbe\n- Added on disk.\n")
+    dispatcher, parsed = _fresh_process_bootstrap(vocab)
+    assert parsed
+    assert "#imageProbe" in dispatcher.registry["Codex"].local_vocabulary
+
+
+def test_corrupt_vocab_image_falls_back_to_full_parse():
+    """Unreadable images, and images that reference code, are ignored."""
+    import pickle
+    from dispatcher import vocab_image_path
+    vocab = _copied_vocab_dir()
+    Dispatcher(vocab_dir=vocab)
+    expected = _registry_state(Dispatcher(vocab_dir=vocab))
+
+    for payload in (b"not a pickle", pickle.dumps({"version": Dispatcher})):
+        vocab_image_path(vocab).write_bytes(payload)
+        dispatcher, parsed = _fresh_process_bootstrap(vocab)
+        assert parsed
+        assert _registry_state(dispatcher) == expected
+
+
+def test_vocab_image_rescans_changed_collision_inbox():
+    """Cached pending collisions are reused only while the HelloWorld inbox is unchanged."""
+    vocab = _copied_vocab_dir()
+    Dispatcher(vocab_dir=vocab)
+    Dispatcher(vocab_dir=vocab)
+    (message_bus._inbox("HelloWorld") / "msg-imgprobe.hw").write_text(
+        "# From: dispatcher\n# Collision: abc123\n\n"
+        "@Claude send: #imageClash to: @Codex 'COLLISION: both hold #imageClash natively'\n"
+    )
+
+    dispatcher, _ = _fresh_process_bootstrap(vocab)
+
+    assert "#imageClash" in dispatcher.pending_collision_symbols
+
+
+_MIXED_SCRIPT = """
+Claude #observe
+Codex #act
+Gemini ##
+Claude #nothingHere
+Codex # → [#streamProbe]
+Codex #streamProbe
+Copilot chain
+Gemini #streamProbe
+HelloWorld #State
+Claude #streamProbe
+"""
+
+
+def test_dispatch_iter_yields_before_later_statements_run():
+    """dispatch_iter hands back each result before executing the next statement."""
+    from unittest.mock import patch
+    dispatcher = _fresh_dispatcher()
+    dispatcher.llm = None
+    nodes = Parser.from_source("Claude #observe\nCodex #act\nGemini ##").parse()
+
+    with patch.object(dispatcher, "_execute", wraps=dispatcher._execute) as execute:
+        stream = dispatcher.dispatch_iter(nodes)
+        first = next(stream)
+        assert execute.call_count == 1
+        rest = list(stream)
+
+    assert [first] + rest == _fresh_dispatcher().dispatch(nodes)
+
+
+def test_concurrent_dispatch_matches_serial_results():
+    """Concurrent mode yields the same results, in the same order, as serial dispatch."""
+    serial = _fresh_dispatcher()
+    serial.llm = None
+    expected = serial.dispatch_source(_MIXED_SCRIPT)
+
+    concurrent = _fresh_dispatcher()
+    concurrent.llm = None
+    assert list(concurrent.dispatch_stream(_MIXED_SCRIPT, concurrency=4)) == expected
+
+
+def test_concurrent_dispatch_orders_same_receiver_and_mutations():
+    """Different receivers overlap; same-receiver statements and definitions never do."""
+    import threading
+    import time
+    dispatcher = _fresh_dispatcher()
+    dispatcher.llm = None
+    execute = dispatcher._execute
+    lock = threading.Lock()
+    active = set()
+    running_alongside = {}   # statement index → indices running when it started
+
+    def slow_execute(node):
+        index = next(i for i, n in enumerate(nodes) if n is node)
+        with lock:
+            running_alongside[index] = set(active)
+            active.add(index)
+        time.sleep(0.05)
+        try:
+            return execute(node)
+        finally:
+            with lock:
+                active.discard(index)
+
+    dispatcher._execute = slow_execute
+    nodes = Parser.from_source(
+        "Claude #observe\nCodex #act\nClaude #act\nCodex # → [#orderProbe]\nGemini #observe"
+    ).parse()
+
+    list(dispatcher.dispatch_iter(nodes, concurrency=4))
+
+    claude_1, codex_1, claude_2, define, gemini = range(5)
+    assert claude_1 in running_alongside[codex_1] or codex_1 in running_alongside[claude_1]
+    assert claude_1 not in running_alongside[claude_2]
+    assert running_alongside[define] == set()
+    assert define not in running_alongside[gemini]
+
+
+
+class _AwaitingLlm:
+    """LLM stub whose acall yields to the event loop and records peak overlap."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    def call(self, prompt):
+        raise AssertionError("the async path must not make blocking calls")
+
+    async def acall(self, prompt):
+        import asyncio
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return "awaited interpretation"
+
+
+class _FailingLlm:
+    def call(self, prompt):
+        raise RuntimeError("API down")
+
+
+def test_adispatch_matches_sync_dispatch():
+    """The async surface produces the same results as dispatch_source."""
+    import asyncio
+    serial = _fresh_dispatcher()
+    serial.llm = None
+    expected = serial.dispatch_source(_MIXED_SCRIPT)
+
+    dispatcher = _fresh_dispatcher()
+    dispatcher.llm = None
+    assert asyncio.run(dispatcher.adispatch_source(_MIXED_SCRIPT)) == expected
+
+
+def test_adispatch_overlaps_llm_interpretations():
+    """With concurrency, LLM-backed lookups on different agents await the model together."""
+    import asyncio
+    source = "Claude #observe\nCodex #observe\nGemini #observe\nCopilot #observe"
+
+    async def collect(dispatcher, concurrency):
+        nodes = Parser.from_source(source).parse()
+        return [r async for r in dispatcher.adispatch_iter(nodes, concurrency=concurrency)]
+
+    dispatcher = _fresh_dispatcher()
+    dispatcher.llm = llm = _AwaitingLlm()
+    results = asyncio.run(collect(dispatcher, 1))
+    assert llm.peak == 1
+    assert [r.split(" ")[0] for r in results] == ["Claude", "Codex", "Gemini", "Copilot"]
+    assert all(r.endswith("→ awaited interpretation") for r in results)
+
+    dispatcher = _fresh_dispatcher()
+    dispatcher.llm = llm = _AwaitingLlm()
+    assert asyncio.run(collect(dispatcher, 4)) == results
+    assert llm.peak == 4
+
+
+def test_adispatch_with_blocking_llm_falls_back_like_sync():
+    """Clients without acall run on a worker thread; their errors take the structural fallback."""
+    import asyncio
+    source = "Claude #observe\nCodex send: #observe to: Claude"
+    sync = _fresh_dispatcher()
+    sync.llm = _FailingLlm()
+    expected = sync.dispatch_source(source)
+
+    dispatcher = _fresh_dispatcher()
+    dispatcher.llm = _FailingLlm()
+    assert asyncio.run(dispatcher.adispatch_source(source)) == expected
+
+
+def test_fanout_interval_spaces_starts():
+    """A fan-out with an interval starts its coroutines no faster than one per interval."""
+    import asyncio
+    import time
+    from dispatcher import _Fanout
+
+    for run in (lambda f: Dispatcher._drive(f), lambda f: asyncio.run(Dispatcher._adrive(f))):
+        starts = []
+
+        async def job():
+            starts.append(time.monotonic())
+
+        async def fan():
+            return await _Fanout([job() for _ in range(3)], limit=3, interval=0.05)
+
+        run(fan())
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert len(gaps) == 2 and min(gaps) >= 0.045
+
+
+def test_run_scheduler_ticks_by_priority_and_quantum():
+    """Each tick gives every busy receiver one quantum, highest priority group first."""
+    import asyncio
+    from dispatcher import RunScheduler, _Drain
+
+    def schedule(drive):
+        backlog = {"Claude": 5, "Copilot": 2, "HelloWorld": 1}
+        turns = []
+
+        async def turn(name, quantum, started):
+            n = min(quantum, backlog[name])
+            backlog[name] -= n
+            turns.append((name, n))
+            return _Drain(processed=n, done=backlog[name] == 0)
+
+        report = drive(RunScheduler(workers=1, quantum=2).arun(backlog, turn))
+        return turns, report
+
+    turns, report = schedule(Dispatcher._drive)
+    assert turns == [("HelloWorld", 1), ("Claude", 2), ("Copilot", 2), ("Claude", 2), ("Claude", 1)]
+    assert report.processed == {"HelloWorld": 1, "Claude": 5, "Copilot": 2}
+    assert (report.total, report.ticks) == (8, 3)
+    assert schedule(lambda coro: asyncio.run(Dispatcher._adrive(coro))) == (turns, report)
+
+
+class _SleepingLlm:
+    """Blocking LLM stub that records how many calls overlap."""
+
+    def __init__(self, delay: float = 0.1):
+        import threading
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def call(self, prompt):
+        import time
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return "slept interpretation"
+
+
+def test_run_drains_agent_inboxes_concurrently():
+    """HelloWorld run interprets different agents' messages at the same time, on both surfaces."""
+    import asyncio
+    agents = ["Claude", "Codex", "Gemini", "Copilot"]
+    for llm, run in ((_SleepingLlm(), lambda d: d.run_inboxes()),
+                     (_AwaitingLlm(), lambda d: asyncio.run(d.arun_inboxes()))):
+        dispatcher = _fresh_dispatcher()
+        for agent in agents + ["Scribe", "HelloWorld"]:
+            while message_bus.receive(agent):
+                pass
+        dispatcher.llm = llm
+        for agent in agents:
+            message_bus.send("Tester", agent, "status?")
+            message_bus.send("Tester", agent, "and now?")
+        report = run(dispatcher)
+        assert {a: report.processed[a] for a in agents} == {a: 2 for a in agents}
+        assert report.total == 8
+        assert llm.peak == 4
+
+
+
+def test_helloworld_resolve_synthesizes_each_distinct_collision_once():
+    """HelloWorld resolve dedupes pending collisions, runs them concurrently, writes each .hw once."""
+    dispatcher, tmpdir = _fresh_dispatcher_with_dir()
+    dispatcher.dispatch_source("BulkA # → [#ore, #fire]")
+    dispatcher.dispatch_source("BulkB # → [#ore, #fire]")
+    dispatcher.dispatch_source("BulkC # → [#ore, #ice]")
+    for source in ("BulkA send: #ore to: BulkB", "BulkA send: #ore to: BulkB",
+                   "BulkA send: #fire to: BulkB", "BulkC send: #ore to: BulkB"):
+        dispatcher.dispatch_source(source)
+    hw_inbox = Path(tmpdir) / "helloworld" / "inbox"
+    assert len(list(hw_inbox.glob("msg-*.hw"))) == 4
+
+    llm = _SleepingLlm(delay=0.05)
+    dispatcher.llm = llm
+    writes = []
+    update = dispatcher.vocab_manager.update_descriptions
+    dispatcher.vocab_manager.update_descriptions = lambda name, descs: writes.append(name) or update(name, descs)
+    result = dispatcher.dispatch_source("HelloWorld resolve")[0]
+
+    assert "Resolved 4 collision(s) with 3 synthesis(es)." in result
+    assert llm.peak == 3
+    assert sorted(writes) == ["BulkA", "BulkB", "BulkC"]
+    assert list(hw_inbox.glob("msg-*.hw")) == []
+    assert not {"#ore", "#fire"} & dispatcher.pending_collision_symbols
+    assert "slept interpretation" in (Path(tmpdir) / "BulkB.hw").read_text()
+    assert dispatcher.dispatch_source("HelloWorld resolve")[0] == "[HelloWorld] No pending collisions."
+
 if __name__ == "__main__":
     test_dispatcher_bootstrap()
     test_dispatch_query()
@@ -899,9 +1358,29 @@ if __name__ == "__main__":
     test_tier2_collision_message_contains_vocabularies()
     test_tier2_helloworld_receive_resolves_collision()
     test_tier3_pending_collision_resolved_on_scoped_lookup()
+    test_pending_collisions_resolve_one_registry_entry_at_a_time()
+    test_helloworld_resolve_synthesizes_each_distinct_collision_once()
+    test_fanout_interval_spaces_starts()
     test_tier3_stays_pending_without_llm()
     test_collision_cross_session_persistence()
     test_tier1_logs_resolved_collision()
     test_tier2_logs_unresolved_collision()
     test_collision_prompt_includes_descriptions()
+    test_bootstrap_parses_each_file_once()
+    test_bootstrap_clones_snapshot_for_unchanged_dir()
+    test_cloned_dispatchers_do_not_share_state()
+    test_bootstrap_snapshot_invalidated_by_file_change()
+    test_parallel_bootstrap_matches_serial()
+    test_vocab_image_skips_parsing_in_new_process()
+    test_vocab_image_keyed_by_content_hash()
+    test_corrupt_vocab_image_falls_back_to_full_parse()
+    test_vocab_image_rescans_changed_collision_inbox()
+    test_dispatch_iter_yields_before_later_statements_run()
+    test_concurrent_dispatch_matches_serial_results()
+    test_concurrent_dispatch_orders_same_receiver_and_mutations()
+    test_adispatch_matches_sync_dispatch()
+    test_adispatch_overlaps_llm_interpretations()
+    test_adispatch_with_blocking_llm_falls_back_like_sync()
+    test_run_scheduler_ticks_by_priority_and_quantum()
+    test_run_drains_agent_inboxes_concurrently()
     print("All dispatcher tests passed")
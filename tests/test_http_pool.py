@@ -0,0 +1,162 @@
+"""Tests for the pooled keep-alive HTTP client, against a local stub server."""
+
+import gzip
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import http_pool
+from http_pool import HttpPool
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True    # headers and body go out as separate writes
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body: bytes, **headers):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name.replace("_", "-"), value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        server = self.server
+        server.connections.add(self.client_address)
+        server.requests.append((self.command, self.path))
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = self.rfile.read(length) if length else b""
+        if self.path == "/gzip":
+            self._reply(200, gzip.compress(b"squeezed"), Content_Encoding="gzip")
+        elif self.path.startswith("/flaky"):
+            server.flaky += 1
+            if server.flaky <= 2:
+                self._reply(503, b"busy", Retry_After="0")
+            else:
+                self._reply(200, b"recovered")
+        elif self.path == "/bad-gateway":
+            self._reply(502, b"upstream down")
+        elif self.path == "/drop":
+            # Answer, then hang up without saying so — as an idle timeout would
+            self._reply(200, b"bye")
+            self.close_connection = True
+        elif self.path == "/act-and-hang-up":
+            # Act on the request, then drop the connection before answering
+            self.close_connection = True
+        elif self.path == "/missing":
+            self._reply(404, b"no such thing")
+        elif self.path.startswith("/inbox"):
+            body = {"messages": [{"id": "m1", "from": "claude", "content": "hi"}]} \
+                if self.path.startswith("/inbox?") else {"ok": True}
+            self._reply(200, json.dumps(body).encode(), Content_Type="application/json")
+        else:
+            self._reply(200, json.dumps({"path": self.path, "body": payload.decode(),
+                                         "encoding": self.headers.get("Accept-Encoding")}).encode())
+
+    do_GET = do_POST = do_DELETE = _handle
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.connections, server.requests, server.flaky = set(), [], 0
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_one_connection(stub):
+    server, base = stub
+    pool = HttpPool()
+    for i in range(5):
+        with pool.urlopen(f"{base}/echo/{i}") as resp:
+            assert json.loads(resp.read())["path"] == f"/echo/{i}"
+    assert pool.opened == 1
+    assert len(server.connections) == 1
+
+
+def test_post_body_and_gzip(stub):
+    _, base = stub
+    pool = HttpPool()
+    req = Request(f"{base}/echo", data=b'{"a": 1}', method="POST")
+    req.add_header("Content-Type", "application/json")
+    echoed = json.loads(pool.urlopen(req).read())
+    assert echoed["body"] == '{"a": 1}'
+    assert echoed["encoding"] == "gzip"
+    assert pool.urlopen(f"{base}/gzip").read() == b"squeezed"
+
+
+def test_retries_refused_requests_with_backoff(stub):
+    server, base = stub
+    pool = HttpPool(retries=2, backoff=0.01)
+    assert pool.urlopen(Request(f"{base}/flaky", data=b"x", method="POST")).read() == b"recovered"
+    assert server.flaky == 3
+
+
+def test_non_idempotent_request_is_not_retried_after_bad_gateway(stub):
+    server, base = stub
+    pool = HttpPool(retries=2, backoff=0.01)
+    with pytest.raises(HTTPError) as info:
+        pool.urlopen(Request(f"{base}/bad-gateway", data=b"x", method="POST"))
+    assert info.value.code == 502
+    assert info.value.read() == b"upstream down"
+    assert len(server.requests) == 1
+
+
+def test_errors_match_urllib(stub):
+    _, base = stub
+    pool = HttpPool(retries=0)
+    with pytest.raises(HTTPError) as info:
+        pool.urlopen(f"{base}/missing")
+    assert info.value.code == 404
+    closed = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    port = closed.server_port
+    closed.server_close()
+    with pytest.raises(URLError):
+        pool.urlopen(f"http://127.0.0.1:{port}/")
+
+
+def test_connection_dropped_while_idle_is_replaced(stub):
+    server, base = stub
+    pool = HttpPool(retries=0)
+    assert pool.urlopen(f"{base}/drop").read() == b"bye"
+    with pool.urlopen(f"{base}/echo") as resp:
+        assert resp.status == 200
+    assert len(server.connections) == 2
+
+
+def test_non_idempotent_request_is_not_resent_on_a_reused_connection(stub):
+    server, base = stub
+    pool = HttpPool()
+    pool.urlopen(f"{base}/echo").read()
+    with pytest.raises(URLError):
+        pool.urlopen(Request(f"{base}/act-and-hang-up", data=b"{}", method="POST"))
+    assert server.requests.count(("POST", "/act-and-hang-up")) == 1
+
+
+def test_clawnet_receive_and_ack_share_a_connection(stub, monkeypatch):
+    import clawnet_transport
+    server, base = stub
+    monkeypatch.setattr(clawnet_transport, "API_BASE", base)
+    monkeypatch.setattr(http_pool, "_shared", HttpPool())
+    transport = clawnet_transport.ClawNetTransport(token="tok")
+
+    msg = transport.receive("claude")
+
+    assert (msg.sender, msg.content) == ("claude", "hi")
+    assert [r[0] for r in server.requests] == ["GET", "POST"]
+    assert len(server.connections) == 1
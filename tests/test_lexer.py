@@ -216,6 +216,63 @@ def test_markdown_and_smalltalk_coexist():
     assert types[2] == TokenType.RECEIVER  # Claude (Smalltalk message line)
 
 
+def _tokens_or_error(lexer_cls, source):
+    try:
+        return lexer_cls(source).tokenize()
+    except SyntaxError as e:
+        return str(e)
+
+
+def test_matches_reference_lexer_on_edge_cases():
+    """Token types, values, lines and columns match the original scanner."""
+    from reference_lexer import ReferenceLexer
+    cases = [
+        "---\ntitle: x\n---\n# Agent : HelloWorld\n- identity\n",
+        "---\nunterminated frontmatter\n",
+        "'a string\nspanning lines' Claude #x",     # newline in a string is not counted
+        '"comment\nover lines" Claude',
+        "<!-- open comment\n# not a heading",
+        "Timer wait: 7.days then: 3² and: 1.5x",
+        "@guardian @ @_x #— #$ # ## ### # .## ]",
+        "  # indented heading is a hash\n- item\n-no",
+        "Claude :: a: [#b, #c] → super.",
+        "Claude\r\n",
+        "café Éclair _under x½",
+    ]
+    for source in cases:
+        assert _tokens_or_error(Lexer, source) == _tokens_or_error(ReferenceLexer, source), source
+
+
+def test_matches_reference_lexer_on_vocabularies():
+    """Every shipped .hw file tokenizes identically to the original scanner."""
+    from reference_lexer import ReferenceLexer
+    root = Path(__file__).parent.parent
+    for path in list((root / "vocabularies").glob("*.hw")) + list(root.glob("*.hw")):
+        source = path.read_text()
+        assert _tokens_or_error(Lexer, source) == _tokens_or_error(ReferenceLexer, source), path.name
+
+
+def test_iter_tokens_is_lazy():
+    """iter_tokens yields tokens before it has scanned the rest of the source."""
+    stream = Lexer("Claude #parse\n$ broken").iter_tokens()
+    assert next(stream).value == "Claude"
+    assert next(stream).value == "#parse"
+    try:
+        next(stream)
+        assert False, "expected SyntaxError"
+    except SyntaxError as e:
+        assert "line 2, column 1" in str(e)
+
+
+def test_parser_accepts_token_stream():
+    """Parser pulls from a token iterator and produces the same AST as from a list."""
+    from parser import Parser
+    source = "# Bot : Agent\n- A bot.\n## spark\n- Ignites.\nBot #spark\nBot send: #x to: Claude\n"
+    streamed = Parser(Lexer(source).iter_tokens()).parse()
+    listed = Parser(Lexer(source).tokenize()).parse()
+    assert repr(streamed) == repr(listed)
+
+
 if __name__ == "__main__":
     test_receiver()
     test_symbol()
@@ -239,4 +296,8 @@ if __name__ == "__main__":
     test_html_comment_multiline()
     test_markdown_full_receiver()
     test_markdown_and_smalltalk_coexist()
+    test_matches_reference_lexer_on_edge_cases()
+    test_matches_reference_lexer_on_vocabularies()
+    test_iter_tokens_is_lazy()
+    test_parser_accepts_token_stream()
     print("All lexer tests passed")
@@ -0,0 +1,228 @@
+"""Tests for the LLM response cache — LRU, SQLite tier, TTL, single flight, CachedLlm."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import asyncio
+import threading
+import time
+import pytest
+from claude_llm import ClaudeModel
+from llm_cache import CachedLlm, LlmCache, cached, fingerprint
+
+
+class CountingLlm:
+    """Model stub that numbers its answers, so a repeat shows whether it was called."""
+    model_name = "counting-1"
+    api_key = "test-key"
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    def call(self, prompt, system=None):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("API down")
+        return f"answer {self.calls} ({system or 'default'})"
+
+    async def acall(self, prompt, system=None):
+        return self.call(prompt, system=system)
+
+
+class TestFingerprint:
+    def test_whitespace_does_not_change_key(self):
+        assert fingerprint("m", None, "Claude  #observe\n") == fingerprint("m", None, "Claude #observe")
+
+    def test_model_and_system_change_key(self):
+        base = fingerprint("m", None, "p")
+        assert fingerprint("other", None, "p") != base
+        assert fingerprint("m", "be brief", "p") != base
+
+
+class TestLlmCache:
+    def test_counts_hits_and_misses(self):
+        cache = LlmCache()
+        assert cache.get("k") is None
+        cache.put("k", "v")
+        assert cache.get("k") == "v"
+        assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "coalesced": 0, "entries": 1}
+
+    def test_evicts_least_recently_used(self):
+        cache = LlmCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+
+    def test_disk_tier_outlives_memory(self, tmp_path):
+        db = str(tmp_path / "cache.db")
+        LlmCache(db).put("k", "v")
+        fresh = LlmCache(db, max_entries=1)
+        assert fresh.get("k") == "v"
+        assert fresh.get("k") == "v"
+        assert fresh.stats()["disk_hits"] == 1
+
+    def test_expired_entries_miss(self, tmp_path):
+        cache = LlmCache(str(tmp_path / "cache.db"), ttl=-1)
+        cache.put("k", "v")
+        assert cache.get("k") is None
+        assert cache.prune() == 0   # the expired row was dropped when it was met
+
+
+class TestCachedLlm:
+    def test_repeat_prompt_skips_model(self):
+        model = CountingLlm()
+        llm = CachedLlm(model, LlmCache())
+        assert llm.call("Claude #observe") == llm.call("Claude  #observe") == "answer 1 (default)"
+        assert model.calls == 1
+        assert llm.cache.stats()["hits"] == 1
+
+    def test_system_prompt_is_part_of_key(self):
+        model = CountingLlm()
+        llm = CachedLlm(model, LlmCache())
+        llm.call("p", system="a")
+        assert llm.call("p", system="b") == "answer 2 (b)"
+
+    def test_acall_shares_entries_with_call(self):
+        model = CountingLlm()
+        llm = CachedLlm(model, LlmCache())
+        first = asyncio.run(llm.acall("p"))
+        assert llm.call("p") == first
+        assert model.calls == 1
+
+    def test_parser_runs_on_cached_response(self):
+        llm = CachedLlm(CountingLlm(), LlmCache())
+        assert llm.call("p", parser_func=str.upper) == "ANSWER 1 (DEFAULT)"
+        assert llm.call("p") == "answer 1 (default)"
+
+    def test_errors_are_not_cached(self):
+        model = CountingLlm(fail=True)
+        llm = CachedLlm(model, LlmCache())
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                llm.call("p")
+        assert model.calls == 2
+
+    def test_sampling_settings_are_part_of_key(self):
+        cache = LlmCache()
+        short, long = CountingLlm(), CountingLlm()
+        short.max_tokens, long.max_tokens = 256, 1024
+        CachedLlm(short, cache).call("p")
+        assert CachedLlm(long, cache).call("p") == "answer 1 (default)"
+        assert long.calls == 1
+        warm = CountingLlm()
+        warm.max_tokens, warm.temperature = 1024, 0.9
+        CachedLlm(warm, cache).call("p")
+        assert warm.calls == 1
+        assert cache.stats()["hits"] == 0
+
+    def test_forwards_model_attributes(self):
+        llm = CachedLlm(CountingLlm(), LlmCache())
+        assert llm.model_name == "counting-1"
+
+
+class SlowLlm(CountingLlm):
+    """CountingLlm that takes a while, so concurrent callers overlap."""
+
+    def call(self, prompt, system=None):
+        time.sleep(0.1)
+        return super().call(prompt, system=system)
+
+    async def acall(self, prompt, system=None):
+        await asyncio.sleep(0.1)
+        return super().call(prompt, system=system)
+
+
+class TestSingleFlight:
+    def test_concurrent_threads_share_one_call(self):
+        model = SlowLlm()
+        llm = CachedLlm(model, LlmCache())
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(llm.call("Claude #observe")))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == ["answer 1 (default)"] * 4
+        assert model.calls == 1
+        assert llm.cache.stats()["coalesced"] == 3
+
+    def test_concurrent_coroutines_share_one_call(self):
+        model = SlowLlm()
+        llm = CachedLlm(model, LlmCache())
+
+        async def burst():
+            return await asyncio.gather(*(llm.acall("Claude #observe") for _ in range(4)))
+
+        assert asyncio.run(burst()) == ["answer 1 (default)"] * 4
+        assert model.calls == 1
+        assert llm.cache.stats()["coalesced"] == 3
+
+    def test_waiters_share_the_error_and_nothing_is_cached(self):
+        model = SlowLlm(fail=True)
+        llm = CachedLlm(model, LlmCache())
+
+        async def burst():
+            return await asyncio.gather(*(llm.acall("p") for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in asyncio.run(burst()))
+        assert model.calls == 1
+        with pytest.raises(RuntimeError):
+            llm.call("p")
+        assert model.calls == 2
+
+    def test_cancelling_the_leader_does_not_cancel_waiters(self):
+        model = SlowLlm()
+        llm = CachedLlm(model, LlmCache())
+
+        async def cancel_leader():
+            leader = asyncio.ensure_future(llm.acall("p"))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(llm.acall("p"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            answer = await waiter
+            return leader.cancelled(), answer
+
+        assert asyncio.run(cancel_leader()) == (True, "answer 1 (default)")
+        assert model.calls == 1
+        assert llm.call("p") == "answer 1 (default)"
+
+    def test_thread_does_not_wait_on_a_coroutine_flight(self):
+        model = SlowLlm()
+        llm = CachedLlm(model, LlmCache())
+
+        async def mixed():
+            flight = asyncio.ensure_future(llm.acall("p"))
+            await asyncio.sleep(0)
+            # On the loop's own thread: waiting here would deadlock the flight
+            direct = llm.call("p")
+            return direct, await flight
+
+        assert asyncio.run(mixed()) == ("answer 1 (default)", "answer 2 (default)")
+        assert llm.cache.stats()["coalesced"] == 0
+
+
+class TestCached:
+    def test_mock_models_are_not_wrapped(self):
+        model = ClaudeModel(api_key=None)
+        assert cached(model) is model
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("HW_LLM_CACHE", "0")
+        model = CountingLlm()
+        assert cached(model) is model
+
+    def test_wraps_models_with_a_key(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("HW_LLM_CACHE", "1")
+        monkeypatch.setenv("HW_LLM_CACHE_DB", str(tmp_path / "cache.db"))
+        monkeypatch.setattr("llm_cache._shared", None)
+        llm = cached(CountingLlm())
+        assert isinstance(llm, CachedLlm)
+        assert llm.cache.db_path == str(tmp_path / "cache.db")
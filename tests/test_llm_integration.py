@@ -123,6 +123,15 @@ def test_mock_fallback_when_no_api_key():
     assert "Emptiness" in response or "emptiness" in response
 
 
+def test_gemini_acall_uses_mock_without_key():
+    """GeminiModel.acall() answers inline in mock mode, matching call()."""
+    import asyncio
+    model = GeminiModel(api_key=None)
+    model.api_key = None
+    response = asyncio.run(model.acall("interpret: #Sunyata"))
+    assert response == model.call("interpret: #Sunyata")
+
+
 def test_has_api_key_reflects_env():
     """has_api_key() reflects GEMINI_API_KEY env var."""
     old = os.environ.pop("GEMINI_API_KEY", None)
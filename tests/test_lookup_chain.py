@@ -182,6 +182,115 @@ def test_receiver_chain():
     assert dispatcher.registry["HelloWorld"].chain() == ["HelloWorld"]
 
 
+def test_resolution_cache_hits_on_repeat_lookup():
+    """Repeated lookups are served from the dispatcher's resolution cache."""
+    dispatcher = Dispatcher(vocab_dir=tempfile.mkdtemp())
+    cache = dispatcher.resolution_cache
+    receiver = dispatcher.registry["Codex"]
+
+    receiver.lookup("#send")
+    hits = cache.hits
+    result = receiver.lookup("#send")
+
+    assert cache.hits == hits + 1
+    assert result.is_inherited()
+    assert result.context["defined_in"] == "HelloWorld"
+
+
+def test_resolution_cache_invalidated_when_ancestor_learns():
+    """Adding a symbol to an ancestor invalidates descendants' resolutions."""
+    dispatcher = Dispatcher(vocab_dir=tempfile.mkdtemp())
+    codex = dispatcher.registry["Codex"]
+    claude = dispatcher.registry["Claude"]
+
+    assert codex.lookup("#cacheProbe").is_unknown()
+    assert claude.lookup("#cacheProbe").is_unknown()
+
+    dispatcher.registry["Agent"].add_symbol("#cacheProbe")
+
+    result = codex.lookup("#cacheProbe")
+    assert result.is_inherited()
+    assert result.context["defined_in"] == "Agent"
+    assert claude.lookup("#cacheProbe").is_inherited()
+
+
+def test_resolution_cache_invalidated_on_reparent():
+    """Re-parenting a receiver drops resolutions that walked through it."""
+    dispatcher = Dispatcher(vocab_dir=tempfile.mkdtemp())
+    codex = dispatcher.registry["Codex"]
+    native_agent = exclusive_native_symbol("Agent", "HelloWorld")
+
+    assert codex.lookup(native_agent).is_inherited()
+
+    codex.parent = dispatcher.registry["HelloWorld"]
+
+    assert codex.lookup(native_agent).is_unknown()
+    assert codex.chain() == ["Codex", "HelloWorld"]
+
+
+def test_resolution_cache_keeps_unrelated_entries():
+    """Learning one symbol leaves other cached resolutions intact."""
+    dispatcher = Dispatcher(vocab_dir=tempfile.mkdtemp())
+    cache = dispatcher.resolution_cache
+    codex = dispatcher.registry["Codex"]
+
+    codex.lookup("#send")
+    size = len(cache)
+    dispatcher.registry["Agent"].add_symbol("#unrelatedProbe")
+
+    assert len(cache) == size
+    hits = cache.hits
+    codex.lookup("#send")
+    assert cache.hits == hits + 1
+
+
+def test_lookup_context_is_lazy_and_current():
+    """Context is built on first access from the receiver's current state."""
+    dispatcher = Dispatcher(vocab_dir=tempfile.mkdtemp())
+    receiver = dispatcher.registry["Codex"]
+
+    result = receiver.lookup("#lazyProbe")
+    receiver.add_symbol("#otherProbe")
+
+    assert "#otherProbe" in result.context["local_vocabulary"]
+    assert dict(result.context) == {"local_vocabulary": sorted(receiver.local_vocabulary)}
+
+
+def test_effective_vocabulary_is_sorted_union_of_chain():
+    """Effective vocabulary holds local and inherited symbols, sorted."""
+    dispatcher = Dispatcher(vocab_dir=tempfile.mkdtemp())
+    codex = dispatcher.registry["Codex"]
+
+    vocab = codex.effective_vocabulary()
+
+    expected = set()
+    for name in codex.chain():
+        expected |= dispatcher.registry[name].local_vocabulary
+    assert list(vocab) == sorted(expected)
+    assert isinstance(vocab, tuple)
+    assert repr(vocab) == repr(sorted(expected))
+
+
+def test_effective_vocabulary_reused_until_chain_changes():
+    """The same object is returned until an ancestor learns a symbol."""
+    dispatcher = Dispatcher(vocab_dir=tempfile.mkdtemp())
+    codex = dispatcher.registry["Codex"]
+    claude = dispatcher.registry["Claude"]
+
+    first = codex.effective_vocabulary()
+    assert codex.effective_vocabulary() is first
+    claude_before = claude.effective_vocabulary()
+
+    dispatcher.registry["Agent"].add_symbol("#generationProbe")
+
+    second = codex.effective_vocabulary()
+    assert second is not first
+    assert second.generation > first.generation
+    assert "#generationProbe" in second
+    assert "#generationProbe" in claude.effective_vocabulary()
+    assert claude.effective_vocabulary() is not claude_before
+
+
 if __name__ == "__main__":
     test_lookup_native_symbol()
     test_lookup_inherited_symbol()
@@ -193,4 +302,11 @@ if __name__ == "__main__":
     test_manual_symbol_addition()
     test_lookup_preserves_context()
     test_receiver_chain()
+    test_resolution_cache_hits_on_repeat_lookup()
+    test_resolution_cache_invalidated_when_ancestor_learns()
+    test_resolution_cache_invalidated_on_reparent()
+    test_resolution_cache_keeps_unrelated_entries()
+    test_lookup_context_is_lazy_and_current()
+    test_effective_vocabulary_is_sorted_union_of_chain()
+    test_effective_vocabulary_reused_until_chain_changes()
     print("All lookup chain tests passed")
@@ -1,6 +1,7 @@
 """Tests for the HelloWorld memory bus — all subprocess calls mocked."""
 
 import json
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -8,6 +9,7 @@ from unittest.mock import patch, MagicMock
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+import memory_bus
 import message_bus
 from memory_bus import (
     MemoryBus, MemoryEntry, MemoryIndex, MemoryResult,
@@ -28,6 +30,12 @@ def _restore():
     message_bus.BASE_DIR = _original_base
 
 
+def _tick(directory):
+    """Move a directory's mtime on, as the next tick of a coarse filesystem clock would."""
+    st = directory.stat()
+    os.utime(directory, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+
 # --- store ---
 
 
@@ -103,7 +111,7 @@ def test_get_reads_local_file():
 def test_recall_with_mocked_qmd():
     _use_tmp()
     try:
-        mem = MemoryBus("claude")
+        mem = MemoryBus("claude", backend="qmd")
         mem._qmd_bin = "/usr/local/bin/qmd"
         mem._collection_registered = True
 
@@ -135,7 +143,7 @@ def test_recall_with_mocked_qmd():
 def test_recall_empty_results():
     _use_tmp()
     try:
-        mem = MemoryBus("claude")
+        mem = MemoryBus("claude", backend="qmd")
         mem._qmd_bin = "/usr/local/bin/qmd"
         mem._collection_registered = True
 
@@ -159,18 +167,118 @@ def test_recall_invalid_mode():
         assert "badmode" in str(e)
 
 
+def test_recall_local_ranks_by_bm25():
+    _use_tmp()
+    try:
+        mem = MemoryBus("claude")
+        mem.store("severith prefers short messages", title="severith-style")
+        mem.store("ciel writes long essays about vocabulary", title="ciel-style")
+        mem.store("the dispatcher routes messages", title="routing")
+        with patch("memory_bus.subprocess.run", side_effect=AssertionError("spawned")):
+            results = mem.recall("how does severith prefer messages")
+        assert results[0].title == "severith-style"
+        assert "short messages" in results[0].snippet
+        assert results[0].score > results[-1].score
+        assert "severith prefers" in mem.get(results[0].docid)
+    finally:
+        _restore()
+
+
+def test_recall_local_sees_files_written_elsewhere():
+    _use_tmp()
+    try:
+        mem = MemoryBus("claude")
+        kept = mem.store("ciel likes vocabulary drift", title="ciel-note")
+        assert [r.title for r in mem.recall("ciel")] == ["ciel-note"]
+        _make_hw_file(mem.memory_dir, "other.md", "ciel-other", "2026-01-01",
+                      content="ciel again, from another process")
+        kept.unlink()
+        _tick(mem.memory_dir)
+        assert [r.title for r in mem.recall("ciel")] == ["ciel-other"]
+    finally:
+        _restore()
+
+
+def test_store_keeps_index_in_step():
+    _use_tmp()
+    try:
+        mem = MemoryBus("claude")
+        mem.store("first", title="one", tags=["inbox"])
+        mem.store("second", title="two")
+        assert mem.full_text.sync() == 0
+        assert mem.full_text.count() == 2
+        assert [r.title for r in mem.recall("inbox")] == ["one"]
+        assert mem.recall("   ") == []
+    finally:
+        _restore()
+
+
+def test_backend_from_env():
+    with patch.dict("os.environ", {"HW_MEMORY_BACKEND": "qmd"}):
+        assert MemoryBus("claude").backend == "qmd"
+    assert MemoryBus("claude").backend == "local"
+    try:
+        MemoryBus("claude", backend="elastic")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "elastic" in str(e)
+
+
 # --- available ---
 
 
+def test_available_local_without_qmd():
+    _use_tmp()
+    try:
+        mem = MemoryBus("claude")
+        with patch("memory_bus.shutil.which", return_value=None):
+            mem._qmd_bin = None
+            assert mem.available() is True
+    finally:
+        _restore()
+
+
+def test_local_without_fts5_still_stores():
+    _use_tmp()
+    try:
+        mem = MemoryBus("claude")
+        with patch("memory_bus.full_text_for",
+                   side_effect=memory_bus.sqlite3.OperationalError("no such module: fts5")):
+            path = mem.store("severith prefers short messages", title="severith-style")
+            assert path.exists()
+            assert mem.available() is False
+            assert mem.recall("severith") == []
+            assert mem.status() == {"ok": False, "backend": "local", "error": "no such module: fts5"}
+            assert [e.title for e in mem.index.all()] == ["severith-style"]
+    finally:
+        _restore()
+
+
+def test_store_survives_index_errors():
+    _use_tmp()
+    try:
+        mem = MemoryBus("claude")
+        mem.store("ciel writes long essays", title="ciel-style")
+        with patch.object(memory_bus.FullTextIndex, "add",
+                          side_effect=memory_bus.sqlite3.OperationalError("database is locked")):
+            path = mem.store("severith prefers short messages", title="severith-style")
+        assert path.exists()
+        # The index missed the write; the next search's sync() picks the file up
+        _tick(mem.memory_dir)
+        assert [r.title for r in mem.recall("severith", mode="search")] == ["severith-style"]
+    finally:
+        _restore()
+
+
 def test_available_when_qmd_missing():
-    mem = MemoryBus("claude")
+    mem = MemoryBus("claude", backend="qmd")
     with patch("memory_bus.shutil.which", return_value=None):
         mem._qmd_bin = None  # Reset cache
         assert mem.available() is False
 
 
 def test_available_when_qmd_present():
-    mem = MemoryBus("claude")
+    mem = MemoryBus("claude", backend="qmd")
     with patch("memory_bus.shutil.which", return_value="/usr/local/bin/qmd"):
         mem._qmd_bin = None  # Reset cache
         assert mem.available() is True
@@ -393,15 +501,91 @@ def test_memory_index_refresh():
         assert len(idx.all()) == 1
 
         _make_hw_file(mem_dir, "b.hw", "second", "2026-01-02")
-        # Still cached
-        assert len(idx.all()) == 1
-        # After refresh
+        _tick(mem_dir)
+        # The directory changed, so the next query picks the file up
+        assert len(idx.all()) == 2
         idx.refresh()
         assert len(idx.all()) == 2
     finally:
         _restore()
 
 
+def test_memory_index_rereads_only_changed_files():
+    tmp = _use_tmp()
+    try:
+        mem = MemoryBus("idx_agent")
+        mem_dir = mem.memory_dir
+        _make_hw_file(mem_dir, "a.hw", "first", "2026-01-01", tags=["inbox"])
+        _make_hw_file(mem_dir, "b.hw", "second", "2026-01-02", tags=["inbox"])
+        idx = MemoryIndex(mem_dir)
+        assert len(idx.all()) == 2
+
+        _make_hw_file(mem_dir, "c.hw", "third", "2026-01-03", tags=["outbox"])
+        (mem_dir / "a.hw").unlink()
+        _tick(mem_dir)
+        with patch("memory_bus._read_entry", wraps=memory_bus._read_entry) as read:
+            assert idx.titles() == ["second", "third"]
+        assert [c.args[0].name for c in read.call_args_list] == ["c.hw"]
+        assert [e.title for e in idx.by_tag("inbox")] == ["second"]
+        assert [e.title for e in idx.recent(5)] == ["third", "second"]
+    finally:
+        _restore()
+
+
+def test_indexes_see_in_place_edits_at_the_next_full_scan():
+    _use_tmp()
+    try:
+        mem = MemoryBus("idx_agent")
+        mem_dir = mem.memory_dir
+        _make_hw_file(mem_dir, "a.hw", "first", "2026-01-01", content="ciel likes drift")
+        settled = mem_dir.stat().st_mtime_ns - 10_000_000_000
+        os.utime(mem_dir, ns=(settled, settled))
+        idx = MemoryIndex(mem_dir)
+        assert idx.titles() == ["first"]
+        assert [r.title for r in mem.recall("ciel", mode="search")] == ["first"]
+
+        # Rewriting a file in place leaves the directory's mtime alone
+        _make_hw_file(mem_dir, "a.hw", "edited", "2026-01-01", content="severith edited this")
+        os.utime(mem_dir, ns=(settled, settled))
+        assert idx.titles() == ["first"]
+        assert mem.recall("severith", mode="search") == []
+        with patch("memory_bus._RESCAN_NS", 0):
+            assert idx.titles() == ["edited"]
+            assert [r.title for r in mem.recall("severith", mode="search")] == ["edited"]
+    finally:
+        _restore()
+
+
+def test_memory_index_follows_store():
+    _use_tmp()
+    try:
+        mem = MemoryBus("idx_agent")
+        assert mem.index.all() == []
+        mem.store("hello", title="greeting", tags=["inbox", "human"])
+        mem.store("bye", title="farewell", tags=["outbox"])
+        assert [e.title for e in mem.index.by_tag("inbox", "human")] == ["greeting"]
+        assert mem.index.by_tag("inbox", "outbox") == []
+        assert len(mem.index.by_tag()) == 2
+    finally:
+        _restore()
+
+
+def test_memory_index_recent_ties_in_name_order():
+    tmp = _use_tmp()
+    try:
+        mem = MemoryBus("idx_agent")
+        mem_dir = mem.memory_dir
+        _make_hw_file(mem_dir, "b.hw", "b", "2026-01-02")
+        _make_hw_file(mem_dir, "a.hw", "a", "2026-01-02")
+        _make_hw_file(mem_dir, "c.hw", "c", "2026-01-01")
+        (mem_dir / "d.hw").write_text("no frontmatter\n")
+        idx = MemoryIndex(mem_dir)
+        assert [e.title for e in idx.recent(3)] == ["a", "b", "c"]
+        assert [e.title for e in idx.recent(10)] == ["a", "b", "c", "d"]
+    finally:
+        _restore()
+
+
 def test_memory_index_empty_dir():
     tmp = _use_tmp()
     try:
@@ -428,6 +612,88 @@ def test_memory_index_reads_md_files():
         _restore()
 
 
+# --- log storage ---
+
+
+def test_log_storage_keeps_the_same_api():
+    tmp = _use_tmp()
+    try:
+        mem = MemoryBus("claude", storage="log")
+        p1 = mem.store("severith prefers short messages", title="severith-style", tags=["human"])
+        p2 = mem.store("again", title="severith-style")
+        assert p1 != p2
+        assert list(mem.memory_dir.iterdir()) == []
+        assert (tmp / "claude" / "memory_log" / "segment-000001.log").exists()
+        assert "short messages" in mem.get(p1.name)
+        assert "again" in mem.get(str(p2))
+        assert [e.title for e in mem.index.by_tag("human")] == ["severith-style"]
+        assert mem.recall("severith short")[0].docid == p1.name
+    finally:
+        _restore()
+
+
+def test_log_storage_never_reuses_a_name():
+    _use_tmp()
+    try:
+        mem = MemoryBus("claude", storage="log")
+        other = MemoryBus("claude", storage="log")
+        paths = [mem.store("same", title="inbox-claude"), other.store("same", title="inbox-claude"),
+                 mem.store("same", title="inbox-claude")]
+        assert len({p.name for p in paths}) == 3
+        assert len(mem.index.titles()) == 3
+    finally:
+        _restore()
+
+
+def test_log_storage_indexes_catch_up_across_instances():
+    _use_tmp()
+    try:
+        reader = MemoryBus("claude", storage="log")
+        assert reader.index.all() == []
+        assert reader.recall("ciel") == []
+        MemoryBus("claude", storage="log").store("ciel likes drift", title="ciel-note")
+        assert reader.index.titles() == ["ciel-note"]
+        assert [r.title for r in reader.recall("ciel")] == ["ciel-note"]
+    finally:
+        _restore()
+
+
+def test_log_storage_exports_markdown():
+    _use_tmp()
+    try:
+        mem = MemoryBus("claude", storage="log")
+        path = mem.store("exported", title="to-disk", tags=["outbox"])
+        assert mem.export() == 1
+        assert path.read_text() == mem.get(path.name)
+        assert MemoryIndex(mem.memory_dir).titles() == ["to-disk"]
+        assert MemoryBus("claude").export() == 0
+    finally:
+        _restore()
+
+
+def test_qmd_recall_exports_log_first():
+    _use_tmp()
+    try:
+        mem = MemoryBus("claude", backend="qmd", storage="log")
+        mem._qmd_bin = "/usr/local/bin/qmd"
+        mem._collection_registered = True
+        path = mem.store("for qmd", title="qmd-note")
+        runs = [MagicMock(returncode=0), MagicMock(returncode=0, stdout="[]")]
+        with patch("memory_bus.subprocess.run", side_effect=runs):
+            mem.recall("qmd")
+        assert path.exists()
+    finally:
+        _restore()
+
+
+def test_invalid_storage():
+    try:
+        MemoryBus("claude", storage="tape")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "tape" in str(e)
+
+
 # --- MemoryBus.index property ---
 
 
@@ -464,6 +730,13 @@ if __name__ == "__main__":
     test_recall_with_mocked_qmd()
     test_recall_empty_results()
     test_recall_invalid_mode()
+    test_recall_local_ranks_by_bm25()
+    test_recall_local_sees_files_written_elsewhere()
+    test_store_keeps_index_in_step()
+    test_backend_from_env()
+    test_available_local_without_qmd()
+    test_local_without_fts5_still_stores()
+    test_store_survives_index_errors()
     test_available_when_qmd_missing()
     test_available_when_qmd_present()
     test_slugify()
@@ -482,8 +755,18 @@ if __name__ == "__main__":
     test_memory_index_by_title_glob()
     test_memory_index_recent()
     test_memory_index_refresh()
+    test_memory_index_rereads_only_changed_files()
+    test_indexes_see_in_place_edits_at_the_next_full_scan()
+    test_memory_index_follows_store()
+    test_memory_index_recent_ties_in_name_order()
     test_memory_index_empty_dir()
     test_memory_index_reads_md_files()
+    test_log_storage_keeps_the_same_api()
+    test_log_storage_never_reuses_a_name()
+    test_log_storage_indexes_catch_up_across_instances()
+    test_log_storage_exports_markdown()
+    test_qmd_recall_exports_log_first()
+    test_invalid_storage()
     test_memory_bus_index_property()
     test_memory_bus_index_lazy()
     print("All memory bus tests passed")
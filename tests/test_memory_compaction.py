@@ -0,0 +1,134 @@
+"""Tests for memory compaction — retention policies, per-sender digests, reclaimed bytes."""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import message_bus
+from memory_bus import MemoryBus
+from memory_compaction import MemoryCompactor, RetentionPolicy
+
+NOW = datetime(2026, 10, 18, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _runtimes(tmp_path, monkeypatch):
+    monkeypatch.setattr(message_bus, "BASE_DIR", tmp_path)
+
+
+def _remember(mem, name, created, tags, content):
+    """A memory with a chosen creation date, stored the way MemoryBus.store() lays it out."""
+    text = "\n".join(["---", f"title: {name}", f"created: {created}", "tags:"]
+                     + [f"  - {t}" for t in tags] + ["---", "", content, ""])
+    if mem.log is not None:
+        mem.log.append(f"{name}.md", text)
+    else:
+        (mem.memory_dir / f"{name}.md").write_text(text)
+
+
+def _names(mem):
+    return sorted(e.path.stem for e in mem.index.all())
+
+
+def _fill(mem):
+    _remember(mem, "old-gemini", "2026-10-01T09:00:00Z", ["ooda-r", "Gemini"], "Gemini asked about #fire")
+    _remember(mem, "old-codex", "2026-10-02T09:00:00Z", ["ooda-r", "Codex"], "Codex sent #patience")
+    _remember(mem, "new-gemini", "2026-10-17T09:00:00Z", ["ooda-r", "Gemini"], "Gemini asked about #water")
+    _remember(mem, "inbox-1", "2026-10-16T09:00:00Z", ["inbox", "Gemini"], "hello")
+    _remember(mem, "inbox-2", "2026-10-17T09:00:00Z", ["inbox", "Gemini"], "hello again")
+    _remember(mem, "note", "2026-01-01T09:00:00Z", ["note"], "keep me")
+
+
+POLICIES = [
+    RetentionPolicy("ooda-r", max_age_days=7),
+    RetentionPolicy("inbox", keep_last=1),
+]
+
+
+def test_plan_applies_age_and_count_limits():
+    mem = MemoryBus("claude")
+    _fill(mem)
+    _remember(mem, "old-digest", "2026-01-01T09:00:00Z", ["digest", "ooda-r", "Gemini"], "earlier")
+    plan = MemoryCompactor(mem, POLICIES, now=NOW).plan()
+    assert [(policy.tag, [e.path.stem for e in expired]) for policy, expired in plan] == [
+        ("ooda-r", ["old-gemini", "old-codex"]),
+        ("inbox", ["inbox-1"]),
+    ]
+    assert len(_names(mem)) == 7     # planning changes nothing
+
+
+def test_run_digests_per_sender_and_reports():
+    mem = MemoryBus("claude")
+    _fill(mem)
+    report = MemoryCompactor(mem, POLICIES, now=NOW).run()
+    assert report.entries_removed == 3
+    assert report.by_tag == {"ooda-r": 2, "inbox": 1}
+    assert report.digests_written == 3
+    assert report.bytes_removed > 0
+    assert report.to_dict()["bytes_reclaimed"] == report.bytes_removed - report.digest_bytes
+    names = _names(mem)
+    assert "old-gemini" not in names and "inbox-1" not in names
+    assert {"new-gemini", "inbox-2", "note"} <= set(names)
+    digests = mem.index.by_tag("digest", "ooda-r", "Gemini")
+    assert len(digests) == 1
+    assert "Gemini asked about #fire" in digests[0].content
+    assert [r.title for r in mem.recall("fire", mode="search")] == [digests[0].title]
+    # Digests are never compacted, so a second run has nothing to do
+    assert MemoryCompactor(mem, POLICIES, now=NOW).run().entries_removed == 0
+
+
+def test_digest_can_be_skipped():
+    mem = MemoryBus("claude")
+    _fill(mem)
+    report = MemoryCompactor(mem, [RetentionPolicy("ooda-r", max_age_days=7, digest=False)], now=NOW).run()
+    assert report.entries_removed == 2
+    assert report.digests_written == 0
+    assert report.bytes_reclaimed == report.bytes_removed
+    assert mem.index.by_tag("digest") == []
+
+
+class _Llm:
+    def __init__(self, fail=False):
+        self.prompts = []
+        self.fail = fail
+
+    def call(self, prompt, system=None):
+        self.prompts.append(prompt)
+        if self.fail:
+            raise RuntimeError("API down")
+        return "- Gemini keeps asking about #fire\n"
+
+
+def test_llm_writes_the_digest():
+    mem = MemoryBus("claude")
+    _fill(mem)
+    llm = _Llm()
+    MemoryCompactor(mem, [RetentionPolicy("ooda-r", max_age_days=7)], llm=llm, now=NOW).run()
+    assert len(llm.prompts) == 2
+    assert "Gemini asked about #fire" in llm.prompts[1]
+    digest = mem.index.by_tag("digest", "Gemini")[0]
+    assert "Gemini keeps asking about #fire" in digest.content
+
+
+def test_failed_llm_falls_back_to_extractive_digest():
+    mem = MemoryBus("claude")
+    _fill(mem)
+    MemoryCompactor(mem, [RetentionPolicy("ooda-r", max_age_days=7)], llm=_Llm(fail=True), now=NOW).run()
+    assert "Gemini asked about #fire" in mem.index.by_tag("digest", "Gemini")[0].content
+
+
+def test_log_storage_drops_and_vacuums():
+    mem = MemoryBus("claude", storage="log")
+    mem.log.segment_bytes = 1      # one record per segment, so removed ones leave whole segments
+    _fill(mem)
+    assert [r.title for r in mem.recall("fire", mode="search")] == ["old-gemini"]
+    report = MemoryCompactor(mem, POLICIES, now=NOW).run()
+    assert report.entries_removed == 3
+    assert report.bytes_vacuumed > 0
+    assert "old-gemini" not in _names(mem)
+    assert [r.title for r in mem.recall("fire", mode="search")] == [mem.index.by_tag("digest", "ooda-r", "Gemini")[0].title]
+    assert mem.get("new-gemini.md").endswith("Gemini asked about #water\n")
@@ -0,0 +1,128 @@
+"""Tests for the segmented memory log — append, read, roll, catch up, export, rebuild."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from memory_log import MemoryLog
+
+
+def test_append_and_read(tmp_path):
+    log = MemoryLog(tmp_path / "log")
+    assert log.append("a.md", "---\ntitle: a\n---\n\nfirst ✓\n") == 1
+    log.append("b.md", "second\n")
+    assert log.read("a.md") == "---\ntitle: a\n---\n\nfirst ✓\n"
+    assert log.read("b.md") == "second\n"
+    assert "a.md" in log and "c.md" not in log
+    assert len(log) == 2
+    with pytest.raises(FileNotFoundError):
+        log.read("c.md")
+
+
+def test_names_are_unique(tmp_path):
+    log = MemoryLog(tmp_path / "log")
+    log.append("a.md", "one")
+    with pytest.raises(ValueError):
+        log.append("a.md", "two")
+    with pytest.raises(ValueError):
+        log.append("has space.md", "three")
+    assert log.read("a.md") == "one"
+    assert len(log) == 1
+
+
+def test_append_unique_picks_a_free_name(tmp_path):
+    log = MemoryLog(tmp_path / "log")
+    other = MemoryLog(tmp_path / "log")
+    assert log.append_unique("a.md", "one") == (1, "a.md")
+    assert other.append_unique("a.md", "two") == (2, "a-2.md")
+    assert log.append_unique("a.md", "three") == (3, "a-3.md")
+    assert [log.read(n) for n in ("a.md", "a-2.md", "a-3.md")] == ["one", "two", "three"]
+
+
+def test_segments_roll_past_their_size(tmp_path):
+    log = MemoryLog(tmp_path / "log", segment_bytes=64)
+    for i in range(6):
+        log.append(f"m{i}.md", "x" * 40)
+    assert len(log.segments()) == 3
+    assert [log.read(f"m{i}.md") for i in range(6)] == ["x" * 40] * 6
+
+
+def test_since_returns_new_records_in_order(tmp_path):
+    log = MemoryLog(tmp_path / "log", segment_bytes=16)
+    for name in ("a.md", "b.md", "c.md"):
+        log.append(name, name.upper())
+    assert [(name, text) for _, name, text in log.since(0)] == [
+        ("a.md", "A.MD"), ("b.md", "B.MD"), ("c.md", "C.MD")]
+    assert [name for _, name, _ in log.since(2)] == ["c.md"]
+    assert log.last_seq() == 3
+
+
+def test_another_handle_sees_appends(tmp_path):
+    writer = MemoryLog(tmp_path / "log")
+    reader = MemoryLog(tmp_path / "log")
+    writer.append("a.md", "from another process")
+    assert reader.last_seq() == 1
+    assert reader.read("a.md") == "from another process"
+
+
+def test_export_writes_missing_files(tmp_path):
+    log = MemoryLog(tmp_path / "log")
+    log.append("a.md", "alpha\n")
+    log.append("b.md", "beta\n")
+    out = tmp_path / "memory"
+    out.mkdir()
+    (out / "a.md").write_text("edited by hand\n")
+    assert log.export(out) == 1
+    assert (out / "a.md").read_text() == "edited by hand\n"
+    assert (out / "b.md").read_text() == "beta\n"
+    assert log.export(out) == 0
+
+
+def test_rebuild_recovers_index_and_skips_torn_record(tmp_path):
+    log = MemoryLog(tmp_path / "log")
+    log.append("a.md", "alpha\n")
+    with open(log.segments()[0], "ab") as f:
+        f.write(b"@@ torn.md 500\nonly part of it")   # a crash mid-append
+    log.append("b.md", "beta\n")
+    (tmp_path / "log" / "index.db").unlink()
+    log.close()
+
+    fresh = MemoryLog(tmp_path / "log")
+    assert len(fresh) == 0
+    assert fresh.rebuild() == 2
+    assert fresh.read("a.md") == "alpha\n"
+    assert fresh.read("b.md") == "beta\n"
+    assert "torn.md" not in fresh
+
+
+def test_remove_bumps_generation(tmp_path):
+    log = MemoryLog(tmp_path / "log")
+    log.append("a.md", "one")
+    log.append("b.md", "three")
+    assert log.version() == (2, 0)
+    assert log.remove(["b.md", "missing.md"]) == 5
+    assert log.version() == (1, 1)
+    assert log.names() == {"a.md"}
+    with pytest.raises(FileNotFoundError):
+        log.read("b.md")
+
+
+def test_vacuum_moves_live_records(tmp_path):
+    log = MemoryLog(tmp_path / "log", segment_bytes=64)
+    for i in range(6):
+        log.append(f"m{i}.md", f"{i}" * 40)
+    log.remove(["m0.md", "m2.md", "m3.md"])
+    reader = log.since(0)
+    assert next(reader)[1] == "m1.md"
+    freed = log.vacuum()
+    assert freed > 0
+    # m1 and m4 moved to a new segment; m5 stays in the one still being filled
+    assert len(log.segments()) == 2
+    assert [name for _, name, _ in reader] == ["m4.md", "m5.md"]
+    assert [log.read(f"m{i}.md") for i in (1, 4, 5)] == ["1" * 40, "4" * 40, "5" * 40]
+    log.append("m6.md", "six")
+    assert log.read("m6.md") == "six"
+    assert log.vacuum() == 0
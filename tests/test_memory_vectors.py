@@ -0,0 +1,134 @@
+"""Tests for vector recall — hashing embedder, rank fusion, the mapped matrix, hybrid search."""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import memory_vectors
+from memory_bus import FullTextIndex, MemoryBus
+from memory_vectors import HashingEmbedder, fuse
+
+
+def _cosine(a, b):
+    return sum(x * y for x, y in zip(a, b))
+
+
+def _write(directory, name, title, content):
+    (directory / name).write_text(f"---\ntitle: {title}\n---\n\n{content}\n")
+
+
+def test_hashing_embedder_is_deterministic_and_normalized():
+    embedder = HashingEmbedder(dim=64)
+    first, again, empty = embedder.embed(["Severith prefers short messages", "severith  prefers short messages", "..."])
+    assert len(first) == 64
+    assert first == again
+    assert math.isclose(_cosine(first, first), 1.0, rel_tol=1e-9)
+    assert not any(empty)
+
+
+def test_hashing_embedder_scores_shared_wording():
+    query, near, far = HashingEmbedder().embed([
+        "how does severith like messages",
+        "severith likes short messages",
+        "the dispatcher batches collisions",
+    ])
+    assert _cosine(query, near) > _cosine(query, far)
+
+
+def test_fuse_rewards_agreement():
+    fused = fuse([["a", "b", "c"], ["b", "d"]])
+    assert [name for name, _ in fused] == ["b", "a", "d", "c"]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_recall_falls_back_to_bm25_without_numpy(tmp_path, monkeypatch):
+    monkeypatch.setattr(memory_vectors, "np", None)
+    memory = tmp_path / "memory"
+    memory.mkdir()
+    _write(memory, "a.md", "severith-style", "severith prefers short messages")
+    index = FullTextIndex(memory)
+    assert index.vectors is None
+    assert index.vector_search("severith") == []
+    assert [r.title for r in index.hybrid_search("severith")] == ["severith-style"]
+    assert index.embed() == 0
+
+
+class TestVectorMatrix:
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_top_k_orders_by_dot_product(self, tmp_path):
+        matrix = memory_vectors.VectorMatrix(tmp_path / "m.vec", dim=2)
+        assert matrix.top_k([1.0, 0.0], 3) == []
+        assert matrix.append([[1.0, 0.0], [0.0, 1.0]]) == 0
+        assert matrix.append([[0.6, 0.8]]) == 2
+        assert [row for row, _ in matrix.top_k([1.0, 0.0], 2)] == [0, 2]
+        assert matrix.top_k([0.0, 1.0], 1)[0] == (1, pytest.approx(1.0))
+
+    def test_sees_rows_appended_by_another_handle(self, tmp_path):
+        reader = memory_vectors.VectorMatrix(tmp_path / "m.vec", dim=2)
+        writer = memory_vectors.VectorMatrix(tmp_path / "m.vec", dim=2)
+        writer.append([[1.0, 0.0]])
+        assert reader.top_k([1.0, 0.0], 5) == [(0, 1.0)]
+        writer.append([[0.0, 1.0]])
+        assert [row for row, _ in reader.top_k([0.0, 1.0], 5)] == [1, 0]
+        writer.reset()
+        writer.append([[0.0, 1.0]])
+        assert reader.top_k([0.0, 1.0], 5) == [(0, 1.0)]
+
+
+class TestVectorRecall:
+    @pytest.fixture(autouse=True)
+    def _agent(self, tmp_path, monkeypatch):
+        pytest.importorskip("numpy")
+        import message_bus
+        monkeypatch.setattr(message_bus, "BASE_DIR", tmp_path)
+
+    def test_vsearch_ranks_by_embedding(self):
+        mem = MemoryBus("claude")
+        mem.store("severith likes short messages", title="severith-style")
+        mem.store("the dispatcher batches collisions", title="dispatch")
+        results = mem.recall("short messages from severith", mode="vsearch")
+        assert results[0].title == "severith-style"
+        assert 0 < results[0].score <= 1.0
+        assert "severith likes" in results[0].snippet
+
+    def test_hybrid_fuses_both_rankings(self):
+        mem = MemoryBus("claude")
+        mem.store("ciel writes long essays", title="ciel-style")
+        mem.store("severith likes short messages", title="severith-style")
+        results = mem.recall("severith messages")
+        assert results[0].title == "severith-style"
+        assert results[0].score == pytest.approx(2 / 61)
+
+    def test_deleted_memories_drop_out_until_rebuilt(self):
+        mem = MemoryBus("claude")
+        gone = mem.store("severith likes short messages", title="old")
+        mem.store("severith still likes short messages", title="new")
+        gone.unlink()
+        index = mem.full_text
+        index.sync()
+        assert [r.title for r in index.vector_search("severith messages")] == ["new"]
+        assert index.vectors.rows() == 2
+        assert index.embed(force=True) == 1
+        assert index.vectors.rows() == 1
+        assert [r.title for r in index.vector_search("severith messages")] == ["new"]
+
+    def test_changing_embedder_re_embeds(self):
+        class Constant:
+            name, dim = "constant-v1:3", 3
+
+            def embed(self, texts):
+                return [[1.0, 0.0, 0.0] for _ in texts]
+
+        MemoryBus("claude").store("severith likes short messages", title="severith-style")
+        mem = MemoryBus("claude", embedder=Constant())
+        index = mem.full_text
+        assert index.vectors.dim == 3
+        assert [r.title for r in mem.recall("anything at all", mode="vsearch")] == ["severith-style"]
+        assert index.vectors.rows() == 1
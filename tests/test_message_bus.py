@@ -126,6 +126,167 @@ def test_at_prefix_stripped():
         _restore()
 
 
+def test_message_ids_sort_in_send_order():
+    """Message ids lead with the send time, so names sort oldest first."""
+    _use_tmp()
+    try:
+        ids = [message_bus.send("A", "Claude", f"m{i}") for i in range(50)]
+        assert sorted(ids) == ids
+        assert all(message_bus._id_time(i) is not None for i in ids)
+    finally:
+        _restore()
+
+
+def test_file_drain_lists_inbox_once():
+    """Without a watcher, a backlog drains from one directory listing, in order."""
+    from unittest.mock import patch
+    tmp = _use_tmp()
+    try:
+        transport = message_bus.FileTransport(watch=False)
+        for i in range(300):
+            transport.send("A", "Claude", f"m{i}")
+
+        with patch.object(message_bus.os, "scandir", wraps=message_bus.os.scandir) as scandir:
+            received = []
+            while (msg := transport.receive("Claude")) is not None:
+                received.append(msg.content)
+        assert received == [f"m{i}" for i in range(300)]
+        assert scandir.call_count == 2   # the backlog, then the empty check
+        assert not list((tmp / "claude" / "inbox").iterdir())
+    finally:
+        _restore()
+
+
+def test_file_receive_orders_foreign_names_by_mtime():
+    """Files not named by _message_id() (written directly) still arrive in mtime order."""
+    import os
+    tmp = _use_tmp()
+    try:
+        transport = message_bus.FileTransport(watch=False)
+        sent = transport.send("A", "Claude", "sent")
+        older = tmp / "claude" / "inbox" / "msg-older.hw"
+        older.write_text("# From: B\n\nwritten directly\n")
+        stamp = message_bus._id_time(sent) - 10**9
+        os.utime(older, ns=(stamp, stamp))
+
+        assert transport.receive("Claude").content == "written directly"
+        assert transport.receive("Claude").content == "sent"
+        assert transport.receive("Claude") is None
+    finally:
+        _restore()
+
+
+def test_file_receive_skips_files_taken_by_another_reader():
+    """A listed file removed by someone else is skipped, not returned as an error."""
+    _use_tmp()
+    try:
+        transport = message_bus.FileTransport(watch=False)
+        other = message_bus.FileTransport(watch=False)
+        for content in ("first", "second", "third"):
+            transport.send("A", "Claude", content)
+
+        assert transport.receive("Claude").content == "first"   # lists all three
+        assert other.receive("Claude").content == "second"
+        assert transport.receive("Claude").content == "third"
+        assert transport.receive("Claude") is None
+    finally:
+        _restore()
+
+
+def test_file_watcher_picks_up_new_messages_without_listing():
+    """With inotify, an idle inbox sees new files from events alone."""
+    import pytest
+    from unittest.mock import patch
+    if message_bus._InboxWatcher.create() is None:
+        pytest.skip("inotify unavailable")
+    tmp = _use_tmp()
+    try:
+        transport = message_bus.FileTransport()
+        transport.send("A", "Claude", "before")
+        assert transport.receive("Claude").content == "before"
+
+        with patch.object(message_bus.os, "scandir", wraps=message_bus.os.scandir) as scandir:
+            assert transport.receive("Claude") is None
+            message_bus.FileTransport(watch=False).send("B", "Claude", "from elsewhere")
+            (tmp / "claude" / "inbox" / "msg-direct.hw").write_text("# From: C\n\ndirect write\n")
+            assert transport.receive("Claude").content == "from elsewhere"
+            assert transport.receive("Claude").content == "direct write"
+            assert transport.receive("Claude") is None
+        assert scandir.call_count == 0
+    finally:
+        _restore()
+
+
+def _send_later(transport, delay, content):
+    import threading
+    import time
+    timer = threading.Timer(delay, transport.send, ("A", "Claude", content))
+    timer.start()
+    return time.monotonic()
+
+
+def test_blocking_receive_wakes_on_send():
+    """receive(timeout=...) returns as soon as a message lands, not at the next poll."""
+    import time
+    _use_tmp()
+    try:
+        transport = message_bus.FileTransport()
+        # A second transport, as another process would: only the inbox itself signals
+        sender = message_bus.FileTransport(watch=False)
+        start = _send_later(sender, 0.1, "wake up")
+        msg = transport.receive("Claude", timeout=5)
+        assert msg.content == "wake up"
+        assert time.monotonic() - start < 1.0
+
+        start = _send_later(transport, 0.1, "same process")
+        msg = transport.receive("Claude", timeout=5)
+        assert msg.content == "same process"
+        assert time.monotonic() - start < 1.0
+    finally:
+        _restore()
+
+
+def test_blocking_receive_times_out_with_none():
+    import time
+    _use_tmp()
+    try:
+        start = time.monotonic()
+        assert message_bus.receive("Claude", timeout=0.2) is None
+        assert 0.2 <= time.monotonic() - start < 2.0
+    finally:
+        _restore()
+
+
+def test_areceive_awaits_a_message_without_blocking_the_loop():
+    """areceive() suspends the task; other coroutines keep running meanwhile."""
+    import asyncio
+    _use_tmp()
+    try:
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            waiter = asyncio.create_task(message_bus.areceive("Claude", timeout=5))
+            await asyncio.sleep(0.2)
+            message_bus.send("A", "Claude", "hello")
+            msg = await waiter
+            task.cancel()
+            return msg, ticks
+
+        msg, ticks = asyncio.run(scenario())
+        assert msg.content == "hello"
+        assert ticks >= 10
+        assert asyncio.run(message_bus.areceive("Claude")) is None
+    finally:
+        _restore()
+
+
 # ---------------------------------------------------------------------------
 # SQLiteTransport tests
 # ---------------------------------------------------------------------------
@@ -230,6 +391,184 @@ def test_sqlite_address_case_insensitive():
         assert msg.content == "test"
 
 
+def test_sqlite_send_many_and_receive_batch():
+    """send_many queues in order; receive_batch drains oldest first."""
+    with tempfile.TemporaryDirectory() as tmp:
+        t = message_bus.SQLiteTransport(db_path=str(Path(tmp) / "test.db"))
+        ids = t.send_many([("A", "claude", f"m{i}") for i in range(5)] + [("A", "gemini", "other")])
+        assert len(set(ids)) == 6
+        assert [m.content for m in t.receive_batch("claude", 3)] == ["m0", "m1", "m2"]
+        assert [m.content for m in t.receive_batch("@Claude", 10)] == ["m3", "m4"]
+        assert t.receive_batch("claude", 10) == []
+        assert t.receive("gemini").content == "other"
+
+
+def test_sqlite_concurrent_claims_deliver_each_message_once():
+    """Threads on one connection and a second connection never claim the same message."""
+    import threading
+    with tempfile.TemporaryDirectory() as tmp:
+        db = str(Path(tmp) / "test.db")
+        shared = message_bus.SQLiteTransport(db_path=db)
+        other = message_bus.SQLiteTransport(db_path=db)
+        shared.send_many([("A", "claude", f"m{i}") for i in range(2000)])
+        seen, lock = [], threading.Lock()
+
+        def drain(transport):
+            while True:
+                batch = transport.receive_batch("claude", 7)
+                if not batch:
+                    return
+                with lock:
+                    seen.extend(m.content for m in batch)
+
+        threads = [threading.Thread(target=drain, args=(t,)) for t in (shared, shared, other, other)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(seen) == sorted(f"m{i}" for i in range(2000))
+
+
+def test_sqlite_blocking_receive_wakes_on_send():
+    """A waiting SQLite receiver is woken by sends on its transport and by other connections."""
+    import time
+    with tempfile.TemporaryDirectory() as tmp:
+        db = str(Path(tmp) / "test.db")
+        t = message_bus.SQLiteTransport(db_path=db)
+        start = _send_later(t, 0.1, "local")
+        assert t.receive("claude", timeout=5).content == "local"
+        assert time.monotonic() - start < 1.0
+
+        start = _send_later(message_bus.SQLiteTransport(db_path=db), 0.1, "other connection")
+        assert t.receive("claude", timeout=5).content == "other connection"
+        assert time.monotonic() - start < 1.0
+        assert t.receive("claude", timeout=0.1) is None
+
+
+def test_sqlite_compacts_read_rows():
+    """Read rows are deleted after compact_every claims, and on demand."""
+    with tempfile.TemporaryDirectory() as tmp:
+        t = message_bus.SQLiteTransport(db_path=str(Path(tmp) / "test.db"), compact_every=4)
+        t.send_many([("A", "claude", f"m{i}") for i in range(6)] + [("A", "gemini", "g")])
+
+        def rows():
+            return t._conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+        t.receive_batch("claude", 3)
+        assert rows() == 7
+        t.receive("claude")
+        assert rows() == 3
+        t.receive("gemini")
+        assert t.compact() == 1
+        assert [m.content for m in t.receive_batch("claude", 5)] == ["m4", "m5"]
+
+
+def test_sqlite_claim_uses_inbox_index():
+    """The claim query seeks the (receiver, read, ts) index instead of scanning."""
+    with tempfile.TemporaryDirectory() as tmp:
+        t = message_bus.SQLiteTransport(db_path=str(Path(tmp) / "test.db"))
+        plan = t._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT rowid FROM messages WHERE receiver = ? AND read = 0 "
+            "ORDER BY ts, rowid LIMIT ?", ("claude", 1),
+        ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_messages_inbox" in details
+        assert "TEMP B-TREE" not in details
+
+
+# ---------------------------------------------------------------------------
+# MemoryTransport tests
+# ---------------------------------------------------------------------------
+
+def test_memory_send_and_receive_by_reference():
+    """MemoryTransport hands back the Message object it queued, in FIFO order."""
+    t = message_bus.MemoryTransport()
+    t.send("A", "@Claude", "first")
+    t.send("B", "claude", "second")
+    queued = t._inboxes["claude"][0][1]
+    assert t.pending("Claude") == 2
+    first = t.receive("Claude")
+    assert first is queued
+    assert (first.sender, first.content) == ("A", "first")
+    assert t.receive("claude").content == "second"
+    assert t.receive("claude") is None
+
+
+def test_memory_address_routing_and_batches():
+    t = message_bus.MemoryTransport()
+    t.send_many([("A", "claude@purdy", "one"), ("A", "claude", "two"), ("A", "claude@purdy", "three")])
+    assert [m.content for m in t.receive_batch("claude@purdy", 10)] == ["one", "three"]
+    assert [m.content for m in t.receive_batch("claude", 10)] == ["two"]
+
+
+def test_memory_blocking_receive_across_threads_and_tasks():
+    import asyncio
+    import time
+    t = message_bus.MemoryTransport()
+    start = _send_later(t, 0.05, "threaded")
+    assert t.receive("Claude", timeout=5).content == "threaded"
+    assert time.monotonic() - start < 1.0
+
+    async def scenario():
+        waiter = asyncio.create_task(t.areceive("Claude", timeout=5))
+        await asyncio.sleep(0.05)
+        t.send("A", "Claude", "awaited")
+        return await waiter
+
+    assert asyncio.run(scenario()).content == "awaited"
+    assert t.receive("Claude", timeout=0.05) is None
+
+
+def test_memory_transport_selected_by_env():
+    import os
+    from unittest.mock import patch
+    with patch.dict(os.environ, {"HW_TRANSPORT": "memory"}):
+        message_bus.reset_transport()
+        try:
+            assert isinstance(message_bus._get_transport(), message_bus.MemoryTransport)
+            message_bus.send("A", "Claude", "hi")
+            assert message_bus.receive("Claude").content == "hi"
+        finally:
+            message_bus.reset_transport()
+
+
+def test_memory_write_behind_log_restores_unread_messages():
+    """With a log, a new transport on the same file gets back only what was never read."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log = str(Path(tmp) / "bus.jsonl")
+        t = message_bus.MemoryTransport(log_path=log)
+        t.send("A", "claude", "read before restart")
+        t.send("B", "claude", "still queued")
+        t.send("C", "gemini", "other inbox")
+        assert t.receive("claude").content == "read before restart"
+        t.flush()
+
+        restored = message_bus.MemoryTransport(log_path=log)
+        assert restored.receive("claude").content == "still queued"
+        assert restored.receive("claude") is None
+        assert restored.receive("gemini").sender == "C"
+        restored.flush()
+        assert message_bus.MemoryTransport(log_path=log).pending("claude") == 0
+
+
+def test_memory_write_behind_log_compacts_in_process():
+    """Once read messages outnumber unread ones past compact_after, the log is rewritten."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "bus.jsonl"
+        t = message_bus.MemoryTransport(log_path=str(log), compact_after=10)
+        t.send("A", "gemini", "kept")
+        for i in range(50):
+            t.send("A", "claude", f"m{i}")
+            assert t.receive("claude").content == f"m{i}"
+        t.send("B", "claude", "after")
+        t.flush()
+        assert len(log.read_text().splitlines()) < 30
+        restored = message_bus.MemoryTransport(log_path=str(log))
+        assert restored.receive("gemini").content == "kept"
+        assert restored.receive("claude").content == "after"
+        assert restored.receive("claude") is None
+
+
 def test_file_address_routing():
     """FileTransport routes claude@purdy to a distinct inbox dir."""
     tmp = _use_tmp()
@@ -289,4 +628,12 @@ if __name__ == "__main__":
     test_default_is_file_transport()
     test_set_transport_overrides_default()
     test_reset_transport()
+    test_message_ids_sort_in_send_order()
+    test_file_drain_lists_inbox_once()
+    test_file_receive_orders_foreign_names_by_mtime()
+    test_file_receive_skips_files_taken_by_another_reader()
+    test_file_watcher_picks_up_new_messages_without_listing()
+    test_blocking_receive_wakes_on_send()
+    test_blocking_receive_times_out_with_none()
+    test_areceive_awaits_a_message_without_blocking_the_loop()
     print("All message bus tests passed")
@@ -347,6 +347,51 @@ def test_symbol_super_lookup_still_works():
     assert isinstance(nodes[0], SuperLookupNode)
 
 
+def _learned_receiver(n):
+    return "# Bot : Agent\n- A long-lived bot.\n" + "".join(
+        f"## sym{i}\n- (learned through dialogue)\n" for i in range(n)
+    )
+
+
+def test_incremental_parse_reparses_only_edited_sections():
+    """Edits to ## sections re-lex just those sections and match a full parse."""
+    from parser import IncrementalParser
+    incremental = IncrementalParser()
+    source = _learned_receiver(500)
+    assert incremental.parse(source) == parse(source)
+
+    edits = [
+        lambda s: s.replace("## sym250\n- (learned through dialogue)\n", "## sym250\n- Synthesized.\n"),
+        lambda s: s + "## fresh\n- New symbol.\n",
+        lambda s: s.replace("## sym10\n- (learned through dialogue)\n", ""),
+        lambda s: s.replace("## sym300\n", "## inserted\n- Between.\n\n## sym300\n"),
+    ]
+    for edit in edits:
+        source = edit(source)
+        assert incremental.parse(source) == parse(source)
+
+    assert incremental.full_parses == 1
+    assert incremental.sections_reparsed <= 2 * len(edits)
+
+
+def test_incremental_parse_falls_back_to_full_parse():
+    """Preamble edits and non-markdown sections are re-parsed in full, still correctly."""
+    from parser import IncrementalParser
+    incremental = IncrementalParser()
+    source = _learned_receiver(20)
+    incremental.parse(source)
+
+    source = source.replace("- A long-lived bot.", "- A renamed bot.")
+    assert incremental.parse(source) == parse(source)
+    assert incremental.full_parses == 2
+
+    source = source.replace("## sym5\n", "## sym5\n'an open string\n")
+    assert incremental.parse(source) == parse(source)
+    source = source.replace("## sym7\n", "## sym7\n- closed'\n")
+    assert incremental.parse(source) == parse(source)
+    assert incremental.full_parses == 4
+
+
 if __name__ == "__main__":
     test_vocabulary_definition()
     test_message_with_annotation()
@@ -365,4 +410,6 @@ if __name__ == "__main__":
     test_parse_markdown_and_smalltalk_mixed()
     test_parse_helloworld_hw()
     test_parse_html_comment_ignored()
+    test_incremental_parse_reparses_only_edited_sections()
+    test_incremental_parse_falls_back_to_full_parse()
     print("All parser tests passed")
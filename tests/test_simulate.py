@@ -186,6 +186,52 @@ def test_run_all_processes_multiple_agents():
     assert "across all agents" in output
 
 
+def test_run_all_reports_structured_counts():
+    """run_inboxes returns per-agent counts rather than text to re-parse."""
+    d = _fresh_dispatcher()
+    message_bus.send("Tester", "Claude", "one")
+    message_bus.send("Tester", "Claude", "two")
+    message_bus.send("Tester", "Codex", "three")
+    report = d.run_inboxes()
+    assert report.processed["Claude"] == 2
+    assert report.processed["Codex"] == 1
+    assert report.total == 3
+    assert "[Claude] Processed 2 message(s)." in report.render()
+
+
+def test_run_all_ends_when_agents_keep_answering_each_other():
+    """Replies made during a run wait for the next run instead of extending this one."""
+    d = _fresh_dispatcher()
+    d.run_scheduler.quantum = 1
+    message_bus.send("Gemini", "Claude", "ping")
+    message_bus.send("Claude", "Gemini", "pong")
+    report = d.run_inboxes()
+    assert report.processed["Claude"] >= 1 and report.processed["Gemini"] >= 1
+    assert report.total <= 4
+    # The replies are still queued for the next run
+    assert message_bus.receive("Claude") is not None
+
+
+def test_run_all_takes_only_collisions_from_helloworld_inbox():
+    """HelloWorld's turn resolves pending collisions and leaves its other mail queued."""
+    d = _fresh_dispatcher()
+    mock_llm = MagicMock()
+    mock_llm.call.return_value = "Both tides, one moon."
+    d.llm = mock_llm
+    message_bus.hello("Gemini")
+    d._send_collision_to_helloworld("c1", "Claude", "Copilot", "#tide")
+    d.pending_collision_symbols.add("#tide")
+
+    report = d.run_inboxes()
+    assert report.processed["HelloWorld"] == 1
+    assert "Collision resolved: Claude × Copilot on #tide" in "\n".join(report.lines["HelloWorld"])
+    assert d.pending_collisions.pending() == []
+    assert "#tide" not in d.pending_collision_symbols
+    hello = message_bus.receive("HelloWorld")
+    assert hello is not None and hello.sender == "Gemini" and "#hello" in hello.content
+    assert message_bus.receive("HelloWorld") is None
+
+
 def test_run_helloworld_symbol_means_all():
     """HelloWorld run: HelloWorld runs the root receiver."""
     d = _fresh_dispatcher()
@@ -200,6 +200,89 @@ def test_update_description_creates_file_if_missing():
     shutil.rmtree(test_dir)
 
 
+def test_repeated_reads_parse_file_once():
+    """Description, identity and parent reads share one cached parse."""
+    from unittest.mock import patch
+    from vocabulary import HwDocument
+
+    test_dir = "temp_vocab_test_cache"
+    os.makedirs(test_dir, exist_ok=True)
+    with open(os.path.join(test_dir, "Bot.hw"), "w") as f:
+        f.write("# Bot : Agent\n- A test bot.\n## spark\n- Ignites.\n## glow\n- Shines.\n")
+    vm = VocabularyManager(test_dir)
+
+    with patch.object(HwDocument, "from_source", wraps=HwDocument.from_source) as parse:
+        assert vm.load_description("Bot", "#spark") == "Ignites."
+        assert vm.load_description("Bot", "glow") == "Shines."
+        assert vm.load_identity("Bot") == "A test bot."
+        assert vm.load_parent("Bot") == "Agent"
+        assert vm.load("Bot") == {"#spark", "#glow"}
+        assert parse.call_count == 1
+
+    shutil.rmtree(test_dir)
+
+
+def test_cache_invalidated_by_update_description():
+    """update_description is visible to the next cached read."""
+    test_dir = "temp_vocab_test_cache_update"
+    vm = VocabularyManager(test_dir)
+    vm.save("Bot", {"#spark"}, descriptions={"#spark": "Old."})
+    assert vm.load_description("Bot", "#spark") == "Old."
+
+    vm.update_description("Bot", "#spark", "New.")
+
+    assert vm.load_description("Bot", "#spark") == "New."
+    shutil.rmtree(test_dir)
+
+
+def test_cache_picks_up_external_edits():
+    """Files edited outside the manager are re-parsed on the next read."""
+    test_dir = "temp_vocab_test_cache_external"
+    vm = VocabularyManager(test_dir)
+    vm.save("Bot", {"#spark"})
+    assert vm.load("Bot") == {"#spark"}
+
+    with open(os.path.join(test_dir, "Bot.hw"), "a") as f:
+        f.write("## ember\n- Smoulders.\n")
+
+    assert vm.load("Bot") == {"#spark", "#ember"}
+    assert vm.load_description("Bot", "#ember") == "Smoulders."
+    shutil.rmtree(test_dir)
+
+
+def test_load_returns_independent_sets():
+    """Mutating a loaded vocabulary does not leak into the cache."""
+    test_dir = "temp_vocab_test_cache_copy"
+    vm = VocabularyManager(test_dir)
+    vm.save("Bot", {"#spark"})
+
+    vm.load("Bot").add("#intruder")
+
+    assert vm.load("Bot") == {"#spark"}
+    shutil.rmtree(test_dir)
+
+
+def test_edited_file_is_reparsed_incrementally():
+    """After the first change, later edits to a cached file re-lex only their sections."""
+    test_dir = "temp_vocab_test_incremental"
+    vm = VocabularyManager(test_dir)
+    symbols = {f"#sym{i}" for i in range(300)}
+    vm.save("Bot", symbols)
+    assert vm.load("Bot") == symbols
+
+    vm.update_description("Bot", "#sym100", "First synthesis.")
+    vm.update_description("Bot", "#sym200", "Second synthesis.")
+    vm.save("Bot", symbols | {"#fresh"})
+
+    assert vm.load_description("Bot", "#sym100") == "First synthesis."
+    assert vm.load_description("Bot", "#sym200") == "Second synthesis."
+    assert vm.load("Bot") == symbols | {"#fresh"}
+    parser = vm._parsers[vm._get_path("Bot")]
+    assert parser.full_parses == 1
+    assert parser.sections_reparsed <= 4
+    shutil.rmtree(test_dir)
+
+
 if __name__ == "__main__":
     test_save_load()
     test_load_nonexistent()
@@ -210,4 +293,9 @@ if __name__ == "__main__":
     test_update_description_appends_if_absent()
     test_update_description_preserves_other_content()
     test_update_description_creates_file_if_missing()
+    test_repeated_reads_parse_file_once()
+    test_cache_invalidated_by_update_description()
+    test_cache_picks_up_external_edits()
+    test_load_returns_independent_sets()
+    test_edited_file_is_reparsed_incrementally()
     print("Vocabulary tests passed")
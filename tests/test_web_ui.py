@@ -87,6 +87,16 @@ def test_event_bus_multiple_subscribers():
     assert len(q2) == 1
 
 
+def test_event_bus_wait_wakes_on_publish():
+    import threading
+    bus = EventBus()
+    q = bus.subscribe()
+    assert bus.wait(q, timeout=0.05) is False
+    threading.Timer(0.05, bus.publish, ("msg", {"data": 1})).start()
+    assert bus.wait(q, timeout=5) is True
+    assert q[0][0] == "msg"
+
+
 # ------------------------------------------------------------------
 # API endpoints
 # ------------------------------------------------------------------
@@ -114,6 +124,35 @@ def test_api_collisions(ui_server):
     assert isinstance(data["collisions"], list)
 
 
+def test_api_collisions_filters_and_follows(ui_server, tmp_path):
+    url, ui = ui_server
+    ui.dispatcher.log_file = str(tmp_path / "collisions.log")
+    store = ui.dispatcher.collisions
+    first = store.record("unknown", "WebA", "#webOnly", line="[t] UNKNOWN: WebA encountered #webOnly")
+    data = _get(url, "/api/collisions?symbol=%23webOnly")
+    assert data["count"] == 1
+    assert data["events"][0]["receiver"] == "WebA"
+    assert data["last_id"] == first
+
+    import threading
+    threading.Timer(0.05, store.record, ("unknown", "WebB", "#webNext"),
+                    {"line": "[t] UNKNOWN: WebB encountered #webNext"}).start()
+    data = _get(url, f"/api/collisions?after={first}&wait=5")
+    assert [e["symbol"] for e in data["events"]] == ["#webNext"]
+
+
+def test_long_poll_does_not_block_other_requests(ui_server):
+    url, ui = ui_server
+    after = ui.dispatcher.collisions.last_id()
+    poll = threading.Thread(target=_get, args=(url, f"/api/collisions?after={after}&wait=2"))
+    poll.start()
+    time.sleep(0.1)
+    started = time.monotonic()
+    assert "receivers" in _get(url, "/api/receivers")
+    assert time.monotonic() - started < 1.0
+    poll.join()
+
+
 def test_api_agents_empty(ui_server):
     url, _ = ui_server
     data = _get(url, "/api/agents")